@@ -0,0 +1,48 @@
+"""Compares WebDriver round trips per click for the old find-then-find helpers and the ElementHandle ones.
+
+Run with: pytest benchmarks/bench_clicks.py -s
+"""
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from pages.main_navigation_menu_page import NavigationPage
+
+SCROLL_JS = "arguments[0].scrollIntoView({block:'center', inline:'center'});"
+
+
+def _legacy_click_when_clickable(driver, locator):
+    """The old _click_when_clickable: wait for presence, find again, JS click."""
+    WebDriverWait(driver, 10).until(EC.presence_of_element_located(locator))
+    el = driver.find_element(*locator)
+    driver.execute_script("arguments[0].click();", el)
+
+
+def _legacy_scroll_and_click(driver, locator):
+    """The old _scroll_and_click: presence wait, _scroll_into_view (another wait), then _click_when_clickable."""
+    WebDriverWait(driver, 10).until(EC.presence_of_element_located(locator))
+    el = WebDriverWait(driver, 10).until(EC.presence_of_element_located(locator))
+    driver.execute_script(SCROLL_JS, el)
+    _legacy_click_when_clickable(driver, locator)
+
+
+def test_click_round_trips(driver, command_counter):
+    """Opens and closes the currency dropdown with each helper and prints commands per click."""
+    nav = NavigationPage(driver)
+    nav.open_home()
+    toggle = nav.CURRENCY_TOGGLE
+
+    results = {}
+    for name, legacy, current in (
+        ("click_when_clickable", _legacy_click_when_clickable, nav._click_when_clickable),
+        ("scroll_and_click", _legacy_scroll_and_click, nav._scroll_and_click),
+    ):
+        with command_counter() as before:
+            legacy(driver, toggle)
+        with command_counter() as after:
+            current(toggle)
+        results[name] = (before.count, after.count)
+
+    print()
+    for name, (before, after) in results.items():
+        print(f"{name}: {before} round trips before, {after} after")
+    assert all(after < before for before, after in results.values())
+    assert results["scroll_and_click"][1] == 2
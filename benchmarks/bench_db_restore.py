@@ -0,0 +1,48 @@
+"""Compares putting the database back after a test by table diffs and by delete-and-reload.
+
+Needs the store database (OPENCART_DB_* / .env), typically a local MySQL/MariaDB.
+Run with: pytest benchmarks/bench_db_restore.py -s
+"""
+from utils.data_seeder import namespaced_email
+from utils.db_snapshot import STRATEGIES, DbSnapshot
+from utils.db_utils import get_db
+
+IMAC_ID = 41
+MACBOOK_AIR_ID = 44
+ROUNDS = 20
+
+
+def _dirty(seeder, customer):
+    """What a checkout test leaves behind: a saved cart, an order and a login attempt."""
+    seeder.fill_cart(customer, {IMAC_ID: 1, MACBOOK_AIR_ID: 2})
+    seeder.create_order(customer, {MACBOOK_AIR_ID: 1})
+    get_db().execute(
+        "INSERT INTO {prefix}customer_login (email, ip, total, date_added, date_modified) "
+        "VALUES (%s, '127.0.0.1', 1, NOW(), NOW())",
+        (customer.email,),
+    )
+
+
+def test_db_restore_strategies(seeder, seeded_customer, worker):
+    """Restores ROUNDS dirtied states with each strategy and prints the mean time per restore."""
+    pattern = namespaced_email(worker.namespace, "%")
+
+    def orders() -> int:
+        return get_db().query(
+            "SELECT COUNT(*) AS n FROM `{prefix}order` WHERE email = %s", (seeded_customer.email,)
+        )[0]["n"]
+
+    baseline_orders = orders()
+    seconds = {}
+    for strategy in STRATEGIES:
+        snapshot = DbSnapshot(get_db(), pattern=pattern, strategy=strategy, keep=seeder.seeded_keys)
+        snapshot.record()
+        for _ in range(ROUNDS):
+            _dirty(seeder, seeded_customer)
+            snapshot.restore()
+        seconds[strategy] = snapshot.seconds / ROUNDS
+        assert orders() == baseline_orders
+
+    print()
+    for name, mean in seconds.items():
+        print(f"{name:>6}: {mean * 1000:7.1f} ms per restore")
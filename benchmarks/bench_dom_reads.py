@@ -0,0 +1,29 @@
+"""Compares WebDriver round trips for per-element reads against one batched query_all call.
+
+Run with: pytest benchmarks/bench_dom_reads.py -s
+"""
+from pages.main_navigation_menu_page import NavigationPage
+
+
+def _legacy_elements_text(driver, locator):
+    """The old get_elements_text: one findElements plus two getText calls per element."""
+    elements = driver.find_elements(*locator)
+    return [el.text.strip() for el in elements if (el.text or "").strip()]
+
+
+def test_price_list_round_trips(driver, command_counter):
+    """Reads every price on the home page both ways and prints the round-trip counts."""
+    nav = NavigationPage(driver)
+    nav.open_home()
+
+    with command_counter() as legacy:
+        legacy_texts = _legacy_elements_text(driver, nav.PRICE_TEXT)
+    with command_counter() as batched:
+        batched_texts = nav.get_elements_text(nav.PRICE_TEXT)
+
+    print(
+        f"\n{len(batched_texts)} prices: per-element reads = {legacy.count} round trips, "
+        f"batched query_all = {batched.count} round trip(s)"
+    )
+    assert batched_texts == legacy_texts
+    assert batched.count == 1
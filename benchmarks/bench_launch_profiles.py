@@ -0,0 +1,38 @@
+"""Compares Chrome startup time and per-navigation time for each launch profile.
+
+Run with: pytest benchmarks/bench_launch_profiles.py -s
+"""
+import time
+from pages.main_navigation_menu_page import NavigationPage, Urls
+from utils.browser_profiles import PROFILES
+
+NAVIGATIONS = 5
+
+
+def _measure(profile):
+    """Returns (startup seconds, mean seconds per home/account navigation until network idle)."""
+    start = time.perf_counter()
+    driver = profile.launch()
+    startup = time.perf_counter() - start
+    try:
+        nav = NavigationPage(driver)
+        nav.open_home()  # first load warms the cache, same as a test's first page
+        start = time.perf_counter()
+        for _ in range(NAVIGATIONS):
+            nav.open_home()
+            driver.get(Urls().account)
+            nav.wait_for_network_idle()
+        per_navigation = (time.perf_counter() - start) / (NAVIGATIONS * 2)
+    finally:
+        driver.quit()
+    return startup, per_navigation
+
+
+def test_launch_profiles():
+    """Launches each profile once and prints startup and navigation times side by side."""
+    results = {name: _measure(profile) for name, profile in PROFILES.items()}
+
+    print()
+    for name, (startup, per_navigation) in results.items():
+        print(f"{name:>6}: startup {startup:.2f}s, {per_navigation * 1000:.0f} ms per navigation")
+    assert results["fast"][1] <= results["full"][1]
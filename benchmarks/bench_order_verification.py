@@ -0,0 +1,26 @@
+"""Compares the time to confirm one order through the DB, over HTTP, and through the order history UI.
+
+Run with: pytest benchmarks/bench_order_verification.py -s
+"""
+import time
+from utils.order_verifier import LEVELS, OrderVerifier
+
+MACBOOK_AIR_ID = 44
+
+
+def test_order_verification_levels(driver, logged_in, seeder, seeded_customer):
+    """Seeds one order, reads it back at every level and prints the time each took."""
+    order_id = seeder.create_order(seeded_customer, {MACBOOK_AIR_ID: 1})
+
+    records, seconds = {}, {}
+    for level in LEVELS:
+        verifier = OrderVerifier(driver, seeded_customer.email, level)
+        start = time.perf_counter()
+        records[level] = verifier.wait_for_new_order(order_id - 1)
+        seconds[level] = time.perf_counter() - start
+
+    print()
+    for level in LEVELS:
+        print(f"{level:>4}: {seconds[level] * 1000:.0f} ms  {records[level]}")
+    assert all(r.order_id == order_id and "MacBook Air" in r for r in records.values())
+    assert seconds["db"] < seconds["ui"]
@@ -0,0 +1,28 @@
+import pytest
+from utils.command_hooks import add_command_listener, remove_command_listener
+
+
+class CommandCounter:
+    """Counts WebDriver commands (HTTP round trips to chromedriver) sent by a driver."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.count = 0
+
+    def _on_command(self, command, params, seconds):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        add_command_listener(self.driver, self._on_command)
+        return self
+
+    def __exit__(self, *exc):
+        remove_command_listener(self.driver, self._on_command)
+        return False
+
+
+@pytest.fixture
+def command_counter(driver):
+    """Returns a factory: `with command_counter() as c: ...` then read `c.count`."""
+    return lambda: CommandCounter(driver)
@@ -1,29 +1,478 @@
+import html
+import json
 import logging
 import os
+import re
 import pytest
-from selenium import webdriver
 from pytest_html import extras as pytest_html_extras
+from pages.checkout_page import CheckoutPage
+from pages.login_page import LoginPage
+from utils.base_page import wait_stats
+from utils.browser_profiles import PROFILES, profile_for
+from utils.command_profiler import chattiest, command_profiler, percentile
+from utils.data_seeder import DataSeeder, namespaced_email
+from utils.db_snapshot import STRATEGIES as RESTORE_STRATEGIES, DbSnapshot
+from utils.db_utils import close_db, get_db, reset_login_attempts
+from utils.driver_pool import DriverPool
+from utils.http_cart import HttpCart
+from utils.http_driver import HttpDriver
+from utils.network_layer import DEFAULT_CACHE_ROOT, NetworkLayer
+from utils.order_verifier import LEVELS as ORDER_LEVELS, OrderVerifier
+from utils.duration_scheduling import DurationHistory, DurationScheduling
+from utils.screenshots import screenshot_writer
+from utils.session_cache import AuthSessionCache
+from utils.step_timing import step_recorder
+from utils.store_session import StoreSession
+from utils.worker_identity import AccountPool, WorkerIdentity
+
+
+SESSION_STATS = pytest.StashKey[dict]()
+DURATION_HISTORY = pytest.StashKey[DurationHistory]()
+SEEDED_CUSTOMERS = 2
+
+
+def _session_stats(config) -> dict:
+    """Per-process counters reported at session end (merged from xdist workers on the controller)."""
+    return config.stash.setdefault(SESSION_STATS, {})
+
+
+def _merge_stats(target: dict, source: dict) -> None:
+    """Adds counters from `source` into `target`; nested dicts are merged key by key."""
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _merge_stats(target.setdefault(key, {}), value)
+        else:
+            target[key] = target.get(key, 0) + value
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--driver-pool",
+        action="store_true",
+        default=False,
+        help="Reuse warm browsers across tests (one per xdist worker) instead of launching one per test.",
+    )
+    parser.addoption(
+        "--browser-profile",
+        choices=("auto",) + tuple(PROFILES),
+        default="full",
+        help="Chrome launch profile: full (headed, everything rendered), fast (headless, no images/fonts/"
+             "third-party requests, eager page load), or auto (full for `ui` tests, fast for the rest).",
+    )
+    parser.addoption(
+        "--headless",
+        action="store_true",
+        default=False,
+        help="Run every profile headless (for CI runners without a display).",
+    )
+    parser.addoption(
+        "--browser-only",
+        action="store_true",
+        default=False,
+        help="Run `no_js` tests in Chrome too instead of on the browserless HTTP driver.",
+    )
+    parser.addoption(
+        "--network-layer",
+        action="store_true",
+        default=False,
+        help="Block analytics (and images outside `ui` tests) via CDP, keep a disk cache of static "
+             "assets for the session, and report the bytes saved.",
+    )
+    parser.addoption(
+        "--block-url",
+        action="append",
+        default=[],
+        help="Extra URL pattern to block with --network-layer (CDP wildcard syntax, repeatable).",
+    )
+    parser.addoption(
+        "--static-cache-dir",
+        default=DEFAULT_CACHE_ROOT,
+        help="Root of the Chrome disk caches used by --network-layer "
+             "(one subdirectory per worker and launch profile).",
+    )
+    parser.addoption(
+        "--order-level",
+        choices=ORDER_LEVELS,
+        default="db",
+        help="How order_verifier confirms orders: db (order tables), http (account pages over HTTP) or ui.",
+    )
+    parser.addoption(
+        "--schedule-by-duration",
+        action="store_true",
+        default=False,
+        help="With -n, hand out the historically longest tests first (keeps each class together when it fits).",
+    )
+    parser.addoption(
+        "--step-traces",
+        action="store_true",
+        default=False,
+        help="Write a folded-stack flame-graph trace of page-object steps per test to reports/traces/.",
+    )
+    parser.addoption(
+        "--profile-commands",
+        action="store_true",
+        default=False,
+        help="Count WebDriver commands per test and page-object method; writes reports/command_profile.json.",
+    )
+    parser.addoption(
+        "--screenshot-format",
+        choices=("png", "jpeg", "webp"),
+        default="png",
+        help="Image format for stored screenshots (jpeg/webp need Pillow).",
+    )
+    parser.addoption(
+        "--screenshot-quality",
+        type=int,
+        default=80,
+        help="Quality (1-100) for jpeg/webp screenshots.",
+    )
+    parser.addoption(
+        "--screenshot-max-width",
+        type=int,
+        default=None,
+        help="Downscale screenshots wider than this many pixels (needs Pillow).",
+    )
+    parser.addoption(
+        "--db-restore",
+        choices=RESTORE_STRATEGIES,
+        default="diff",
+        help="How db_isolation tests put the database back: table diffs (default) or delete-and-reload.",
+    )
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    pool = DriverPool(lambda profile: profile.launch())
+    yield pool
+    pool.close()
+    _merge_stats(_session_stats(request.config), {"driver_pool": pool.stats()})
+
+
+@pytest.fixture(scope="session")
+def network_layer(request, worker):
+    config = request.config
+    layer = NetworkLayer(
+        os.path.join(config.getoption("--static-cache-dir"), worker.worker_id),
+        extra_blocked=config.getoption("--block-url"),
+    )
+    yield layer
+    _merge_stats(_session_stats(config), {"network": layer.stats()})
 
 
 @pytest.fixture(scope="function")
-def driver():
-    from selenium.webdriver.chrome.options import Options
-
-    options = Options()
-    options.add_argument("--start-maximized")
-    prefs = {
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False,
-        "autofill.profile_enabled": False,
-        "autofill.credit_card_enabled": False
-    }
-    options.add_experimental_option("prefs", prefs)
-
-    driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(10)
+def driver(request):
+    config = request.config
+    if request.node.get_closest_marker("no_js") and not config.getoption("--browser-only"):
+        driver = HttpDriver()
+        if config.getoption("--profile-commands"):
+            command_profiler.watch(driver)
+        yield driver
+        driver.quit()
+        return
+
+    launch_profile = profile_for(request.node, config.getoption("--browser-profile"), config.getoption("--headless"))
+    network = request.getfixturevalue("network_layer") if config.getoption("--network-layer") else None
+    if network:
+        launch_profile = network.configure(launch_profile)
+
+    pool = request.getfixturevalue("driver_pool") if config.getoption("--driver-pool") else None
+    driver = pool.acquire(launch_profile) if pool else launch_profile.launch()
+    if config.getoption("--profile-commands"):
+        command_profiler.watch(driver)
+    if network:
+        network.start(driver, block_images=request.node.get_closest_marker("ui") is None)
+
     yield driver
-    driver.quit()
 
+    if network:
+        network.collect(driver)
+    if pool:
+        pool.release(driver)
+    else:
+        driver.quit()
+
+
+@pytest.fixture(scope="session")
+def session_cache():
+    return AuthSessionCache()
+
+
+@pytest.fixture
+def user_credentials(seeded_customer):
+    """Email/password of the account used by LoginPage-dependent tests (one account per xdist worker)."""
+    return seeded_customer.email, seeded_customer.password
+
+
+@pytest.fixture
+def logged_in(driver, request, session_cache, user_credentials):
+    """Logs the test user in, reusing the worker's cached session when it is still valid.
+
+    Tests marked `ui_login` always go through the login form."""
+    email, password = user_credentials
+    use_cache = request.node.get_closest_marker("ui_login") is None
+
+    if use_cache and session_cache.restore(driver, email):
+        return driver
+
+    reset_login_attempts(email)
+    login_page = LoginPage(driver).open()
+    login_page.login(email, password)
+    if login_page.wait_for_dashboard() and use_cache:
+        session_cache.store(driver, email)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def worker():
+    """Identity of this xdist worker; scopes accounts, emails and carts to it."""
+    return WorkerIdentity.current()
+
+
+@pytest.fixture(scope="session")
+def seeder(worker):
+    """Per-worker test data written straight to the database; purged again at session end."""
+    seeder = DataSeeder(get_db(), namespace=worker.namespace)
+    seeder.purge()
+    seeder.seed_customers(SEEDED_CUSTOMERS)
+    yield seeder
+    seeder.purge()
+
+
+@pytest.fixture(scope="session")
+def account_pool(seeder):
+    return AccountPool(seeder)
+
+
+@pytest.fixture(scope="session")
+def seeded_customer(account_pool):
+    """The worker's primary account (with a default address); no other worker logs in with it."""
+    return account_pool.primary
+
+
+@pytest.fixture
+def disposable_account(account_pool):
+    """An account leased to a single test, for flows that lock out or modify the account."""
+    customer = account_pool.lease()
+    yield customer
+    account_pool.release(customer)
+
+
+@pytest.fixture(scope="session")
+def db_snapshot(request, worker, seeder):
+    """Baseline of this worker's rows in the tables the suite writes, taken once seeding is done."""
+    snapshot = DbSnapshot(
+        get_db(),
+        pattern=namespaced_email(worker.namespace, "%"),
+        strategy=request.config.getoption("--db-restore"),
+        keep=seeder.seeded_keys,
+    )
+    snapshot.record()
+    yield snapshot
+    _merge_stats(_session_stats(request.config), {"db_restore": snapshot.stats()})
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _db_isolation_module():
+    """Restores the database once the module ends when its tests asked for db_isolation(scope="module")."""
+    pending = []
+    yield pending
+    if pending:
+        pending[0].restore()
+
+
+@pytest.fixture(autouse=True)
+def _db_isolation(request, _db_isolation_module):
+    """Opt-in via @pytest.mark.db_isolation: puts the database back to the session baseline after the test."""
+    marker = request.node.get_closest_marker("db_isolation")
+    if marker is None:
+        yield
+        return
+    scope = marker.kwargs.get("scope", "function")
+    if scope not in ("function", "module"):
+        raise pytest.UsageError(f"db_isolation scope must be 'function' or 'module', not {scope!r}")
+    snapshot = request.getfixturevalue("db_snapshot")
+    yield
+    if scope == "module":
+        _db_isolation_module[:] = [snapshot]
+    else:
+        snapshot.restore()
+
+
+@pytest.fixture
+def unique_email(worker):
+    """Factory: unique_email("label") returns a fresh address in this worker's namespace."""
+    return worker.email
+
+
+@pytest.fixture
+def seeded_cart(seeder, seeded_customer):
+    """Factory: seeded_cart({product_id: quantity}) fills the seeded customer's cart without the UI."""
+    yield lambda items: seeder.fill_cart(seeded_customer, items)
+    seeder.clear_cart(seeded_customer)
+
+
+@pytest.fixture
+def http_cart(driver):
+    """Adds products through checkout/cart.add on the browser's own session (no product-page UI)."""
+    return HttpCart(StoreSession(driver))
+
+
+@pytest.fixture
+def order_verifier(request, driver, seeded_customer):
+    """Confirms the seeded customer's orders at the --order-level (an `order_level` marker wins)."""
+    marker = request.node.get_closest_marker("order_level")
+    level = marker.args[0] if marker else request.config.getoption("--order-level")
+    return OrderVerifier(driver, seeded_customer.email, level)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption("--schedule-by-duration"):
+        return DurationScheduling(config, log, config.stash[DURATION_HISTORY])
+    return None
+
+
+def pytest_sessionfinish(session):
+    screenshot_writer.flush()
+    close_db()
+    if DURATION_HISTORY in session.config.stash:
+        session.config.stash[DURATION_HISTORY].save(session.config)
+    stats = _session_stats(session.config)
+    _merge_stats(stats, {
+        "waits": wait_stats.as_dict(),
+        "screenshots": screenshot_writer.stats(),
+        "steps": step_recorder.summary,
+        "webdriver": command_profiler.stats(),
+    })
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["session_stats"] = stats
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    worker_stats = getattr(node, "workeroutput", {}).get("session_stats")
+    if worker_stats:
+        _merge_stats(_session_stats(node.config), worker_stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = config.stash.get(SESSION_STATS, {})
+
+    pool = stats.get("driver_pool")
+    if pool:
+        terminalreporter.write_sep("-", "driver pool")
+        terminalreporter.write_line(f"Browser reuse: {pool['hits']} hits, {pool['misses']} misses")
+
+    shots = stats.get("screenshots")
+    if shots and shots["captures"]:
+        terminalreporter.write_sep("-", "screenshots")
+        terminalreporter.write_line(
+            f"{shots['captures']} captured ({shots['duplicates']} deduplicated), "
+            f"{shots['capture_seconds']:.2f}s in test critical path, "
+            f"{shots['write_errors']} write errors"
+        )
+
+    network = stats.get("network")
+    if network and network["requests"]:
+        saved = network["cache_bytes"] + network["blocked_bytes"]
+        terminalreporter.write_sep("-", "network")
+        terminalreporter.write_line(
+            f"{network['requests']} requests, {network['downloaded_bytes'] / 1e6:.1f} MB downloaded; "
+            f"{network['cache_hits']} served from the disk cache, {network['blocked']} blocked; "
+            f"~{saved / 1e6:.1f} MB saved"
+        )
+
+    waits = stats.get("waits")
+    if waits and waits["timeouts"]:
+        terminalreporter.write_sep("-", "wait report")
+        terminalreporter.write_line(
+            f"{waits['timeouts']} waits timed out, "
+            f"{waits['seconds']:.1f}s spent waiting for elements that never appeared"
+        )
+        slowest = sorted(waits["by_caller"].items(), key=lambda kv: kv[1]["seconds"], reverse=True)
+        for caller, entry in slowest[:10]:
+            terminalreporter.write_line(f"  {entry['seconds']:7.1f}s  {entry['count']:3d}x  {caller}")
+
+    restore = stats.get("db_restore")
+    if restore and restore["restores"]:
+        terminalreporter.write_sep("-", "db restore")
+        terminalreporter.write_line(
+            f"{restore['restores']} restores in {restore['seconds']:.2f}s "
+            f"({restore['seconds'] / restore['restores'] * 1000:.0f} ms each); "
+            f"{restore['rows_deleted']} rows deleted, {restore['rows_restored']} restored, "
+            f"{restore['tables_skipped']} unchanged tables skipped"
+        )
+
+    steps = stats.get("steps") or {}
+    if steps.get("CheckoutPage.complete_saved_address_checkout_flow"):
+        _write_checkout_savings(terminalreporter, steps)
+
+    webdriver_stats = stats.get("webdriver")
+    if webdriver_stats and webdriver_stats["commands"]:
+        _write_command_profile(terminalreporter, webdriver_stats, stats.get("steps"))
+
+
+def _write_checkout_savings(terminalreporter, steps: dict) -> None:
+    """Prints the address steps of both checkout flows side by side and the time the saved-address flow saved."""
+    def mean(name: str) -> float:
+        entry = steps.get(name)
+        return entry["seconds"] / entry["calls"] if entry and entry["calls"] else 0.0
+
+    fast_checkouts = steps["CheckoutPage.complete_saved_address_checkout_flow"]["calls"]
+    terminalreporter.write_sep("-", "checkout fast path")
+    terminalreporter.write_line(f"  {'mean':>8}  step")
+    for name in CheckoutPage.NEW_ADDRESS_STEPS + CheckoutPage.SAVED_ADDRESS_STEPS:
+        terminalreporter.write_line(f"  {mean(name) * 1000:6.0f}ms  {name}")
+
+    per_checkout = sum(mean(n) for n in CheckoutPage.NEW_ADDRESS_STEPS) - sum(
+        mean(n) for n in CheckoutPage.SAVED_ADDRESS_STEPS
+    )
+    if steps.get(CheckoutPage.NEW_ADDRESS_STEPS[-1]):
+        terminalreporter.write_line(
+            f"Saved-address checkout: {per_checkout:.2f}s saved per checkout, "
+            f"~{per_checkout * fast_checkouts:.1f}s over {fast_checkouts} checkouts"
+        )
+    else:
+        terminalreporter.write_line(f"{fast_checkouts} saved-address checkouts (no new-address run to compare with)")
+
+
+def _write_command_profile(terminalreporter, profile: dict, steps=None) -> None:
+    """Prints command counts/latency and the chattiest page-object methods; saves the full profile."""
+    commands = profile["commands"]
+    total = sum(entry["count"] for entry in commands.values())
+    terminalreporter.write_sep("-", "webdriver commands")
+    terminalreporter.write_line(
+        f"{total} commands in {len(profile['by_test'])} tests "
+        f"({total / max(len(profile['by_test']), 1):.0f} per test)"
+    )
+    terminalreporter.write_line(f"  {'count':>6}  {'p50':>6}  {'p90':>6}  {'p99':>6}  command (latency ms)")
+    for label, entry in sorted(commands.items(), key=lambda kv: kv[1]["count"], reverse=True):
+        p50, p90, p99 = (percentile(entry["buckets"], f) for f in (0.5, 0.9, 0.99))
+        terminalreporter.write_line(f"  {entry['count']:6d}  {p50:>6g}  {p90:>6g}  {p99:>6g}  {label}")
+
+    terminalreporter.write_sep("-", "chattiest methods")
+    terminalreporter.write_line(f"  {'own':>6}  {'total':>6}  method (top commands)")
+    for method, own, total_with_nested, by_command in chattiest(profile["by_method"], steps):
+        top = ", ".join(f"{name} {n}" for name, n in sorted(by_command.items(), key=lambda kv: -kv[1])[:3])
+        terminalreporter.write_line(f"  {own:6d}  {total_with_nested:6d}  {method}  ({top})")
+
+    with open(os.path.join("reports", "command_profile.json"), "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2, sort_keys=True)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    step_recorder.start_test(item.name)
+    command_profiler.start_test(item.nodeid)
+    yield
+    command_profiler.finish_test()
+    trace = step_recorder.finish_test()
+    if trace and item.config.getoption("--step-traces"):
+        traces_dir = os.path.join("reports", "traces")
+        os.makedirs(traces_dir, exist_ok=True)
+        filename = re.sub(r"[^\w.-]+", "_", item.nodeid) + ".folded"
+        with open(os.path.join(traces_dir, filename), "w", encoding="utf-8") as f:
+            f.write("\n".join(trace) + "\n")
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -37,29 +486,63 @@ def pytest_runtest_makereport(item, call):
 
         if report.failed and "driver" in item.funcargs:
             driver = item.funcargs["driver"]
-            screenshot_dir = os.path.join("reports", "screenshots")
-            os.makedirs(screenshot_dir, exist_ok=True)
+            relative_path = screenshot_writer.capture(driver, item.nodeid)
+            if relative_path:
+                report.extra.append(
+                    pytest_html_extras.image(relative_path, name="failure", mime_type=screenshot_writer.mime_type,
+                                             extension=relative_path.rsplit(".", 1)[-1])
+                )
+
+        # SoftAssert attaches its screenshots to the test item; pass each stored image on once.
+        seen = set()
+        unique = []
+        for extra in getattr(item, "extra", []) + report.extra:
+            if extra.get("format_type") == "image" and extra["content"] in seen:
+                continue
+            seen.add(extra.get("content"))
+            unique.append(extra)
+        report.extra = unique
 
-            filename = report.nodeid.replace("::", "_").replace("/", "_") + ".png"
-            abs_path = os.path.join(screenshot_dir, filename)
-            driver.save_screenshot(abs_path)
+        commands = sum(command_profiler.by_test.get(item.nodeid, {}).values())
+        if commands:
+            report.user_properties.append(("webdriver_commands", commands))
 
-            relative_path = f"screenshots/{filename}".replace("\\", "/")
-            report.extra.append(pytest_html_extras.image(relative_path, mime_type="image/png"))
+        capture_seconds = screenshot_writer.capture_seconds(item.nodeid)
+        if capture_seconds:
+            report.user_properties.append(("screenshot_capture_seconds", round(capture_seconds, 3)))
 
 
 def pytest_html_results_table_header(cells):
     cells.insert(2, '<th>Screenshot</th>')
 
 
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    steps = session.config.stash.get(SESSION_STATS, {}).get("steps")
+    if not steps:
+        return
+    rows = "".join(
+        f"<tr><td>{html.escape(name)}</td><td>{entry['calls']}</td><td>{entry['seconds']:.2f}</td>"
+        f"<td>{entry['seconds'] * 1000 / entry['calls']:.0f}</td><td>{entry['commands']}</td>"
+        f"<td>{entry['wait_seconds']:.2f}</td></tr>"
+        for name, entry in sorted(steps.items(), key=lambda kv: kv[1]["seconds"], reverse=True)[:25]
+    )
+    prefix.append(
+        "<h2>Page-object steps</h2><table id=\"step-timing\">"
+        "<tr><th>Step</th><th>Calls</th><th>Total (s)</th><th>Avg (ms)</th>"
+        "<th>WebDriver commands</th><th>Waiting (s)</th></tr>"
+        f"{rows}</table>"
+    )
+
+
 def pytest_html_results_table_row(report, cells):
     screenshot_html = ""
-    if hasattr(report, "extra"):
-        for extra in report.extra:
-            if isinstance(extra, dict) and extra.get("format") == "image":
-                screenshot_html = extra["content"]
-                break
-    cells.insert(2, screenshot_html)
+    for extra in getattr(report, "extras", None) or getattr(report, "extra", []):
+        if isinstance(extra, dict) and extra.get("format_type") == "image":
+            path = extra["content"]
+            digest = path.rsplit("/", 1)[-1].split(".", 1)[0]
+            screenshot_html = f'<a href="{path}">{digest[:10]}</a>'
+            break
+    cells.insert(2, f"<td>{screenshot_html}</td>")
 
 
 
@@ -67,6 +550,17 @@ def pytest_configure(config):
     reports_dir = os.path.join(os.getcwd(), "reports")
     os.makedirs(reports_dir, exist_ok=True)
 
+    # Durations are recorded on the controller (which sees every worker's reports) and saved once.
+    if not hasattr(config, "workerinput"):
+        history = config.stash[DURATION_HISTORY] = DurationHistory.load(config)
+        config.pluginmanager.register(history, "duration_history")
+
+    screenshot_writer.configure(
+        image_format=config.getoption("--screenshot-format"),
+        quality=config.getoption("--screenshot-quality"),
+        max_width=config.getoption("--screenshot-max-width"),
+    )
+
     logger = logging.getLogger("test_logger")
     logger.setLevel(logging.INFO)
     if not getattr(logger, "_handler_set", False):
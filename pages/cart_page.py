@@ -1,7 +1,39 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
 from utils.base_page import BasePage
+from utils.command_hooks import page_generation, register_read_only_script
+
+
+@dataclass(frozen=True, slots=True)
+class CartRow:
+    """One product row of the cart table."""
+    name: str
+    model: str
+    quantity: Optional[int]
+    unit_price: Optional[float]
+    total_price: Optional[float]
+
+
+@dataclass(frozen=True, slots=True)
+class CartSnapshot:
+    """Immutable view of the cart table (rows keyed by product name) and its totals block."""
+    rows: Mapping[str, CartRow]
+    totals: Mapping[str, Optional[float]]
+
+    def __contains__(self, product_name: str) -> bool:
+        return product_name in self.rows
+
+    def get(self, product_name: str) -> Optional[CartRow]:
+        """Returns the row for a product, or None when it is not in the cart."""
+        return self.rows.get(product_name)
+
+    @property
+    def grand_total(self) -> Optional[float]:
+        """The 'Total' line of the totals block, or None when it is not shown."""
+        return self.totals.get("Total")
 
 
 class CartPage(BasePage):
@@ -21,13 +53,36 @@ class CartPage(BasePage):
         "//button[@type='submit' and contains(@formaction,'route=checkout/cart') and contains(@formaction,'edit')]",
     )
 
-    GRAND_TOTAL_VALUE_CELL = (
-        By.XPATH,
-        "//*[@id='checkout-total']//tr[.//*[normalize-space()='Total']]/td[2]",
-    )
+    SNAPSHOT_JS = register_read_only_script("""
+function text(el) { return el ? (el.innerText || '').trim() : ''; }
+var rows = [];
+document.querySelectorAll('#content table.table tbody tr').forEach(function (tr) {
+    var link = Array.prototype.find.call(tr.querySelectorAll('td a'), function (a) { return text(a); });
+    if (!link) { return; }
+    var nameCell = link.closest('td');
+    var qty = tr.querySelector("input[name*='quantity']");
+    var prices = tr.querySelectorAll('td.text-end');
+    rows.push({
+        name: text(link),
+        model: text(nameCell ? nameCell.nextElementSibling : null),
+        quantity: qty ? qty.value : '',
+        unit: prices.length ? text(prices[0]) : '',
+        total: prices.length ? text(prices[prices.length - 1]) : ''
+    });
+});
+var totals = [];
+document.querySelectorAll('#checkout-total tr').forEach(function (tr) {
+    var cells = tr.querySelectorAll('td, th');
+    if (cells.length >= 2) { totals.push([text(cells[0]), text(cells[cells.length - 1])]); }
+});
+var stable = document.readyState === 'complete' && (!window.jQuery || window.jQuery.active === 0);
+return {rows: rows, totals: totals, stable: stable};
+""")
 
     def __init__(self, driver):
         super().__init__(driver)
+        self._snapshot = None
+        self._snapshot_generation = None
 
     # ---------------------------
     # Navigation
@@ -43,10 +98,53 @@ class CartPage(BasePage):
     # ---------------------------
 
     def wait_for_ready(self) -> bool:
-        """Waits until the cart content is visible."""
+        """Waits until the cart has finished its AJAX refreshes and the content is visible."""
+        self.wait_for_network_idle()
         self.wait.until(EC.visibility_of_element_located(self.CONTENT))
         return True
 
+    # ---------------------------
+    # Snapshot (whole cart in one round trip)
+    # ---------------------------
+
+    def snapshot(self, refresh: bool = False) -> CartSnapshot:
+        """Reads every cart row and the totals block in one script call.
+
+        The result is reused until the page may have changed: any navigation, click, typing, or
+        script sent through the driver invalidates it, as do update_cart and remove_product."""
+        if not refresh and self._snapshot is not None and self._snapshot_generation == page_generation(self.driver):
+            return self._snapshot
+
+        self.wait_for_ready()
+        raw = self.driver.execute_script(self.SNAPSHOT_JS) or {}
+        snapshot = self._build_snapshot(raw)
+
+        # Never reuse a read taken while the cart was still reloading over AJAX.
+        self._snapshot = snapshot if raw.get("stable") else None
+        self._snapshot_generation = page_generation(self.driver)
+        return snapshot
+
+    def invalidate_snapshot(self) -> None:
+        """Forces the next read to take a fresh snapshot."""
+        self._snapshot = None
+
+    def _build_snapshot(self, raw: dict) -> CartSnapshot:
+        """Converts the script result into an immutable CartSnapshot."""
+        rows = {}
+        for item in raw.get("rows") or []:
+            if item["name"] in rows:
+                continue
+            qty = (item.get("quantity") or "").strip()
+            rows[item["name"]] = CartRow(
+                name=item["name"],
+                model=item.get("model") or "",
+                quantity=int(qty) if qty.isdigit() else None,
+                unit_price=self._parse_price(item.get("unit")),
+                total_price=self._parse_price(item.get("total")),
+            )
+        totals = {label.rstrip(":").strip(): self._parse_price(value) for label, value in raw.get("totals") or []}
+        return CartSnapshot(rows=MappingProxyType(rows), totals=MappingProxyType(totals))
+
     # ---------------------------
     # Row locators (dynamic)
     # ---------------------------
@@ -81,8 +179,7 @@ class CartPage(BasePage):
 
     def is_product_in_cart(self, product_name: str) -> bool:
         """True when a product row exists in the cart."""
-        self.wait_for_ready()
-        return bool(self.driver.find_elements(*self._row_locator_for_product(product_name)))
+        return product_name in self.snapshot()
 
     def is_cart_empty_message_displayed(self) -> bool:
         """True when the empty cart message is shown."""
@@ -99,22 +196,18 @@ class CartPage(BasePage):
     # Quantity
     # ---------------------------
 
-    def get_product_quantity(self, product_name: str):
+    def get_product_quantity(self, product_name: str, refresh: bool = False):
         """Returns the quantity for a product row as int, or None if not found."""
-        self.wait_for_ready()
-        els = self.driver.find_elements(*self._qty_input_locator(product_name))
-        if not els:
-            return None
-        value = (els[0].get_attribute("value") or "").strip()
-        return int(value) if value.isdigit() else None
+        row = self.snapshot(refresh).get(product_name)
+        return row.quantity if row else None
 
     def wait_for_product_quantity(self, product_name: str, expected_qty: int, timeout: int = 8) -> None:
         """Waits until the cart shows the expected quantity for a product."""
         def _quantity_is_expected(_driver):
-            qty = self.get_product_quantity(product_name)
+            qty = self.get_product_quantity(product_name, refresh=True)
             return qty == expected_qty
 
-        WebDriverWait(self.driver, timeout).until(
+        self._wait_for(timeout).until(
             _quantity_is_expected,
             f"Expected quantity for {product_name} to be {expected_qty}",
         )
@@ -132,7 +225,9 @@ class CartPage(BasePage):
         """Clicks Update and waits for the cart to refresh."""
         self.wait_for_ready()
         self._click_when_clickable(self.UPDATE_BUTTON)
+        self.wait_for_page_stable()
         self.wait_for_ready()
+        self.invalidate_snapshot()
         return True
 
     def update_quantity(self, product_name: str, quantity: int) -> bool:
@@ -155,6 +250,7 @@ class CartPage(BasePage):
             or (len(d.find_elements(*self.EMPTY_CART_MESSAGE)) > 0)
         )
         self.wait_for_ready()
+        self.invalidate_snapshot()
         return True
 
     # ---------------------------
@@ -163,31 +259,17 @@ class CartPage(BasePage):
 
     def get_unit_price(self, product_name: str):
         """Returns unit price for the product row as float, or None."""
-        self.wait_for_ready()
-        rows = self.driver.find_elements(*self._row_locator_for_product(product_name))
-        if not rows:
-            return None
-        cells = rows[0].find_elements(By.CSS_SELECTOR, "td.text-end")
-        if not cells:
-            return None
-        return self._parse_price(cells[0].text)
+        row = self.snapshot().get(product_name)
+        return row.unit_price if row else None
 
     def get_total_price(self, product_name: str):
         """Returns total price for the product row as float, or None."""
-        self.wait_for_ready()
-        rows = self.driver.find_elements(*self._row_locator_for_product(product_name))
-        if not rows:
-            return None
-        cells = rows[0].find_elements(By.CSS_SELECTOR, "td.text-end")
-        if not cells:
-            return None
-        return self._parse_price((cells[-1].text or "").strip())
+        row = self.snapshot().get(product_name)
+        return row.total_price if row else None
 
     def get_cart_grand_total(self):
         """Returns the cart grand total as float, or None."""
-        self.wait_for_ready()
-        cell = self.wait.until(EC.visibility_of_element_located(self.GRAND_TOTAL_VALUE_CELL))
-        return self._parse_price(cell.text)
+        return self.snapshot().grand_total
 
     def _parse_price(self, text: str):
         """Converts a price string like '£1,234.00' into a float."""
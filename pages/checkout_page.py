@@ -2,7 +2,6 @@ from selenium.common import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
-from selenium.webdriver.support.wait import WebDriverWait
 from utils.base_page import BasePage
 
 
@@ -10,6 +9,8 @@ class CheckoutPage(BasePage):
     """Runs the checkout steps end-to-end so tests only call one clean flow method."""
 
     # Shipping address
+    SHIPPING_EXISTING_RADIO = (By.ID, "input-shipping-existing")
+    SHIPPING_ADDRESS_SELECT = (By.ID, "input-shipping-address")
     SHIPPING_NEW_RADIO = (By.ID, "input-shipping-new")
     SHIPPING_NEW_SECTION = (By.ID, "shipping-new")
 
@@ -37,6 +38,14 @@ class CheckoutPage(BasePage):
     CONFIRM_BUTTON = (By.CSS_SELECTOR, "#checkout-payment button.btn-primary")
     SUCCESS_MESSAGE = (By.CSS_SELECTOR, "#content h1")
 
+    # Steps only the new-address flow runs, and the one that replaces them (compared in the session summary).
+    NEW_ADDRESS_STEPS = (
+        "CheckoutPage.select_new_shipping_address",
+        "CheckoutPage.fill_new_shipping_address",
+        "CheckoutPage.submit_new_shipping_address",
+    )
+    SAVED_ADDRESS_STEPS = ("CheckoutPage.use_saved_shipping_address",)
+
     # ---------------------------
     # High-level flow
     # ---------------------------
@@ -73,9 +82,21 @@ class CheckoutPage(BasePage):
 
         self.confirm_order()
 
+    def complete_saved_address_checkout_flow(self, address_id=None, require_agree: bool = False) -> None:
+        """Completes checkout with an address already on the account: only the method and confirm steps run."""
+        self.use_saved_shipping_address(address_id)
+
+        self.refresh_and_select_shipping_method()
+        self.refresh_and_select_payment_method()
+
+        if require_agree:
+            self.agree_if_present()
+
+        self.confirm_order()
+
     def is_order_successful(self) -> bool:
-        """True when the success page confirms the order was placed."""
-        if not self.is_visible(self.SUCCESS_MESSAGE):
+        """True when the success page confirms the order was placed; False as soon as an error alert shows instead."""
+        if self.wait_until_any(self.ALERT_DANGER, self.SUCCESS_MESSAGE) != self.SUCCESS_MESSAGE:
             return False
         text = (self.get_text(self.SUCCESS_MESSAGE) or "").lower()
         return "your order has been placed" in text
@@ -84,9 +105,36 @@ class CheckoutPage(BasePage):
     # Shipping address
     # ---------------------------
 
+    def wait_for_checkout_page(self) -> None:
+        """Waits until the checkout route is loaded and its method sections are rendered."""
+        self.wait.until(EC.url_contains("route=checkout/checkout"))
+        self.wait.until(EC.presence_of_element_located(self.PAYMENT_METHOD_REFRESH))
+
+    def use_saved_shipping_address(self, address_id=None) -> None:
+        """Ships to a saved address (`address_id`, or the first one listed) instead of filling the form.
+
+        Choosing the address posts it to the session; when it is already the selected one there is
+        nothing to send."""
+        self.wait_for_checkout_page()
+        if self.is_present(self.SHIPPING_EXISTING_RADIO):
+            radio = self.locate(self.SHIPPING_EXISTING_RADIO)
+            if not radio.is_selected():
+                radio.click(native=True)
+
+        sel = Select(self.find_present(self.SHIPPING_ADDRESS_SELECT))
+        values = [(opt.get_attribute("value") or "").strip() for opt in sel.options]
+        wanted = str(address_id) if address_id else next((v for v in values if v), "")
+        if not wanted or wanted not in values:
+            raise AssertionError(f"Saved address {address_id or ''} is not offered at checkout (options: {values}).")
+
+        if sel.first_selected_option.get_attribute("value") != wanted:
+            sel.select_by_value(wanted)
+            self.wait_for_network_idle()
+
     def select_new_shipping_address(self) -> None:
         """Switches to 'new address' when the option exists, otherwise leaves default."""
-        if not self.driver.find_elements(*self.SHIPPING_NEW_RADIO):
+        self.wait_for_checkout_page()
+        if not self.is_present(self.SHIPPING_NEW_RADIO):
             return
 
         radio = self.wait.until(EC.presence_of_element_located(self.SHIPPING_NEW_RADIO))
@@ -104,100 +152,93 @@ class CheckoutPage(BasePage):
         postcode: str,
         country: str,
         zone: str,
+        typing: bool = False,
     ) -> None:
-        """Fills the shipping address form fields."""
-        self._type(self.SHIPPING_FIRSTNAME, firstname)
-        self._type(self.SHIPPING_LASTNAME, lastname)
-        self._type(self.SHIPPING_ADDRESS_1, address_1)
-        self._type(self.SHIPPING_CITY, city)
-        self._type(self.SHIPPING_POSTCODE, postcode)
-
-        self.select_by_text(self.SHIPPING_COUNTRY, country)
-
-        zone_el = self.wait.until(EC.element_to_be_clickable(self.SHIPPING_ZONE))
-        self._scroll_into_view(zone_el)
-        self.select_by_text(self.SHIPPING_ZONE, zone)
+        """Fills the shipping address form fields (one script call unless `typing`)."""
+        self.fill_form({
+            self.SHIPPING_FIRSTNAME: firstname,
+            self.SHIPPING_LASTNAME: lastname,
+            self.SHIPPING_ADDRESS_1: address_1,
+            self.SHIPPING_CITY: city,
+            self.SHIPPING_POSTCODE: postcode,
+            self.SHIPPING_COUNTRY: country,
+        }, typing=typing)
+
+        # The zone list is reloaded over AJAX after the country changes.
+        self.wait_for_network_idle()
+        self.fill_form({self.SHIPPING_ZONE: zone}, typing=typing)
 
     def submit_new_shipping_address(self) -> None:
         """Submits the shipping address step and waits for the next section to be ready."""
-        btn = self.wait.until(EC.element_to_be_clickable(self.SHIPPING_ADDRESS_CONTINUE))
-        self._scroll_into_view(btn)
-        btn.click()
+        self.locate(self.SHIPPING_ADDRESS_CONTINUE, clickable=True).click(native=True)
 
-        self.wait.until(EC.presence_of_element_located(self.SHIPPING_METHOD_REFRESH))
+        # Saving the address re-renders the shipping and payment sections over AJAX.
+        self.wait_for_network_idle()
+        self.wait_for_dom_stable()
 
     # ---------------------------
     # Shipping / Payment methods
     # ---------------------------
 
-    def _wait_for_enabled_select_option(self, select_locator, timeout: int = 10) -> None:
-        """Waits until the dropdown has at least one enabled option with a real value."""
-        def _has_enabled_option(driver) -> bool:
-            try:
-                select_el = driver.find_element(*select_locator)
-                options = Select(select_el).options
-                return any(
-                    (opt.get_attribute("value") or "").strip() and opt.is_enabled()
-                    for opt in options
-                )
-            except StaleElementReferenceException:
+    def _has_enabled_option(self, select_locator) -> bool:
+        """True when the dropdown exists and has at least one enabled option with a real value."""
+        try:
+            select_els = self.find_all(select_locator)
+            if not select_els:
                 return False
+            return any(
+                (opt.get_attribute("value") or "").strip() and opt.is_enabled()
+                for opt in Select(select_els[0]).options
+            )
+        except StaleElementReferenceException:
+            return False
 
-        WebDriverWait(self.driver, timeout).until(_has_enabled_option)
-
-    def _select_first_enabled_option(self, select_locator, retries: int = 3) -> None:
-        """Selects the first enabled option that has a real value."""
-        last_error = None
-
-        for _ in range(retries):
-            try:
-                select_el = self.driver.find_element(*select_locator)
-                sel = Select(select_el)
-
-                for index, opt in enumerate(sel.options):
-                    if (opt.get_attribute("value") or "").strip() and opt.is_enabled():
-                        fresh_select = self.driver.find_element(*select_locator)
-                        Select(fresh_select).select_by_index(index)
-                        return
-
-                raise AssertionError("No enabled selectable options found.")
-
-            except StaleElementReferenceException as e:
-                last_error = e
+    def _wait_for_enabled_select_option(self, select_locator, timeout: int = 10) -> None:
+        """Waits until the dropdown has at least one enabled option with a real value."""
+        self._wait_for(timeout).until(lambda d: self._has_enabled_option(select_locator))
 
-        raise AssertionError(f"Select became stale while selecting an option: {select_locator}") from last_error
+    def _select_first_enabled_option(self, select_locator) -> None:
+        """Selects the first enabled option that has a real value (call once the network is idle)."""
+        sel = Select(self.find_present(select_locator))
+        for index, opt in enumerate(sel.options):
+            if (opt.get_attribute("value") or "").strip() and opt.is_enabled():
+                sel.select_by_index(index)
+                return
+        raise AssertionError(f"No enabled selectable options found: {select_locator}")
 
     def refresh_and_select_shipping_method(self) -> None:
         """Refreshes shipping methods, selects the first valid one, then waits for payment step."""
         self._click_when_clickable(self.SHIPPING_METHOD_REFRESH)
+        self.wait_for_network_idle()
 
-        select_el = self.wait.until(EC.presence_of_element_located(self.SHIPPING_METHOD_SELECT))
-        self._scroll_into_view(select_el)
-
+        self._scroll_into_view(self.SHIPPING_METHOD_SELECT)
         self._wait_for_enabled_select_option(self.SHIPPING_METHOD_SELECT)
         self._select_first_enabled_option(self.SHIPPING_METHOD_SELECT)
 
+        # Choosing a method posts it to the session before the payment step can be refreshed.
+        self.wait_for_network_idle()
         self.wait.until(EC.presence_of_element_located(self.PAYMENT_METHOD_REFRESH))
 
     def refresh_and_select_payment_method(self) -> None:
         """Refreshes payment methods, selects the first valid one, then waits for confirm button."""
         self._click_when_clickable(self.PAYMENT_METHOD_REFRESH)
+        self.wait_for_network_idle()
 
+        self._wait_for(ignored_exceptions=(StaleElementReferenceException,)).until(
+            lambda d: self.has_no_payment_methods_alert() or self._has_enabled_option(self.PAYMENT_METHOD_SELECT)
+        )
         if self.has_no_payment_methods_alert():
             raise AssertionError("No payment methods configured in store.")
 
-        select_el = self.wait.until(EC.presence_of_element_located(self.PAYMENT_METHOD_SELECT))
-        self._scroll_into_view(select_el)
-
-        self._wait_for_enabled_select_option(self.PAYMENT_METHOD_SELECT)
+        self._scroll_into_view(self.PAYMENT_METHOD_SELECT)
         self._select_first_enabled_option(self.PAYMENT_METHOD_SELECT)
 
+        self.wait_for_network_idle()
         self.wait.until(EC.element_to_be_clickable(self.CONFIRM_BUTTON))
 
     def has_no_payment_methods_alert(self) -> bool:
         """True when OpenCart shows 'no payment method available'."""
-        alerts = self.driver.find_elements(*self.ALERT_DANGER)
-        return any("no payment method available" in (a.text or "").lower() for a in alerts)
+        return self.any_visible_text_contains(self.ALERT_DANGER, "no payment method available", ignore_case=True)
 
     def agree_if_present(self) -> None:
         """Ticks the terms checkbox if OpenCart shows it."""
@@ -205,10 +246,9 @@ class CheckoutPage(BasePage):
         if not els:
             return
 
-        cb = els[0]
-        if not cb.is_selected():
-            self._scroll_into_view(cb)
-            cb.click()
+        checkbox = self._handle(els[0])
+        if not checkbox.is_selected():
+            checkbox.click(native=True)
 
     # ---------------------------
     # Confirm
@@ -218,14 +258,9 @@ class CheckoutPage(BasePage):
         """Clicks Confirm Order and leaves the browser on the success page when it works."""
         self._dismiss_overlays()
 
-        wait = WebDriverWait(self.driver, 15)
-        btn = wait.until(EC.element_to_be_clickable(self.CONFIRM_BUTTON))
-
-        from selenium.webdriver.common.action_chains import ActionChains
-        ActionChains(self.driver).move_to_element(btn).perform()
-
-        wait.until(lambda d: d.find_element(*self.CONFIRM_BUTTON).is_enabled())
-        self.driver.find_element(*self.CONFIRM_BUTTON).click()
+        button = self.locate(self.CONFIRM_BUTTON, clickable=True, timeout=15)
+        self._wait_for(15).until(lambda d: button.is_enabled())
+        button.click(native=True)
 
     # ---------------------------
     # Small helpers
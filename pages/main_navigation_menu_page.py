@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 from typing import Callable, Optional
-from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from utils.base_page import BasePage
+from utils.route_map import route_map
 
 
 @dataclass(frozen=True)
@@ -14,10 +14,17 @@ class Urls:
 
 
 class NavigationPage(BasePage):
-    """Handles the main OpenCart navigation: header links, categories, and account area pages."""
+    """Handles the main OpenCart navigation: header links, categories, and account area pages.
+
+    Category helpers open the category URL directly (see utils/route_map); `via_ui=True` clicks
+    through the menu instead, for tests that check the menu itself."""
 
     urls = Urls()
 
+    def __init__(self, driver, via_ui: bool = False):
+        super().__init__(driver)
+        self.via_ui = via_ui
+
     # ---------------------------
     # Generic
     # ---------------------------
@@ -137,9 +144,10 @@ class NavigationPage(BasePage):
     # Public navigation
     # ---------------------------
     def open_home(self) -> None:
-        """Opens the home page and waits until the page is loaded."""
+        """Opens the home page and waits until it is loaded and its AJAX requests have finished."""
         self.driver.get(self.urls.base)
-        self.wait.until(EC.presence_of_element_located(self.BODY))
+        if not self.wait_for_network_idle():
+            raise AssertionError(f"Home page did not finish loading within {self.timeout}s: {self.urls.base}")
 
     def ensure_home(self) -> None:
         """Opens home only if we are not already there."""
@@ -164,7 +172,7 @@ class NavigationPage(BasePage):
     def is_currency_euro(self) -> bool:
         """Returns True when at least one visible price shows the EUR symbol."""
         self.wait.until(EC.presence_of_all_elements_located(self.PRICE_TEXT))
-        return any(e.is_displayed() and "€" in e.text for e in self.driver.find_elements(*self.PRICE_TEXT))
+        return self.any_visible_text_contains(self.PRICE_TEXT, "€")
 
     def _open_currency_dropdown(self) -> None:
         """Opens the currency dropdown if it is not already open."""
@@ -177,11 +185,7 @@ class NavigationPage(BasePage):
     def _prices_contain(self, symbol: str) -> Callable:
         """Wait predicate: True when a visible price contains the given symbol."""
         def _predicate(driver) -> bool:
-            try:
-                elements = driver.find_elements(*self.PRICE_TEXT)
-                return any(e.is_displayed() and symbol in e.text for e in elements)
-            except StaleElementReferenceException:
-                return False
+            return self.any_visible_text_contains(self.PRICE_TEXT, symbol)
 
         return _predicate
 
@@ -220,10 +224,7 @@ class NavigationPage(BasePage):
 
     def is_empty_cart_message_visible(self) -> bool:
         """Returns True when the cart empty message is visible."""
-        return any(
-            e.is_displayed() and "Your shopping cart is empty" in e.text
-            for e in self.driver.find_elements(*self.EMPTY_CART_MESSAGE)
-        )
+        return self.any_visible_text_contains(self.EMPTY_CART_MESSAGE, "Your shopping cart is empty")
 
     def is_content_visible(self) -> bool:
         """Simple check used by tests to confirm the page loaded."""
@@ -232,48 +233,46 @@ class NavigationPage(BasePage):
     # ---------------------------
     # Category navigation
     # ---------------------------
+    def _open_category(self, path: str, *menu_clicks) -> None:
+        """Opens a category by URL, or by clicking `menu_clicks` in order when `via_ui`."""
+        if self.via_ui:
+            for locator in menu_clicks:
+                self._click_when_clickable(locator)
+        else:
+            self.driver.get(route_map.category_url(self.driver, path))
+        self._wait_for_content()
+
     def open_desktops_mac(self) -> None:
         """Opens the Desktops - Mac category."""
-        self._click_when_clickable(self.DESKTOPS)
-        self._click_when_clickable(self.DESKTOPS_MAC)
-        self._wait_for_content()
+        self._open_category("Desktops/Mac", self.DESKTOPS, self.DESKTOPS_MAC)
 
     def open_laptops_and_notebooks(self) -> None:
         """Opens the Laptops & Notebooks listing page."""
-        self._click_when_clickable(self.LAPTOPS_NOTEBOOKS)
-        self._click_when_clickable(self.LAPTOPS_SHOW_ALL)
-        self._wait_for_content()
+        self._open_category("Laptops & Notebooks", self.LAPTOPS_NOTEBOOKS, self.LAPTOPS_SHOW_ALL)
 
     def open_components(self) -> None:
         """Opens the Components listing page."""
-        self._click_when_clickable(self.COMPONENTS)
-        self._click_when_clickable(self.COMPONENTS_SHOW_ALL)
-        self._wait_for_content()
+        self._open_category("Components", self.COMPONENTS, self.COMPONENTS_SHOW_ALL)
 
     def open_tablets(self) -> None:
         """Opens the Tablets category."""
-        self._click_when_clickable(self.TABLETS)
-        self._wait_for_content()
+        self._open_category("Tablets", self.TABLETS)
 
     def open_software(self) -> None:
         """Opens the Software category."""
-        self._click_when_clickable(self.SOFTWARE)
-        self._wait_for_content()
+        self._open_category("Software", self.SOFTWARE)
 
     def open_phones_and_pdas(self) -> None:
         """Opens the Phones & PDAs category."""
-        self._click_when_clickable(self.PHONES_PDAS)
-        self._wait_for_content()
+        self._open_category("Phones & PDAs", self.PHONES_PDAS)
 
     def open_cameras(self) -> None:
         """Opens the Cameras category."""
-        self._click_when_clickable(self.CAMERAS)
-        self._wait_for_content()
+        self._open_category("Cameras", self.CAMERAS)
 
     def open_mp3_players(self) -> None:
         """Opens the MP3 Players category."""
-        self._click_when_clickable(self.MP3_PLAYERS)
-        self._wait_for_content()
+        self._open_category("MP3 Players", self.MP3_PLAYERS)
 
     # ---------------------------
     # Account pages (generic pattern)
@@ -336,6 +335,7 @@ class NavigationPage(BasePage):
         """Opens Subscriptions and waits until the page is loaded."""
         self._click_when_clickable(self.SUBSCRIPTIONS)
         self.wait.until(self._subscriptions_loaded())
+        self._wait_for_content()
 
     def subscriptions_visible(self) -> bool:
         """Checks the page text to confirm subscriptions/recurring content is present."""
@@ -429,10 +429,7 @@ class NavigationPage(BasePage):
 
     def affiliate_success(self) -> bool:
         """True when the affiliate update success message is shown."""
-        return any(
-            e.is_displayed() and "successfully updated" in e.text.lower()
-            for e in self.driver.find_elements(*self.ALERT_SUCCESS)
-        )
+        return self.any_visible_text_contains(self.ALERT_SUCCESS, "successfully updated", ignore_case=True)
 
     def on_affiliate_page(self) -> bool:
         """True when the page heading shows Affiliate."""
@@ -472,10 +469,10 @@ class NavigationPage(BasePage):
 
     def newsletter_success(self) -> bool:
         """True when the newsletter update success message is shown."""
-        return any(
-            e.is_displayed()
-            and "newsletter subscription has been successfully updated" in e.text.lower()
-            for e in self.driver.find_elements(*self.ALERT_SUCCESS)
+        return self.any_visible_text_contains(
+            self.ALERT_SUCCESS,
+            "newsletter subscription has been successfully updated",
+            ignore_case=True,
         )
 
     # ---------------------------
@@ -506,11 +503,10 @@ class NavigationPage(BasePage):
         return _predicate
 
     def _heading_contains(self, expected: str, *, ignore_case: bool = False) -> bool:
-        """Checks the first H1 contains the expected text."""
-        headings = self.driver.find_elements(*self.H1)
-        if not headings:
+        """Checks the first H1 contains the expected text (False once the page settles without a heading)."""
+        if not self.is_visible(self.H1, expect_absent=True):
             return False
-        actual = headings[0].text
+        actual = self.get_text(self.H1)
         if ignore_case:
             return expected.lower() in actual.lower()
         return expected in actual
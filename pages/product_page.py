@@ -3,10 +3,13 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from utils.base_page import BasePage
+from utils.route_map import route_map
 
 
 class ProductPage(BasePage):
     """Works with product pages: open a product, set quantity, pick options, and add to cart.
+
+    `select_product` opens the product URL directly; `via_ui=True` clicks it in the listing instead.
     """
 
     # ---------------------------
@@ -26,8 +29,9 @@ class ProductPage(BasePage):
     OPTION_SELECTS = (By.XPATH, "//select[contains(@id, 'input-option')]")
     FILE_INPUT = (By.CSS_SELECTOR, "input[type='file']")
 
-    def __init__(self, driver):
+    def __init__(self, driver, via_ui: bool = False):
         super().__init__(driver)
+        self.via_ui = via_ui
 
     # ---------------------------
     # Navigation / selection
@@ -41,8 +45,12 @@ class ProductPage(BasePage):
         self._safe_click(product)
 
     def select_product(self, product_name: str) -> None:
-        """Selects a product from the product listing by name."""
-        self.open_product_from_list(product_name)
+        """Opens a product by name (its product_id URL, or the listing link when `via_ui`)."""
+        if self.via_ui:
+            self.open_product_from_list(product_name)
+            return
+        self.driver.get(route_map.product_url(self.driver, product_name))
+        self.wait.until(EC.presence_of_element_located(self.ADD_TO_CART_BUTTON))
 
     def select_required_dropdown_options(self) -> None:
         """Selects the first real value for each option dropdown (skips 'Please Select')."""
@@ -59,10 +67,8 @@ class ProductPage(BasePage):
 
     def set_quantity(self, quantity: int) -> None:
         """Sets the product quantity on the page."""
-        field = self.wait.until(EC.element_to_be_clickable(self.QUANTITY_INPUT))
-        self._scroll_into_view(field)
-        field.clear()
-        field.send_keys(str(quantity))
+        field = self.locate(self.QUANTITY_INPUT, clickable=True).scroll_into_view()
+        field.type(str(quantity), clear_first=True)
 
     # ---------------------------
     # Add to cart
@@ -145,19 +151,14 @@ class ProductPage(BasePage):
     def fill_datetime_option(self, name: str, value: str, tab_out: bool = True) -> None:
         """Fills a datetime input and optionally tabs out to trigger validation."""
         locator = (By.NAME, name)
-        el = self.wait.until(EC.element_to_be_clickable(locator))
-        self._scroll_into_view(el)
-        el.clear()
-        el.send_keys(value)
+        field = self.locate(locator, clickable=True).scroll_into_view()
+        field.type(value, clear_first=True)
         if tab_out:
-            el.send_keys(Keys.TAB)
+            field.type(Keys.TAB)
 
     def upload_file_option(self, button_id: str, file_path: str) -> None:
         """Uploads a file using the product upload button and accepts the result alert."""
-        upload_btn = self.wait.until(EC.element_to_be_clickable((By.ID, button_id)))
-        self._scroll_into_view(upload_btn)
-
-        self.driver.execute_script("arguments[0].click();", upload_btn)
+        self.locate((By.ID, button_id), clickable=True).click()
 
         file_input = self.wait.until(EC.presence_of_element_located(self.FILE_INPUT))
         file_input.send_keys(file_path)
@@ -105,13 +105,11 @@ class RegistrationPage(BasePage):
         """Old name used by earlier tests."""
         self.submit()
 
-    def fill_registration_form(self, first, last, email, password) -> None:
-        """Fills the form fields and accepts the privacy policy (no submit)."""
-        self.enter_first_name(first)
-        self.enter_last_name(last)
-        self.enter_email(email)
-        self.enter_password(password)
-        self.set_privacy_policy(True)
+    def fill_registration_form(self, first, last, email, password, typing: bool = False) -> None:
+        """Fills the form fields and accepts the privacy policy (no submit).
+
+        Sets every field in one script call; `typing=True` types them key by key instead."""
+        self._fill(first, last, email, password, True, typing)
 
     def register(
         self,
@@ -120,15 +118,29 @@ class RegistrationPage(BasePage):
         email: str,
         password: str,
         accept_privacy_policy: bool = True,
+        typing: bool = False,
     ) -> None:
         """Fills the form and submits it."""
-        self.enter_first_name(first)
-        self.enter_last_name(last)
-        self.enter_email(email)
-        self.enter_password(password)
-        self.set_privacy_policy(accept_privacy_policy)
+        self._fill(first, last, email, password, accept_privacy_policy, typing)
         self.submit()
 
+    def _fill(self, first, last, email, password, accept_privacy_policy: bool, typing: bool) -> None:
+        if typing:
+            self.enter_first_name(first)
+            self.enter_last_name(last)
+            self.enter_email(email)
+            self.enter_password(password)
+            self.set_privacy_policy(accept_privacy_policy)
+            return
+
+        self.fill_form({
+            self.FIRST_NAME_INPUT: first,
+            self.LAST_NAME_INPUT: last,
+            self.EMAIL_INPUT: email,
+            self.PASSWORD_INPUT: password,
+            self.PRIVACY_POLICY_CHECKBOX: accept_privacy_policy,
+        })
+
     # ---------------------------
     # Reads / waits
     # ---------------------------
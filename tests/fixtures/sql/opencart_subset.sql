@@ -0,0 +1,72 @@
+-- The OpenCart 4 tables (and columns) the suite's database utilities touch, in SQLite syntax.
+-- Loaded into an in-memory SQLite stand-in by tests/test_07_database.py.
+
+CREATE TABLE oc_customer (
+    customer_id INTEGER PRIMARY KEY, customer_group_id INTEGER, store_id INTEGER, language_id INTEGER,
+    firstname TEXT, lastname TEXT, email TEXT, telephone TEXT, custom_field TEXT, newsletter INTEGER,
+    password TEXT, safe INTEGER, token TEXT, code TEXT, ip TEXT, status INTEGER, date_added TEXT
+);
+CREATE TABLE oc_address (
+    address_id INTEGER PRIMARY KEY, customer_id INTEGER, firstname TEXT, lastname TEXT, company TEXT,
+    address_1 TEXT, address_2 TEXT, city TEXT, postcode TEXT, country_id INTEGER, zone_id INTEGER,
+    custom_field TEXT, `default` INTEGER
+);
+CREATE TABLE oc_cart (
+    cart_id INTEGER PRIMARY KEY, api_id INTEGER, customer_id INTEGER, session_id TEXT, product_id INTEGER,
+    subscription_plan_id INTEGER, `option` TEXT, quantity INTEGER, date_added TEXT
+);
+CREATE TABLE oc_customer_activity (
+    customer_activity_id INTEGER PRIMARY KEY, customer_id INTEGER, `key` TEXT, data TEXT, ip TEXT, date_added TEXT
+);
+CREATE TABLE oc_customer_ip (
+    customer_ip_id INTEGER PRIMARY KEY, customer_id INTEGER, store_id INTEGER, ip TEXT, country TEXT, date_added TEXT
+);
+CREATE TABLE oc_customer_online (
+    ip TEXT PRIMARY KEY, customer_id INTEGER, url TEXT, referer TEXT, date_added TEXT
+);
+CREATE TABLE oc_customer_wishlist (
+    customer_id INTEGER, product_id INTEGER, date_added TEXT, PRIMARY KEY (customer_id, product_id)
+);
+CREATE TABLE oc_customer_affiliate (
+    customer_id INTEGER PRIMARY KEY, company TEXT, status INTEGER, date_added TEXT
+);
+CREATE TABLE oc_customer_login (
+    customer_login_id INTEGER PRIMARY KEY, email TEXT, ip TEXT, total INTEGER, date_added TEXT, date_modified TEXT
+);
+CREATE TABLE oc_order (
+    order_id INTEGER PRIMARY KEY, subscription_id INTEGER, invoice_no INTEGER, invoice_prefix TEXT,
+    transaction_id TEXT, store_id INTEGER, store_name TEXT, store_url TEXT, customer_id INTEGER,
+    customer_group_id INTEGER, firstname TEXT, lastname TEXT, email TEXT, telephone TEXT, custom_field TEXT,
+    payment_address_id INTEGER, payment_firstname TEXT, payment_lastname TEXT, payment_company TEXT,
+    payment_address_1 TEXT, payment_address_2 TEXT, payment_city TEXT, payment_postcode TEXT,
+    payment_country TEXT, payment_country_id INTEGER, payment_zone TEXT, payment_zone_id INTEGER,
+    payment_address_format TEXT, payment_custom_field TEXT, payment_method TEXT,
+    shipping_address_id INTEGER, shipping_firstname TEXT, shipping_lastname TEXT, shipping_company TEXT,
+    shipping_address_1 TEXT, shipping_address_2 TEXT, shipping_city TEXT, shipping_postcode TEXT,
+    shipping_country TEXT, shipping_country_id INTEGER, shipping_zone TEXT, shipping_zone_id INTEGER,
+    shipping_address_format TEXT, shipping_custom_field TEXT, shipping_method TEXT,
+    comment TEXT, total NUMERIC, order_status_id INTEGER, affiliate_id INTEGER, commission NUMERIC,
+    marketing_id INTEGER, tracking TEXT, language_id INTEGER, language_code TEXT, currency_id INTEGER,
+    currency_code TEXT, currency_value NUMERIC, ip TEXT, forwarded_ip TEXT, user_agent TEXT,
+    accept_language TEXT, date_added TEXT, date_modified TEXT
+);
+CREATE TABLE oc_order_product (
+    order_product_id INTEGER PRIMARY KEY, order_id INTEGER, product_id INTEGER, master_id INTEGER, name TEXT,
+    model TEXT, quantity INTEGER, price NUMERIC, total NUMERIC, tax NUMERIC, reward INTEGER
+);
+CREATE TABLE oc_order_option (
+    order_option_id INTEGER PRIMARY KEY, order_id INTEGER, order_product_id INTEGER, name TEXT, value TEXT
+);
+CREATE TABLE oc_order_total (
+    order_total_id INTEGER PRIMARY KEY, order_id INTEGER, extension TEXT, code TEXT, title TEXT,
+    value NUMERIC, sort_order INTEGER
+);
+CREATE TABLE oc_order_history (
+    order_history_id INTEGER PRIMARY KEY, order_id INTEGER, order_status_id INTEGER, notify INTEGER,
+    comment TEXT, date_added TEXT
+);
+CREATE TABLE oc_product (product_id INTEGER PRIMARY KEY, model TEXT, price NUMERIC);
+CREATE TABLE oc_product_description (product_id INTEGER, language_id INTEGER, name TEXT);
+
+INSERT INTO oc_product VALUES (41, 'Product 14', 100.00), (44, 'Product 17', 1000.00);
+INSERT INTO oc_product_description VALUES (41, 1, 'iMac'), (44, 1, 'MacBook Air');
@@ -1,5 +1,3 @@
-import time
-from uuid import uuid4
 import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -11,12 +9,12 @@ from utils.soft_assert import SoftAssert
 
 @pytest.mark.registration
 @pytest.mark.ui
+@pytest.mark.db_isolation(scope="module")
 class TestRegistration:
     """Covers the main registration flows in OpenCart (success + common failure cases)."""
 
     WAIT_MEDIUM = 10
 
-    VALID_EMAIL = "validEmail@gmail.com"
     VALID_PASSWORD = "ValidPass123"
 
     # ---------------------------
@@ -33,9 +31,9 @@ class TestRegistration:
         page.navigate_to_registration()
         return page
 
-    def _register(self, page: RegistrationPage, first, last, email, password) -> None:
-        """Fills the form and submits the registration."""
-        page.fill_registration_form(first, last, email, password)
+    def _register(self, page: RegistrationPage, first, last, email, password, typing: bool = False) -> None:
+        """Fills the form and submits the registration (`typing` sends real keystrokes)."""
+        page.fill_registration_form(first, last, email, password, typing=typing)
         page.submit_registration()
 
     # ---------------------------
@@ -46,12 +44,12 @@ class TestRegistration:
     @pytest.mark.functional
     @pytest.mark.smoke
     @pytest.mark.regression
-    def test_01_register_with_valid_details(self, driver, request):
+    def test_01_register_with_valid_details(self, driver, request, unique_email):
         """Registers a new user with valid data and expects the success page."""
         soft = self._soft(driver, request)
         reg = self._open_registration(driver)
 
-        self._register(reg, "John", "Doe", self.VALID_EMAIL, self.VALID_PASSWORD)
+        self._register(reg, "John", "Doe", unique_email("register"), self.VALID_PASSWORD)
 
         WebDriverWait(driver, self.WAIT_MEDIUM).until(EC.url_contains("account/success"))
         soft.assert_true(
@@ -64,15 +62,17 @@ class TestRegistration:
     # Negative
     # ---------------------------
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.functional
     @pytest.mark.regression
-    def test_02_register_with_existing_email(self, driver, request):
+    def test_02_register_with_existing_email(self, driver, request, user_credentials):
         """Tries to register using an email that already exists and expects a warning."""
         soft = self._soft(driver, request)
         reg = self._open_registration(driver)
 
-        self._register(reg, "John", "Doe", self.VALID_EMAIL, self.VALID_PASSWORD)
+        email, password = user_credentials
+        self._register(reg, "John", "Doe", email, password)
 
         error_msg = WebDriverWait(driver, self.WAIT_MEDIUM).until(
             EC.visibility_of_element_located((By.CSS_SELECTOR, ".alert-danger"))
@@ -80,6 +80,7 @@ class TestRegistration:
         soft.assert_in("Warning: E-Mail Address is already registered!", error_msg)
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.functional
     @pytest.mark.regression
@@ -134,6 +135,7 @@ class TestRegistration:
         )
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.functional
     @pytest.mark.regression
@@ -154,15 +156,15 @@ class TestRegistration:
     @pytest.mark.security
     @pytest.mark.functional
     @pytest.mark.regression
-    def test_05_register_with_special_characters_in_name(self, driver, request):
+    def test_05_register_with_special_characters_in_name(self, driver, request, unique_email):
         """Tries special characters in name fields and confirms registration does not succeed."""
         soft = self._soft(driver, request)
         reg = self._open_registration(driver)
 
         initial_url = driver.current_url
-        email = f"specialchars_{uuid4().hex[:6]}@test.com"
+        email = unique_email("specialchars")
 
-        self._register(reg, "John$", "D@e", email, self.VALID_PASSWORD)
+        self._register(reg, "John$", "D@e", email, self.VALID_PASSWORD, typing=True)
 
         reg.wait.until(EC.url_changes(initial_url))
 
@@ -172,6 +174,7 @@ class TestRegistration:
         )
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.boundary
     @pytest.mark.functional
@@ -181,7 +184,7 @@ class TestRegistration:
         soft = self._soft(driver, request)
         reg = self._open_registration(driver)
 
-        self._register(reg, "   ", "   ", "   ", "   ")
+        self._register(reg, "   ", "   ", "   ", "   ", typing=True)
 
         wait = WebDriverWait(driver, self.WAIT_MEDIUM)
 
@@ -240,12 +243,12 @@ class TestRegistration:
             ("a" * 41, False),
         ],
     )
-    def test_07_password_length_boundaries(self, driver, request, password, should_pass):
+    def test_07_password_length_boundaries(self, driver, request, unique_email, password, should_pass):
         """Checks password boundary values and confirms success or the password error."""
         soft = self._soft(driver, request)
         reg = self._open_registration(driver)
 
-        email = f"boundary_{len(password)}_{int(time.time())}@test.com"
+        email = unique_email(f"boundary{len(password)}")
         self._register(reg, "John", "Doe", email, password)
 
         reg.wait.until(
@@ -281,13 +284,14 @@ class TestRegistration:
     @pytest.mark.security
     @pytest.mark.functional
     @pytest.mark.regression
-    def test_08_registration_while_logged_in(self, driver, request):
+    def test_08_registration_while_logged_in(self, driver, request, user_credentials):
         """Logs in first, then tries to access registration and confirms it’s blocked or fails."""
         soft = self._soft(driver, request)
+        email, password = user_credentials
 
         login = LoginPage(driver)
         login.open()
-        login.login(self.VALID_EMAIL, self.VALID_PASSWORD)
+        login.login(email, password)
 
         reg = self._open_registration(driver)
 
@@ -299,7 +303,7 @@ class TestRegistration:
             soft.assert_all()
             return
 
-        self._register(reg, "John", "Doe", self.VALID_EMAIL, self.VALID_PASSWORD)
+        self._register(reg, "John", "Doe", email, password)
 
         soft.assert_in("Warning: E-Mail Address is already registered!", driver.page_source)
         soft.assert_all()
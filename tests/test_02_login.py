@@ -11,14 +11,17 @@ from utils.soft_assert import SoftAssert
 class TestLogin:
     """Covers the main login flows in OpenCart (success, failures, and basic security checks)."""
 
-    VALID_EMAIL = "validEmail@gmail.com"
-    VALID_PASSWORD = "ValidPass123"
     WAIT_MEDIUM = 10
 
     # ---------------------------
     # Helpers
     # ---------------------------
 
+    @pytest.fixture(autouse=True)
+    def _credentials(self, user_credentials):
+        """Each xdist worker logs in with its own account, so lockouts never cross workers."""
+        self.VALID_EMAIL, self.VALID_PASSWORD = user_credentials
+
     def _soft(self, driver, request) -> SoftAssert:
         """Creates a SoftAssert instance for this test run."""
         return SoftAssert(driver, request)
@@ -91,6 +94,7 @@ class TestLogin:
     # Negative
     # ---------------------------
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.functional
     @pytest.mark.regression
@@ -109,6 +113,7 @@ class TestLogin:
         )
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.functional
     @pytest.mark.regression
@@ -130,6 +135,7 @@ class TestLogin:
         )
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.functional
     @pytest.mark.regression
@@ -149,6 +155,7 @@ class TestLogin:
         )
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.security
     @pytest.mark.functional
@@ -168,6 +175,7 @@ class TestLogin:
         )
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.security
     @pytest.mark.functional
@@ -185,19 +193,18 @@ class TestLogin:
         )
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.negative
     @pytest.mark.edge
     @pytest.mark.functional
     @pytest.mark.regression
-    def test_09_login_after_multiple_failed_attempts(self, driver, request):
+    def test_09_login_after_multiple_failed_attempts(self, driver, request, disposable_account):
         """Repeats failed logins and checks the app starts blocking or warning more aggressively."""
-        self._reset_attempts()
-
         soft = self._soft(driver, request)
         page = self._open_login(driver)
 
         for _ in range(5):
-            page.login(self.VALID_EMAIL, "WrongPass")
+            page.login(disposable_account.email, "WrongPass")
 
         page.wait_for_error_alert()
         msg = page.get_error_message().lower()
@@ -1,7 +1,5 @@
 import pytest
-from pages.login_page import LoginPage
 from pages.main_navigation_menu_page import NavigationPage
-from utils.db_utils import reset_login_attempts
 from utils.soft_assert import SoftAssert
 
 
@@ -10,13 +8,10 @@ from utils.soft_assert import SoftAssert
 class TestNavigation:
     """Checks the header navigation, category links, and account pages in OpenCart."""
 
-    USER_EMAIL = "validEmail@gmail.com"
-    USER_PASSWORD = "ValidPass123"
-
     @pytest.fixture()
     def nav(self, driver) -> NavigationPage:
-        """Provides the navigation page object."""
-        return NavigationPage(driver)
+        """Provides the navigation page object (clicking through the menu, which is under test here)."""
+        return NavigationPage(driver, via_ui=True)
 
     @pytest.fixture()
     def soft(self, driver, request) -> SoftAssert:
@@ -24,18 +19,8 @@ class TestNavigation:
         return SoftAssert(driver, request)
 
     @pytest.fixture()
-    def login(self, driver) -> LoginPage:
-        """Provides the login page object."""
-        return LoginPage(driver)
-
-    @pytest.fixture()
-    def authenticated(self, login, nav):
+    def authenticated(self, logged_in, nav):
         """Logs in and returns a navigation object on a stable authenticated page."""
-        reset_login_attempts(self.USER_EMAIL)
-
-        login.open()
-        login.login(self.USER_EMAIL, self.USER_PASSWORD)
-
         nav.open_account_dashboard()
         return nav
 
@@ -183,6 +168,7 @@ class TestNavigation:
     # Account / Authenticated
     # ---------------------------
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_14_account_dashboard_authenticated(self, authenticated, soft):
@@ -190,6 +176,7 @@ class TestNavigation:
         soft.assert_true(authenticated.is_content_visible(), "Account dashboard content should be visible.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_15_edit_account_authenticated(self, authenticated, soft):
@@ -199,6 +186,7 @@ class TestNavigation:
         soft.assert_true(authenticated.on_edit_account(), "Expected Edit Account page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_16_change_password_authenticated(self, authenticated, soft):
@@ -208,6 +196,7 @@ class TestNavigation:
         soft.assert_true(authenticated.on_change_password(), "Expected Change Password page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_17_payment_methods_authenticated(self, authenticated, soft):
@@ -217,6 +206,7 @@ class TestNavigation:
         soft.assert_true(authenticated.on_payment_methods(), "Expected Payment Methods page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_18_address_book_authenticated(self, authenticated, soft):
@@ -226,6 +216,7 @@ class TestNavigation:
         soft.assert_true(authenticated.on_address_book(), "Expected Address Book page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_19_wishlist_authenticated(self, authenticated, soft):
@@ -235,6 +226,7 @@ class TestNavigation:
         soft.assert_true(authenticated.on_account_wishlist(), "Expected Wishlist page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_20_order_history_authenticated(self, authenticated, soft):
@@ -244,6 +236,7 @@ class TestNavigation:
         soft.assert_true(authenticated.on_order_history(), "Expected Order History page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_21_subscriptions_authenticated(self, authenticated, soft):
@@ -253,6 +246,7 @@ class TestNavigation:
         soft.assert_true(authenticated.subscriptions_visible(), "Expected Subscriptions page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_22_downloads_authenticated(self, authenticated, soft):
@@ -262,6 +256,7 @@ class TestNavigation:
         soft.assert_true(authenticated.downloads_visible(), "Expected Downloads page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_23_reward_points_authenticated(self, authenticated, soft):
@@ -271,6 +266,7 @@ class TestNavigation:
         soft.assert_true(authenticated.on_reward_points(), "Expected Reward Points page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_24_return_requests_authenticated(self, authenticated, soft):
@@ -280,6 +276,7 @@ class TestNavigation:
         soft.assert_true(authenticated.on_return_requests(), "Expected Returns page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_25_transactions_authenticated(self, authenticated, soft):
@@ -289,6 +286,7 @@ class TestNavigation:
         soft.assert_true(authenticated.on_transactions(), "Expected Transactions page.")
         soft.assert_all()
 
+    @pytest.mark.no_js
     @pytest.mark.functional
     @pytest.mark.regression
     def test_26_affiliate_account_page_authenticated(self, authenticated, soft):
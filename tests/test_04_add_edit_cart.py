@@ -9,6 +9,13 @@ from pages.product_page import ProductPage
 from pages.cart_page import CartPage
 
 
+IPHONE_ID = 40
+CANON_EOS_5D_ID = 30
+APPLE_CINEMA_30_ID = 42
+MACBOOK_ID = 43
+MACBOOK_AIR_ID = 44
+
+
 def money_eq(actual: float | None, expected: str) -> bool:
     """Compares money values to 2 decimals, so price checks stay stable."""
     if actual is None:
@@ -100,20 +107,13 @@ class TestAddEditCartFunctionality:
     @pytest.mark.positive
     @pytest.mark.ui
     @pytest.mark.regression
-    def test_03_edit_quantity_in_cart(self, driver, request):
+    def test_03_edit_quantity_in_cart(self, driver, request, http_cart):
         """Edits quantity in the cart and checks the new value is applied."""
         soft_assert = SoftAssert(driver, request)
-        navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
 
-        navigation_page.open_home()
-        navigation_page.open_laptops_and_notebooks()
-
-        product_page.select_product("MacBook")
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        http_cart.add(MACBOOK_ID)
+        cart_page.navigate_to_cart()
 
         cart_page.update_quantity("MacBook", 2)
         cart_page.wait_for_product_quantity("MacBook", 2)
@@ -129,21 +129,13 @@ class TestAddEditCartFunctionality:
     @pytest.mark.positive
     @pytest.mark.ui
     @pytest.mark.regression
-    def test_04_remove_product_from_cart(self, driver, request):
+    def test_04_remove_product_from_cart(self, driver, request, http_cart):
         """Adds a product, removes it, and checks the cart becomes empty."""
         soft_assert = SoftAssert(driver, request)
-        navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
 
-        navigation_page.open_home()
-        navigation_page.open_cameras()
-
-        product_page.select_product("Canon EOS 5D")
-        product_page.select_required_dropdown_options()
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        http_cart.add(CANON_EOS_5D_ID)  # required colour option gets its first value
+        cart_page.navigate_to_cart()
         cart_page.remove_product("Canon EOS 5D")
 
         soft_assert.assert_false(
@@ -160,23 +152,20 @@ class TestAddEditCartFunctionality:
     @pytest.mark.positive
     @pytest.mark.ui
     @pytest.mark.regression
-    def test_05_cart_persists_after_login(self, driver, request):
+    def test_05_cart_persists_after_login(self, driver, request, user_credentials, http_cart):
         """Adds an item as a guest, logs in, and checks the item is still in the cart."""
-        reset_login_attempts("validEmail@gmail.com")
+        email, password = user_credentials
+        reset_login_attempts(email)
 
         soft_assert = SoftAssert(driver, request)
         navigation_page = NavigationPage(driver)
         login_page = LoginPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
 
         cart_url = CartPage.CART_URL
 
-        navigation_page.open_home()
-        product_page.select_product("iPhone")
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        http_cart.add(IPHONE_ID)
+        cart_page.navigate_to_cart()
 
         soft_assert.assert_true(
             "route=checkout/cart" in driver.current_url,
@@ -188,7 +177,7 @@ class TestAddEditCartFunctionality:
         )
 
         login_page.open()
-        login_page.login("validEmail@gmail.com", "ValidPass123")
+        login_page.login(email, password)
 
         navigation_page.open_cart()
         if "route=checkout/cart" not in driver.current_url:
@@ -238,22 +227,15 @@ class TestAddEditCartFunctionality:
     @pytest.mark.boundary
     @pytest.mark.ui
     @pytest.mark.regression
-    def test_07_cart_total_price_updates_correctly(self, driver, request):
+    def test_07_cart_total_price_updates_correctly(self, driver, request, http_cart):
         """Changes quantity and checks the grand total updates correctly."""
         soft_assert = SoftAssert(driver, request)
-        navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
 
         product_name = "MacBook Air"
 
-        navigation_page.open_home()
-        navigation_page.open_laptops_and_notebooks()
-
-        product_page.select_product(product_name)
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        http_cart.add(MACBOOK_AIR_ID)
+        cart_page.navigate_to_cart()
 
         cart_page.update_quantity(product_name, 2)
         cart_page.wait_for_product_quantity(product_name, 2)
@@ -299,20 +281,13 @@ class TestAddEditCartFunctionality:
     @pytest.mark.boundary
     @pytest.mark.ui
     @pytest.mark.regression
-    def test_09_edit_cart_to_zero_quantity_removes_product(self, driver, request, upload_file):
+    def test_09_edit_cart_to_zero_quantity_removes_product(self, driver, request, upload_file, http_cart):
         """Sets quantity to 0 and checks the cart shows as empty."""
         soft_assert = SoftAssert(driver, request)
-        navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
 
-        navigation_page.open_home()
-        product_page.select_product('Apple Cinema 30"')
-
-        product_page.fill_default_options(upload_file_path=upload_file)
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        http_cart.add(APPLE_CINEMA_30_ID, upload_file=upload_file)
+        cart_page.navigate_to_cart()
 
         cart_page.update_quantity('Apple Cinema 30"', 0)
 
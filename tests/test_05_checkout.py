@@ -3,15 +3,19 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
-from pages.login_page import LoginPage
 from pages.main_navigation_menu_page import NavigationPage
-from pages.product_page import ProductPage
-from utils.db_utils import reset_login_attempts
 from utils.soft_assert import SoftAssert
 
 
+IMAC_ID = 41
+MACBOOK_ID = 43
+MACBOOK_AIR_ID = 44
+HP_LP3065_ID = 47
+
+
 @pytest.mark.checkout
 @pytest.mark.ui
+@pytest.mark.db_isolation
 class TestCheckoutFlow:
     """Covers the main checkout flow in OpenCart, including happy paths and key edge cases."""
 
@@ -19,27 +23,18 @@ class TestCheckoutFlow:
     @pytest.mark.functional
     @pytest.mark.smoke
     @pytest.mark.regression
-    def test_01_happy_path_checkout_single_product(self, driver, request):
-        """Places an order with one product and confirms the success page is shown."""
+    def test_01_happy_path_checkout_single_product(self, driver, request, logged_in, http_cart):
+        """Places a one-product order through the new-address form and confirms the success page is shown.
+
+        This is the new-address checkout test; the other checkouts ship to the account's saved address."""
         soft_assert = SoftAssert(driver, request)
         wait = WebDriverWait(driver, 10)
 
-        login_page = LoginPage(driver)
-        navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
         checkout_page = CheckoutPage(driver)
 
-        login_page.open()
-        login_page.login("validEmail@gmail.com", "ValidPass123")
-
-        navigation_page.open_home()
-        navigation_page.open_laptops_and_notebooks()
-
-        product_page.select_product("HP LP3065")
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        http_cart.add(HP_LP3065_ID)  # delivery date option gets the form's default
+        cart_page.navigate_to_cart()
         cart_page.proceed_to_checkout()
 
         checkout_page.complete_new_address_checkout_flow()
@@ -54,33 +49,19 @@ class TestCheckoutFlow:
     @pytest.mark.positive
     @pytest.mark.functional
     @pytest.mark.regression
-    def test_02_checkout_with_multiple_products(self, driver, request):
+    def test_02_checkout_with_multiple_products(self, driver, request, logged_in, http_cart, seeded_customer):
         """Places an order with multiple products and confirms checkout still succeeds."""
         soft_assert = SoftAssert(driver, request)
         wait = WebDriverWait(driver, 10)
 
-        login_page = LoginPage(driver)
-        navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
         checkout_page = CheckoutPage(driver)
 
-        login_page.open()
-        login_page.login("validEmail@gmail.com", "ValidPass123")
-
-        navigation_page.open_home()
-        navigation_page.open_desktops_mac()
-        product_page.select_product("iMac")
-        product_page.add_to_cart()
-
-        navigation_page.open_laptops_and_notebooks()
-        product_page.select_product("MacBook Air")
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        http_cart.add_many({IMAC_ID: 1, MACBOOK_AIR_ID: 1})
+        cart_page.navigate_to_cart()
         cart_page.proceed_to_checkout()
 
-        checkout_page.complete_new_address_checkout_flow()
+        checkout_page.complete_saved_address_checkout_flow(seeded_customer.address_id)
 
         wait.until(EC.url_contains("route=checkout/success"))
         soft_assert.assert_true(
@@ -92,25 +73,14 @@ class TestCheckoutFlow:
     @pytest.mark.negative
     @pytest.mark.functional
     @pytest.mark.regression
-    def test_03_checkout_with_empty_cart(self, driver, request):
+    def test_03_checkout_with_empty_cart(self, driver, request, seeded_cart, logged_in):
         """Removes the only cart item and confirms checkout cannot proceed from an empty cart."""
-        reset_login_attempts("validEmail@gmail.com")
-
         soft_assert = SoftAssert(driver, request)
 
-        login_page = LoginPage(driver)
         navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
 
-        login_page.open()
-        login_page.login("validEmail@gmail.com", "ValidPass123")
-
-        navigation_page.open_home()
-        navigation_page.open_laptops_and_notebooks()
-
-        product_page.select_product("MacBook Air")
-        product_page.add_to_cart()
+        seeded_cart({MACBOOK_AIR_ID: 1})
 
         navigation_page.open_cart()
         cart_page.remove_product("MacBook Air")
@@ -126,27 +96,16 @@ class TestCheckoutFlow:
     @pytest.mark.positive
     @pytest.mark.functional
     @pytest.mark.regression
-    def test_04_edit_cart_quantity_then_checkout(self, driver, request):
+    def test_04_edit_cart_quantity_then_checkout(self, driver, request, logged_in, http_cart, seeded_customer):
         """Updates quantity in cart, then completes checkout and expects success."""
         soft_assert = SoftAssert(driver, request)
         wait = WebDriverWait(driver, 10)
 
-        login_page = LoginPage(driver)
-        navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
         checkout_page = CheckoutPage(driver)
 
-        login_page.open()
-        login_page.login("validEmail@gmail.com", "ValidPass123")
-
-        navigation_page.open_home()
-        navigation_page.open_laptops_and_notebooks()
-
-        product_page.select_product("MacBook")
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        http_cart.add(MACBOOK_ID)
+        cart_page.navigate_to_cart()
 
         cart_page.update_quantity("MacBook", 2)
         cart_page.wait_for_product_quantity("MacBook", 2)
@@ -158,7 +117,7 @@ class TestCheckoutFlow:
         )
 
         cart_page.proceed_to_checkout()
-        checkout_page.complete_new_address_checkout_flow()
+        checkout_page.complete_saved_address_checkout_flow(seeded_customer.address_id)
 
         wait.until(EC.url_contains("route=checkout/success"))
         soft_assert.assert_true(
@@ -169,28 +128,16 @@ class TestCheckoutFlow:
 
     @pytest.mark.functional
     @pytest.mark.regression
-    def test_05_cancel_checkout_and_verify_cart(self, driver, request):
+    def test_05_cancel_checkout_and_verify_cart(self, driver, request, logged_in, http_cart):
         """Starts checkout, goes back, and confirms the cart still has the product."""
-        reset_login_attempts("validEmail@gmail.com")
-
         soft_assert = SoftAssert(driver, request)
         wait = WebDriverWait(driver, 10)
 
-        login_page = LoginPage(driver)
         navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
 
-        login_page.open()
-        login_page.login("validEmail@gmail.com", "ValidPass123")
-
-        navigation_page.open_home()
-        navigation_page.open_laptops_and_notebooks()
-
-        product_page.select_product("HP LP3065")
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        http_cart.add(HP_LP3065_ID)
+        cart_page.navigate_to_cart()
         cart_page.proceed_to_checkout()
 
         driver.back()
@@ -207,44 +154,33 @@ class TestCheckoutFlow:
     @pytest.mark.positive
     @pytest.mark.functional
     @pytest.mark.regression
-    def test_06_checkout_then_view_order_history(self, driver, request):
-        """Completes checkout, then opens order history and checks an entry is shown."""
-        reset_login_attempts("validEmail@gmail.com")
+    def test_06_checkout_then_view_order_history(
+        self, driver, request, logged_in, http_cart, seeded_customer, order_verifier
+    ):
+        """Completes checkout, then confirms the order was recorded with the product in it.
 
+        The order is read at the --order-level (DB by default); `--order-level ui` goes through
+        the order history pages like a customer would."""
         soft_assert = SoftAssert(driver, request)
         wait = WebDriverWait(driver, 10)
 
-        login_page = LoginPage(driver)
-        navigation_page = NavigationPage(driver)
-        product_page = ProductPage(driver)
         cart_page = CartPage(driver)
         checkout_page = CheckoutPage(driver)
 
-        login_page.open()
-        login_page.login("validEmail@gmail.com", "ValidPass123")
-
-        navigation_page.open_home()
-        navigation_page.open_laptops_and_notebooks()
-
-        product_page.select_product("MacBook Air")
-        product_page.add_to_cart()
-
-        navigation_page.open_cart()
+        last_order_id = order_verifier.last_order_id()
+        http_cart.add(MACBOOK_AIR_ID)
+        cart_page.navigate_to_cart()
         cart_page.proceed_to_checkout()
 
-        checkout_page.complete_new_address_checkout_flow()
+        checkout_page.complete_saved_address_checkout_flow(seeded_customer.address_id)
 
         wait.until(EC.url_contains("route=checkout/success"))
         soft_assert.assert_true(checkout_page.is_order_successful(), "Order should be successful.")
 
-        driver.get("http://localhost/opencart/upload/index.php?route=account/account&language=en-gb")
-        navigation_page.open_order_history()
-
-        history_table = wait.until(
-            EC.visibility_of_element_located(("css selector", "#content .table-responsive"))
-        )
-        soft_assert.assert_true(
-            "#" in (history_table.text or ""),
-            "Expected order history to contain an order entry.",
-        )
+        order = order_verifier.wait_for_new_order(last_order_id)
+        line = order.product("MacBook Air")
+        soft_assert.assert_true(line is not None, f"Expected MacBook Air in order #{order.order_id}.")
+        soft_assert.assert_equal(line.quantity if line else None, 1, "Expected one MacBook Air ordered.")
+        soft_assert.assert_true(order.status, f"Expected order #{order.order_id} to have a status.")
+        soft_assert.assert_true(order.total and order.total > 0, f"Expected a positive total, got {order.total}.")
         soft_assert.assert_all()
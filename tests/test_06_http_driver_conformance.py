@@ -0,0 +1,381 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
+from utils.base_page import BasePage, wait_stats
+from utils.http_driver import HttpDriver
+from utils.route_map import MENU_JS, PRODUCT_LINKS_JS
+from utils.store_session import StoreSession
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "html")
+PAGES = {"account/login": "login.html", "account/register": "register.html", "product/category": "category.html"}
+VALID_EMAIL = "known@example.com"
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as handle:
+        return handle.read()
+
+
+class _MissingPage(BasePage):
+    """A page object whose element never appears."""
+
+    def read_missing(self) -> str:
+        return self.get_text((By.ID, "no-such-element"))
+
+
+class _StoreHandler(BaseHTTPRequestHandler):
+    """Serves the saved pages by route and answers the ajax routes the way OpenCart 4 does."""
+
+    def log_message(self, *args):
+        pass
+
+    def _route(self) -> str:
+        return parse_qs(urlparse(self.path).query).get("route", [""])[0]
+
+    def _send(self, body: str, content_type: str = "text/html", cookie: str = None) -> None:
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if cookie:
+            self.send_header("Set-Cookie", cookie)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        route = self._route()
+        if route == "account/account":
+            session = self.headers.get("Cookie", "")
+            self._send(f"<html><head><title>My Account</title></head><body><div id='content'>"
+                       f"<h1>My Account</h1><p id='session'>{session}</p></div></body></html>")
+        else:
+            self._send(_fixture(PAGES.get(route, "login.html")), cookie="OCSESSID=abc; Path=/")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+        value = lambda name: form.get(name, [""])[0]
+        route = self._route()
+
+        if route == "account/login.login":
+            if value("email") == VALID_EMAIL:
+                reply = {"redirect": "index.php?route=account/account&amp;language=en-gb"}
+            else:
+                reply = {"error": {"warning": "Warning: No match for E-Mail Address and/or Password."}}
+        elif route == "account/register.register":
+            errors = {}
+            if not value("firstname").strip():
+                errors["firstname"] = "First Name must be between 1 and 32 characters!"
+            if "@" not in value("email") or "." not in value("email").split("@")[-1]:
+                errors["email"] = "E-Mail Address does not appear to be valid!"
+            if value("agree") != "1":
+                errors["warning"] = "Warning: You must agree to the Privacy Policy!"
+            reply = {"error": errors} if errors else {"success": f"Welcome {value('firstname')}"}
+        elif route == "checkout/cart.add":
+            reply = {"success": f"Success: You have added product {value('product_id')}!"}
+        else:
+            reply = {"error": f"Unknown route {route}"}
+        self._send(json.dumps(reply), "application/json")
+
+
+@pytest.fixture(scope="module")
+def store_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StoreHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/index.php"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def http_driver():
+    driver = HttpDriver(timeout=5)
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture
+def saved_page(http_driver):
+    """Loads one of the saved pages into the driver without a server."""
+    def _load(name: str) -> HttpDriver:
+        http_driver.load_html(_fixture(name), f"http://localhost/opencart/upload/{name}")
+        return http_driver
+    return _load
+
+
+@pytest.mark.no_js
+class TestHttpDriverConformance:
+    """Checks that HttpDriver answers the WebDriver calls the page objects make the way Chrome does."""
+
+    # ---------------------------
+    # Finding elements
+    # ---------------------------
+
+    @pytest.mark.functional
+    def test_01_find_by_every_locator_strategy(self, saved_page):
+        driver = saved_page("login.html")
+
+        assert driver.find_element(By.ID, "input-email").get_attribute("name") == "email"
+        assert driver.find_element(By.NAME, "password").get_attribute("id") == "input-password"
+        assert driver.find_element(By.CSS_SELECTOR, "button.btn.btn-primary[type='submit']").text == "Login"
+        assert driver.find_element(By.XPATH, "//button[normalize-space()='Login']").tag_name == "button"
+        assert driver.find_element(By.LINK_TEXT, "Forgotten Password").tag_name == "a"
+        assert len(driver.find_elements(By.PARTIAL_LINK_TEXT, "Shopping")) == 1
+        assert len(driver.find_elements(By.CLASS_NAME, "form-control")) == 2
+        assert driver.find_elements(By.ID, "missing") == []
+        with pytest.raises(NoSuchElementException):
+            driver.find_element(By.ID, "missing")
+
+    @pytest.mark.functional
+    def test_02_find_inside_an_element(self, saved_page):
+        driver = saved_page("category.html")
+        first = driver.find_elements(By.CSS_SELECTOR, ".product-thumb")[0]
+
+        assert first.find_element(By.CSS_SELECTOR, "h4 a").text == "iPhone"
+        assert first.find_element(By.XPATH, ".//span[@class='price-new']").text == "$123.20"
+        assert driver.title == "Desktops"
+
+    # ---------------------------
+    # Text, attributes, visibility
+    # ---------------------------
+
+    @pytest.mark.functional
+    def test_03_text_follows_rendering(self, saved_page):
+        driver = saved_page("category.html")
+
+        assert driver.find_element(By.CSS_SELECTOR, ".price").text == "$123.20 Ex Tax: $101.00"
+        assert driver.find_element(By.CSS_SELECTOR, "table").text == "Brand Apple"
+        assert driver.find_element(By.CSS_SELECTOR, "p.note").text == ""
+        assert "Hidden" not in driver.find_element(By.ID, "content").text
+
+    @pytest.mark.functional
+    def test_04_visibility_rules(self, saved_page):
+        driver = saved_page("register.html")
+
+        assert driver.find_element(By.ID, "input-firstname").is_displayed()
+        assert not driver.find_element(By.ID, "error-firstname").is_displayed()  # invalid-feedback
+        assert not driver.find_element(By.ID, "input-customer-group-1").is_displayed()  # inside .d-none
+        assert not driver.find_element(By.NAME, "newsletter").is_displayed()  # type=hidden comes first
+        assert not driver.find_element(By.ID, "modal-information").is_displayed()
+        assert not driver.find_element(By.TAG_NAME, "title").is_displayed()
+
+    @pytest.mark.functional
+    def test_05_attributes_read_like_properties(self, saved_page):
+        driver = saved_page("category.html")
+        link = driver.find_element(By.LINK_TEXT, "iPhone")
+
+        assert link.get_attribute("href").startswith("http://localhost/opencart/upload/index.php?route=product")
+        assert link.get_dom_attribute("href").startswith("index.php?")
+        assert driver.find_element(By.NAME, "quantity").get_attribute("value") == "1"
+        assert driver.find_element(By.CSS_SELECTOR, "#menu a.see-all").get_attribute("missing") is None
+
+    # ---------------------------
+    # Forms without a server
+    # ---------------------------
+
+    @pytest.mark.functional
+    def test_06_typing_clearing_and_checkboxes(self, saved_page):
+        driver = saved_page("register.html")
+        field = driver.find_element(By.ID, "input-firstname")
+        field.send_keys("Jo", "hn")
+        assert field.get_attribute("value") == "John"
+        field.clear()
+        assert field.get_attribute("value") == ""
+
+        agree = driver.find_element(By.NAME, "agree")
+        agree.click()
+        assert agree.is_selected()
+        agree.send_keys(Keys.SPACE)
+        assert not agree.is_selected()
+
+    @pytest.mark.functional
+    def test_07_select_support(self, saved_page):
+        driver = saved_page("register.html")
+        country = Select(driver.find_element(By.ID, "input-country"))
+
+        assert country.first_selected_option.text == "--- Please Select ---"
+        country.select_by_visible_text("United States")
+        assert country.first_selected_option.get_attribute("value") == "223"
+        country.select_by_index(1)
+        assert driver.find_element(By.ID, "input-country").get_attribute("value") == "222"
+        assert not country.options[3].is_enabled()
+
+    @pytest.mark.functional
+    def test_08_base_page_helpers(self, saved_page):
+        driver = saved_page("register.html")
+        page = BasePage(driver, timeout=1)
+        page.fill_form({
+            (By.ID, "input-firstname"): "Ann",
+            (By.ID, "input-country"): "United Kingdom",
+            (By.NAME, "agree"): True,
+        })
+
+        assert driver.find_element(By.ID, "input-firstname").get_attribute("value") == "Ann"
+        assert driver.find_element(By.ID, "input-country").get_attribute("value") == "222"
+        assert driver.find_element(By.NAME, "agree").is_selected()
+        assert page.is_visible((By.ID, "input-email"))
+        assert not page.is_visible((By.ID, "error-email"), expect_absent=True)
+        infos = page.query_all((By.CSS_SELECTOR, ".invalid-feedback, h1"), attributes=("id",))
+        assert [(i.visible, i.attributes["id"]) for i in infos][:2] == [(True, None), (False, "error-firstname")]
+
+    @pytest.mark.functional
+    def test_09_store_scripts_are_emulated(self, saved_page):
+        driver = saved_page("category.html")
+
+        menu = driver.execute_script(MENU_JS)
+        assert menu[0]["name"] == "Desktops"
+        assert menu[0]["href"].endswith("path=20")
+        assert [c["name"] for c in menu[0]["children"]] == ["PC (0)", "Mac (1)"]
+        assert [p["name"] for p in driver.execute_script(PRODUCT_LINKS_JS)] == ["iPhone", "iMac"]
+        with pytest.raises(JavascriptException):
+            driver.execute_script("return window.innerWidth;")
+        with pytest.raises(WebDriverException):
+            driver.get_screenshot_as_base64()
+
+    # ---------------------------
+    # Against a server
+    # ---------------------------
+
+    @pytest.mark.functional
+    def test_10_ajax_login_failure_shows_alert(self, http_driver, store_url):
+        http_driver.get(f"{store_url}?route=account/login&language=en-gb")
+        http_driver.find_element(By.ID, "input-email").send_keys("nobody@example.com")
+        http_driver.find_element(By.ID, "input-password").send_keys("wrong", Keys.ENTER)
+
+        alert = EC.visibility_of_element_located((By.CSS_SELECTOR, "div.alert.alert-danger"))(http_driver)
+        assert "Warning: No match" in alert.text
+        assert "route=account/login" in http_driver.current_url
+
+    @pytest.mark.functional
+    def test_11_ajax_login_follows_redirect_with_session(self, http_driver, store_url):
+        http_driver.get(f"{store_url}?route=account/login&language=en-gb")
+        old_button = http_driver.find_element(By.CSS_SELECTOR, "#form-login button")
+        http_driver.find_element(By.ID, "input-email").send_keys(VALID_EMAIL)
+        old_button.click()
+
+        assert "route=account/account" in http_driver.current_url
+        assert http_driver.title == "My Account"
+        assert "OCSESSID=abc" in http_driver.find_element(By.ID, "session").text
+        assert http_driver.get_cookie("OCSESSID")["value"] == "abc"
+        with pytest.raises(StaleElementReferenceException):
+            old_button.is_displayed()
+
+    @pytest.mark.functional
+    def test_12_ajax_field_errors(self, http_driver, store_url):
+        http_driver.get(f"{store_url}?route=account/register&language=en-gb")
+        http_driver.find_element(By.ID, "input-email").send_keys("test@invalid")
+        http_driver.find_element(By.XPATH, "//button[normalize-space()='Continue']").click()
+
+        assert http_driver.find_element(By.ID, "error-firstname").text == "First Name must be between 1 and 32 characters!"
+        assert http_driver.find_element(By.ID, "error-email").is_displayed()
+        assert "is-invalid" in http_driver.find_element(By.ID, "input-email").get_attribute("class")
+        assert "Privacy Policy" in http_driver.find_element(By.CSS_SELECTOR, ".alert-danger").text
+
+        for name, text in (("input-firstname", "Ann"), ("input-email", ".com")):
+            http_driver.find_element(By.ID, name).send_keys(text)
+        http_driver.find_element(By.NAME, "agree").click()
+        http_driver.find_element(By.XPATH, "//button[normalize-space()='Continue']").click()
+
+        assert not http_driver.find_element(By.ID, "error-email").is_displayed()
+        assert http_driver.find_element(By.CSS_SELECTOR, ".alert-success").text == "Welcome Ann"
+
+    @pytest.mark.functional
+    def test_13_links_formaction_back_and_cookies(self, http_driver, store_url):
+        http_driver.get(f"{store_url}?route=product/category&language=en-gb&path=20")
+        http_driver.find_element(By.CSS_SELECTOR, "button[title='Add to Cart']").click()
+        assert "added product 40" in http_driver.find_element(By.CSS_SELECTOR, ".alert-success").text
+
+        http_driver.find_element(By.CSS_SELECTOR, "#menu .see-all").click()
+        assert "path=20" in http_driver.current_url
+        http_driver.find_element(By.LINK_TEXT, "Back to top").click()
+        assert "path=20" in http_driver.current_url
+
+        http_driver.get(f"{store_url}?route=account/account")
+        http_driver.back()
+        assert "route=product/category" in http_driver.current_url
+
+        http_driver.delete_cookie("OCSESSID")
+        http_driver.add_cookie({"name": "currency", "value": "EUR"})
+        assert [c["name"] for c in http_driver.get_cookies()] == ["currency"]
+
+    @pytest.mark.functional
+    def test_14_only_absence_checks_resolve_early(self, saved_page):
+        """is_visible waits out its timeout for a missing element; expect_absent and is_absent stop once the page settles."""
+        page = BasePage(saved_page("register.html"), timeout=1)
+        missing, hidden = (By.ID, "no-such-element"), (By.ID, "error-email")
+
+        start = time.monotonic()
+        assert not page.is_visible(missing, timeout=0.6)
+        assert time.monotonic() - start >= 0.6
+
+        start = time.monotonic()
+        assert not page.is_visible(missing, timeout=5, expect_absent=True)
+        assert page.is_absent(hidden, timeout=5)
+        assert time.monotonic() - start < 1
+        assert not page.is_absent((By.ID, "input-email"), timeout=0.3)
+
+    @pytest.mark.functional
+    def test_15_store_session_keeps_one_session_cookie(self, http_driver, store_url):
+        """Cookies copied from the browser are replaced, not duplicated, when the store sets them again."""
+        url = store_url.replace("127.0.0.1", "localhost")
+        http_driver.get(f"{url}?route=account/login")
+        session = StoreSession(http_driver, base_url=url)
+
+        for _ in range(2):
+            session.get("account/login")
+        assert session.http.cookies.get("OCSESSID") == "abc"
+        assert session.get("account/account").text.count("OCSESSID=") == 1
+
+    @pytest.mark.functional
+    def test_16_added_cookies_reach_a_dotless_host(self, http_driver, store_url):
+        url = store_url.replace("127.0.0.1", "localhost")
+        http_driver.get(f"{url}?route=account/login")
+        http_driver.add_cookie({"name": "currency", "value": "EUR"})
+
+        http_driver.get(f"{url}?route=account/account")
+        assert "currency=EUR" in http_driver.find_element(By.ID, "session").text
+
+    @pytest.mark.functional
+    def test_17_timed_out_waits_are_booked_to_the_page_method(self, saved_page):
+        """A wait that times out inside ElementHandle is reported under the page method that asked for it."""
+        page = _MissingPage(saved_page("login.html"), timeout=0.2)
+        before = dict(wait_stats.by_caller)
+
+        with pytest.raises(TimeoutException):
+            page.read_missing()
+
+        booked = {k for k, v in wait_stats.by_caller.items() if v != before.get(k)}
+        assert booked == {"_MissingPage.read_missing"}
+
+    @pytest.mark.functional
+    def test_18_positive_waits_use_the_page_timeout(self, saved_page):
+        """Without a timeout, is_visible and wait_until_any wait the page timeout; expect_absent resolves early."""
+        page = BasePage(saved_page("register.html"), timeout=0.8)
+        missing, shown = (By.ID, "no-such-element"), (By.ID, "input-email")
+
+        start = time.monotonic()
+        assert not page.is_visible(missing)
+        assert page.wait_until_any(missing) is None
+        assert time.monotonic() - start >= 1.6
+
+        start = time.monotonic()
+        assert page.wait_until_any(missing, shown) == shown
+        assert page.wait_until_any(missing, expect_absent=True) is None
+        assert time.monotonic() - start < 0.8
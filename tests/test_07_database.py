@@ -0,0 +1,251 @@
+import os
+import threading
+import pytest
+from utils.data_seeder import DataSeeder
+from utils.db_snapshot import SUITE_TABLES, DbSnapshot
+from utils.db_utils import Database, DbConfig, get_db, reset_login_attempts, set_db
+
+
+SCHEMA = os.path.join(os.path.dirname(__file__), "fixtures", "sql", "opencart_subset.sql")
+
+
+@pytest.fixture
+def sqlite_db():
+    """An in-memory SQLite stand-in with the OpenCart tables the utilities use, installed via set_db."""
+    db = Database(DbConfig(backend="sqlite"))
+    with open(SCHEMA, encoding="utf-8") as handle, db.connection() as conn:
+        conn.executescript(handle.read())
+    previous = set_db(db)
+    yield db
+    set_db(previous)
+    db.close()
+
+
+def _add_login_attempts(db, *emails):
+    with db.transaction() as tx:
+        tx.insert_many(
+            "customer_login",
+            ("email", "ip", "total", "date_added", "date_modified"),
+            [(email, "127.0.0.1", 3, "2024-01-01 00:00:00", "2024-01-01 00:00:00") for email in emails],
+        )
+
+
+def _write_store_activity(db, customer, order_id):
+    """Rows the store itself adds for an order and a login during UI checkouts."""
+    ip = f"10.0.{customer.customer_id}.{order_id}"
+    with db.transaction() as tx:
+        tx.execute("INSERT INTO {prefix}order_option (order_id, order_product_id, name, value) "
+                   "VALUES (%s, 0, 'Colour', 'Red')", (order_id,))
+        tx.execute("INSERT INTO {prefix}order_total (order_id, code, title, value, sort_order) "
+                   "VALUES (%s, 'total', 'Total', 100, 9)", (order_id,))
+        tx.execute("INSERT INTO {prefix}order_history (order_id, order_status_id, notify, comment) "
+                   "VALUES (%s, 1, 0, '')", (order_id,))
+        tx.execute("INSERT INTO {prefix}customer_ip (customer_id, ip) VALUES (%s, %s)", (customer.customer_id, ip))
+        tx.execute("INSERT INTO {prefix}customer_online (ip, customer_id) VALUES (%s, %s)", (ip, customer.customer_id))
+        tx.execute("INSERT INTO {prefix}customer_activity (customer_id, `key`) VALUES (%s, 'login')",
+                   (customer.customer_id,))
+        tx.execute("INSERT INTO {prefix}customer_login (email, total) VALUES (%s, 1)", (customer.email,))
+
+
+def _write_account_extras(db, customer):
+    """A wishlist entry and an affiliate account (one of each per customer)."""
+    with db.transaction() as tx:
+        tx.execute("INSERT INTO {prefix}customer_wishlist (customer_id, product_id) VALUES (%s, 41)",
+                   (customer.customer_id,))
+        tx.execute("INSERT INTO {prefix}customer_affiliate (customer_id, status) VALUES (%s, 1)",
+                   (customer.customer_id,))
+
+
+def _table_counts(db) -> dict:
+    return {t.name: db.query(f"SELECT COUNT(*) AS n FROM `{{prefix}}{t.name}`")[0]["n"] for t in SUITE_TABLES}
+
+
+def _emails(db) -> list:
+    return sorted(row["email"] for row in db.query("SELECT email FROM {prefix}customer_login"))
+
+
+class TestDatabase:
+    """Covers the Database layer on its SQLite stand-in (no store or MySQL needed)."""
+
+    @pytest.mark.functional
+    def test_01_prefix_and_placeholders_are_adapted(self, sqlite_db):
+        """`{prefix}` becomes the table prefix and %s works as the SQLite placeholder."""
+        assert sqlite_db.sql("SELECT * FROM {prefix}customer WHERE email = %s") == \
+            "SELECT * FROM oc_customer WHERE email = ?"
+        assert sqlite_db.execute(
+            "INSERT INTO {prefix}customer_login (email, total) VALUES (%s, %s)", ("a@example.com", 1)
+        ) == 1
+        assert sqlite_db.query("SELECT email, total FROM {prefix}customer_login") == [
+            {"email": "a@example.com", "total": 1}
+        ]
+
+    @pytest.mark.functional
+    def test_02_insert_many_writes_every_row(self, sqlite_db):
+        _add_login_attempts(sqlite_db, "a@example.com", "b@example.com", "c@example.com")
+        assert _emails(sqlite_db) == ["a@example.com", "b@example.com", "c@example.com"]
+
+    @pytest.mark.functional
+    def test_03_reset_login_attempts_in_one_batch(self, sqlite_db):
+        """Only the listed accounts are cleared, through the process-wide Database from set_db."""
+        assert get_db() is sqlite_db
+        _add_login_attempts(sqlite_db, "a@example.com", "b@example.com", "c@example.com")
+
+        assert reset_login_attempts() == 0
+        assert reset_login_attempts("a@example.com", "c@example.com") == 2
+        assert _emails(sqlite_db) == ["b@example.com"]
+
+    @pytest.mark.functional
+    def test_04_transaction_rolls_back_on_error(self, sqlite_db):
+        with pytest.raises(RuntimeError):
+            with sqlite_db.transaction() as tx:
+                tx.execute("INSERT INTO {prefix}customer_login (email) VALUES (%s)", ("a@example.com",))
+                raise RuntimeError("boom")
+        assert _emails(sqlite_db) == []
+
+    @pytest.mark.functional
+    def test_05_query_inside_a_transaction_shares_it(self, sqlite_db):
+        """db.query inside db.transaction() on the same thread sees the pending rows instead of deadlocking."""
+        seen = []
+
+        def nested():
+            with pytest.raises(RuntimeError):
+                with sqlite_db.transaction() as tx:
+                    tx.execute("INSERT INTO {prefix}customer_login (email) VALUES (%s)", ("a@example.com",))
+                    seen.extend(_emails(sqlite_db))
+                    raise RuntimeError("boom")
+
+        thread = threading.Thread(target=nested, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive(), "Nested query deadlocked on the connection lock."
+        assert seen == ["a@example.com"]
+        assert _emails(sqlite_db) == []
+
+
+class TestDataSeeder:
+    """Covers seeding and purging a namespace on the SQLite stand-in."""
+
+    @pytest.mark.functional
+    def test_01_seeded_customers_have_default_addresses(self, sqlite_db):
+        seeder = DataSeeder(sqlite_db, "w0")
+        first, second = seeder.seed_customers(2)
+        assert (first.email, second.email) == ("seed+w0-0@example.com", "seed+w0-1@example.com")
+        addresses = sqlite_db.query("SELECT address_id, customer_id FROM {prefix}address ORDER BY address_id")
+        assert addresses == [
+            {"address_id": first.address_id, "customer_id": first.customer_id},
+            {"address_id": second.address_id, "customer_id": second.customer_id},
+        ]
+
+    @pytest.mark.functional
+    def test_02_purge_leaves_no_rows_behind(self, sqlite_db):
+        """Every table holding the namespace's rows is emptied; another namespace is untouched."""
+        ours, theirs = DataSeeder(sqlite_db, "w0"), DataSeeder(sqlite_db, "w1")
+        for seeder in (ours, theirs):
+            for customer in seeder.seed_customers(2):
+                seeder.fill_cart(customer, {41: 1, 44: 2})
+                _write_store_activity(sqlite_db, customer, seeder.create_order(customer, {44: 1}))
+                _write_account_extras(sqlite_db, customer)
+        before = _table_counts(sqlite_db)
+        assert all(before.values())
+
+        ours.purge()
+
+        assert ours.customers == []
+        assert _table_counts(sqlite_db) == {name: count // 2 for name, count in before.items()}
+        theirs.purge()
+        assert not any(_table_counts(sqlite_db).values())
+
+
+@pytest.fixture
+def two_namespaces(sqlite_db):
+    """Two seeded namespaces, each customer with a cart, an order and the store's own rows."""
+    seeders = DataSeeder(sqlite_db, "w0"), DataSeeder(sqlite_db, "w1")
+    for seeder in seeders:
+        for customer in seeder.seed_customers(2):
+            seeder.fill_cart(customer, {41: 1})
+            _write_store_activity(sqlite_db, customer, seeder.create_order(customer, {44: 1}))
+            _write_account_extras(sqlite_db, customer)
+    return seeders
+
+
+def _dump(db) -> dict:
+    """Every row of every suite table (whole tables, so orphaned children show up too)."""
+    return {t.name: sorted(map(repr, db.query(f"SELECT * FROM `{{prefix}}{t.name}`"))) for t in SUITE_TABLES}
+
+
+def _dirty(db, seeder):
+    """What a test does to its namespace: adds rows, changes rows and deletes rows."""
+    first, second = seeder.customers[:2]
+    seeder.fill_cart(first, {44: 3})
+    _write_store_activity(db, second, seeder.create_order(second, {41: 2}))
+    db.execute("UPDATE {prefix}customer SET firstname = 'Changed' WHERE customer_id = %s", (first.customer_id,))
+    db.execute("UPDATE {prefix}customer_online SET url = 'changed' WHERE customer_id = %s", (first.customer_id,))
+    db.execute("UPDATE {prefix}customer_affiliate SET status = 0 WHERE customer_id = %s", (first.customer_id,))
+    db.execute("INSERT INTO {prefix}customer_wishlist (customer_id, product_id) VALUES (%s, 44)", (first.customer_id,))
+    db.execute("DELETE FROM {prefix}customer_wishlist WHERE customer_id = %s", (second.customer_id,))
+    db.execute("DELETE FROM {prefix}address WHERE customer_id = %s", (second.customer_id,))
+
+
+class TestDbSnapshot:
+    """Covers the db_isolation restore (both strategies) on the SQLite stand-in."""
+
+    @pytest.mark.functional
+    @pytest.mark.parametrize("strategy", ["diff", "reload"])
+    def test_01_restore_undoes_only_this_namespace(self, sqlite_db, two_namespaces, strategy):
+        """Added rows go, changed and deleted rows come back; another worker's changes stay."""
+        ours, theirs = two_namespaces
+        snapshot = DbSnapshot(sqlite_db, pattern="seed+w0-%", strategy=strategy)
+        snapshot.record()
+        _dirty(sqlite_db, theirs)
+        expected = _dump(sqlite_db)
+
+        _dirty(sqlite_db, ours)
+        assert _dump(sqlite_db) != expected
+        snapshot.restore()
+
+        assert _dump(sqlite_db) == expected
+        assert snapshot.rows_deleted and snapshot.rows_restored
+
+    @pytest.mark.functional
+    def test_02_reload_matches_diff(self, sqlite_db, two_namespaces):
+        ours, _ = two_namespaces
+        results = {}
+        for strategy in ("diff", "reload"):
+            snapshot = DbSnapshot(sqlite_db, pattern="seed+w0-%", strategy=strategy)
+            snapshot.record()
+            _dirty(sqlite_db, ours)
+            snapshot.restore()
+            results[strategy] = _dump(sqlite_db)
+        assert results["diff"] == results["reload"]
+
+    @pytest.mark.functional
+    @pytest.mark.parametrize("strategy", ["diff", "reload"])
+    def test_03_kept_keys_survive(self, sqlite_db, two_namespaces, strategy):
+        """Accounts seeded after the baseline (pool leases) stay; the rows a test gave them go."""
+        ours, _ = two_namespaces
+        snapshot = DbSnapshot(sqlite_db, pattern="seed+w0-%", strategy=strategy, keep=ours.seeded_keys)
+        snapshot.record()
+        leased, = ours.seed_customers(1)
+        ours.fill_cart(leased, {41: 1})
+
+        snapshot.restore()
+
+        assert sqlite_db.query("SELECT email FROM {prefix}customer WHERE customer_id = %s",
+                               (leased.customer_id,)) == [{"email": leased.email}]
+        assert sqlite_db.query("SELECT address_id FROM {prefix}address WHERE customer_id = %s",
+                               (leased.customer_id,)) == [{"address_id": leased.address_id}]
+        assert sqlite_db.query("SELECT cart_id FROM {prefix}cart WHERE customer_id = %s",
+                               (leased.customer_id,)) == []
+
+    @pytest.mark.functional
+    def test_04_unchanged_tables_are_skipped(self, sqlite_db, two_namespaces):
+        snapshot = DbSnapshot(sqlite_db, pattern="seed+w0-%")
+        snapshot.record()
+        _dirty(sqlite_db, two_namespaces[1])
+
+        snapshot.restore()
+
+        assert snapshot.stats() == {
+            "restores": 1, "seconds": snapshot.seconds, "rows_deleted": 0, "rows_restored": 0,
+            "tables_skipped": len(SUITE_TABLES),
+        }
@@ -0,0 +1,50 @@
+import base64
+import os
+import pytest
+from utils.screenshots import ScreenshotWriter
+
+
+class _Screen:
+    """Stands in for a driver: always shows the same screen."""
+
+    def __init__(self, content: bytes = b"same screen"):
+        self.data = base64.b64encode(content).decode("ascii")
+
+    def get_screenshot_as_base64(self) -> str:
+        return self.data
+
+
+class TestScreenshotWriter:
+    """Covers content-addressed screenshot storage (no browser needed)."""
+
+    @pytest.mark.functional
+    def test_01_identical_screens_are_stored_once(self, tmp_path):
+        writer = ScreenshotWriter(str(tmp_path))
+        first = writer.capture(_Screen(), "t1")
+        writer.flush()
+        second = writer.capture(_Screen(), "t2")
+        writer.flush()
+
+        assert first == second
+        assert os.listdir(tmp_path) == [os.path.basename(first)]
+        assert writer.stats()["duplicates"] == 1
+
+    @pytest.mark.functional
+    def test_02_failed_write_is_not_counted_as_stored(self, tmp_path):
+        """After a failed write the next identical capture is written again, not deduplicated."""
+        blocked = tmp_path / "blocked"
+        blocked.write_text("a file where the screenshot directory should be")
+        writer = ScreenshotWriter(str(blocked))
+
+        writer.capture(_Screen(), "t1")
+        writer.flush()
+        writer.capture(_Screen(), "t2")
+        writer.flush()
+        assert writer.stats()["write_errors"] == 2
+        assert writer.stats()["duplicates"] == 0
+
+        writer.directory = str(tmp_path / "screenshots")
+        path = writer.capture(_Screen(), "t3")
+        writer.flush()
+        assert os.path.exists(tmp_path / path)
+        assert writer.stats()["write_errors"] == 2
@@ -1,86 +1,317 @@
+import os
+import sys
+import time
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.ui import WebDriverWait
+from utils.command_hooks import register_read_only_script
+from utils.dom_query import query_all, to_script_locator
+from utils.element_handle import ElementHandle
+from utils.network_idle import install_tracker, tracker_status
+from utils.step_timing import instrument_public_methods, step_recorder, timed_step
 from selenium.common.exceptions import (
-    TimeoutException,
     ElementClickInterceptedException,
+    TimeoutException,
     StaleElementReferenceException,
+    WebDriverException,
 )
 
 
+DEFAULT_TIMEOUT = 15
+SHORT_TIMEOUT = 5
+POLL_INTERVAL = 0.1
+NETWORK_QUIET_MS = 250
+DOM_QUIET_MS = 150
+
+
+class WaitStats:
+    """Collects the time spent in explicit waits that timed out (elements that never appeared)."""
+
+    def __init__(self):
+        self.timeouts = 0
+        self.seconds = 0.0
+        self.by_caller = {}
+
+    def record(self, caller: str, seconds: float) -> None:
+        """Adds one timed-out wait to the totals."""
+        self.timeouts += 1
+        self.seconds += seconds
+        entry = self.by_caller.setdefault(caller, {"count": 0, "seconds": 0.0})
+        entry["count"] += 1
+        entry["seconds"] += seconds
+
+    def as_dict(self) -> dict:
+        """Returns the totals in a form that can be sent from xdist workers."""
+        return {"timeouts": self.timeouts, "seconds": self.seconds, "by_caller": self.by_caller}
+
+
+wait_stats = WaitStats()
+
+
+class TrackedWait(WebDriverWait):
+    """WebDriverWait that reports time lost to timeouts into the session wait stats."""
+
+    def until(self, method, message: str = ""):
+        start = time.monotonic()
+        try:
+            return super().until(method, message)
+        except TimeoutException:
+            wait_stats.record(_caller_label(), time.monotonic() - start)
+            raise
+        finally:
+            step_recorder.add_wait(time.monotonic() - start)
+
+    def until_not(self, method, message: str = ""):
+        start = time.monotonic()
+        try:
+            return super().until_not(method, message)
+        except TimeoutException:
+            wait_stats.record(_caller_label(), time.monotonic() - start)
+            raise
+        finally:
+            step_recorder.add_wait(time.monotonic() - start)
+
+
+_HELPER_FILES = {__file__, ElementHandle.__init__.__code__.co_filename, instrument_public_methods.__code__.co_filename}
+
+
+def _caller_label() -> str:
+    """Names the first page-object or test frame outside the wait helpers (e.g. 'CartPage.wait_for_ready')."""
+    frame = sys._getframe(2)
+    while frame and frame.f_code.co_filename in _HELPER_FILES:
+        frame = frame.f_back
+    if frame is None:
+        return "unknown"
+    owner = frame.f_locals.get("self")
+    name = frame.f_code.co_name
+    if owner is not None:
+        return f"{type(owner).__name__}.{name}"
+    return f"{os.path.basename(frame.f_code.co_filename)}:{name}"
+
+
 class BasePage:
-    """Common Selenium helpers used by all page objects (waits, clicks, typing, and basic checks)."""
+    """Common Selenium helpers used by all page objects (waits, clicks, typing, and basic checks).
+
+    The driver runs without implicit waits: every wait here is explicit and bounded by `timeout`,
+    and `find_all` / `is_present` return immediately so negative probes never block."""
 
-    def __init__(self, driver):
+    def __init__(self, driver, timeout: float = DEFAULT_TIMEOUT):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 15)
+        self.timeout = timeout
+        self.wait = TrackedWait(driver, timeout)
+        install_tracker(driver)
+
+    def __init_subclass__(cls, **kwargs):
+        # Every public page-object method is timed as a step (see utils/step_timing).
+        super().__init_subclass__(**kwargs)
+        instrument_public_methods(cls)
 
     # ---------------------------
     # Find / wait helpers
     # ---------------------------
 
-    def find_element(self, locator):
+    def _wait_for(self, timeout=None, **kwargs) -> TrackedWait:
+        """Returns the page wait, or a new one when a per-call timeout or options are given."""
+        if timeout is None and not kwargs:
+            return self.wait
+        return TrackedWait(self.driver, self.timeout if timeout is None else timeout, **kwargs)
+
+    def find_element(self, locator, timeout=None):
         """Returns the element once it is visible."""
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        return self._wait_for(timeout).until(EC.visibility_of_element_located(locator))
 
-    def find_present(self, locator):
+    def find_present(self, locator, timeout=None):
         """Returns the element once it exists in the DOM."""
-        return self.wait.until(EC.presence_of_element_located(locator))
+        return self._wait_for(timeout).until(EC.presence_of_element_located(locator))
 
-    def find_clickable(self, locator):
+    def find_clickable(self, locator, timeout=None):
         """Returns the element once it can be clicked."""
-        return self.wait.until(EC.element_to_be_clickable(locator))
+        return self._wait_for(timeout).until(EC.element_to_be_clickable(locator))
+
+    def locate(self, locator, *, visible: bool = False, clickable: bool = False, timeout=None) -> ElementHandle:
+        """Returns a handle that finds the element once (present, visible, or clickable) and reuses it."""
+        condition = (
+            EC.element_to_be_clickable if clickable
+            else EC.visibility_of_element_located if visible
+            else EC.presence_of_element_located
+        )
+        return ElementHandle(self, locator, condition, timeout)
+
+    def _handle(self, target) -> ElementHandle:
+        """Accepts a locator, a WebElement, or a handle and returns a handle."""
+        if isinstance(target, ElementHandle):
+            return target
+        if isinstance(target, tuple):
+            return self.locate(target)
+        return ElementHandle(self, element=target)
+
+    def find_all(self, locator):
+        """Returns all matching elements right now (no waiting, empty list when none)."""
+        return self.driver.find_elements(*locator)
+
+    def is_present(self, locator) -> bool:
+        """True when at least one matching element exists right now (no waiting)."""
+        return bool(self.find_all(locator))
+
+    # ---------------------------
+    # Visibility checks (absence resolves early once the page is stable)
+    # ---------------------------
+
+    PAGE_STABLE_JS = register_read_only_script(
+        "return document.readyState === 'complete'"
+        " && (!window.jQuery || window.jQuery.active === 0)"
+        " && (!window.__netTracker || window.__netTracker.inflight === 0);"
+    )
+
+    def is_page_stable(self) -> bool:
+        """True when the document has loaded and no XHR/fetch request is in flight."""
+        try:
+            return bool(self.driver.execute_script(self.PAGE_STABLE_JS))
+        except WebDriverException:
+            return False
 
-    def is_visible(self, locator):
-        """Returns True if the element becomes visible within the wait timeout."""
+    def _visible_now(self, locator) -> bool:
+        """True when the first matching element is displayed right now."""
         try:
-            self.wait.until(EC.visibility_of_element_located(locator))
-            return True
+            elements = self.find_all(locator)
+            return bool(elements) and elements[0].is_displayed()
+        except StaleElementReferenceException:
+            return False
+
+    def _poll_until_settled(self, check, timeout=None):
+        """Polls `check(settled)` until it returns something other than None.
+
+        `settled` becomes True once the page was stable on two polls in a row, so checks can
+        give a final answer without waiting for the full timeout. Returns None on timeout."""
+        start = time.monotonic()
+        deadline = start + (SHORT_TIMEOUT if timeout is None else timeout)
+        stable_polls = 0
+        try:
+            while True:
+                stable_polls = stable_polls + 1 if self.is_page_stable() else 0
+                result = check(stable_polls >= 2)
+                if result is not None:
+                    return result
+                if time.monotonic() >= deadline:
+                    wait_stats.record(_caller_label(), time.monotonic() - start)
+                    return None
+                time.sleep(POLL_INTERVAL)
+        finally:
+            step_recorder.add_wait(time.monotonic() - start)
+
+    def _visibility_timeout(self, timeout, expect_absent: bool):
+        """Positive waits get the page timeout; expected-absent checks the short budget."""
+        if timeout is not None:
+            return timeout
+        return SHORT_TIMEOUT if expect_absent else self.timeout
+
+    def is_visible(self, locator, timeout=None, *, expect_absent: bool = False) -> bool:
+        """True as soon as the element is visible; False only once the timeout (the page timeout) runs out.
+
+        Pass expect_absent=True when False is the expected answer: it then also returns False as
+        soon as the page settles without the element (within SHORT_TIMEOUT). Page stability cannot
+        see fade-ins or setTimeout inserts, so callers waiting for an element to appear keep the full wait."""
+        result = self._poll_until_settled(
+            lambda settled: True if self._visible_now(locator) else (False if settled and expect_absent else None),
+            self._visibility_timeout(timeout, expect_absent),
+        )
+        return bool(result)
+
+    def is_absent(self, locator, timeout=None) -> bool:
+        """True once the page has settled and the element is not visible; False if it stays visible."""
+        result = self._poll_until_settled(
+            lambda settled: True if settled and not self._visible_now(locator) else None,
+            timeout,
+        )
+        return bool(result)
+
+    def wait_for_page_stable(self, timeout=None) -> bool:
+        """Waits until the page is stable (loaded, no AJAX in flight). False if it never settles."""
+        return bool(self._poll_until_settled(lambda settled: True if settled else None, timeout))
+
+    def _wait_for_quiet(self, quiet_key: str, quiet_ms: int, timeout=None) -> bool:
+        def _quiet(driver) -> bool:
+            status = tracker_status(driver)
+            return bool(status) and status["loaded"] and status["inflight"] == 0 and status[quiet_key] >= quiet_ms
+
+        try:
+            return self._wait_for(timeout, poll_frequency=POLL_INTERVAL).until(_quiet)
         except TimeoutException:
             return False
 
+    def wait_for_network_idle(self, quiet_ms: int = NETWORK_QUIET_MS, timeout=None) -> bool:
+        """Waits until no XHR/fetch request has been in flight for `quiet_ms`. False if it never gets there.
+
+        The quiet window also covers AJAX chains, where the next request starts from the previous callback."""
+        return self._wait_for_quiet("network_quiet_ms", quiet_ms, timeout)
+
+    def wait_for_dom_stable(self, quiet_ms: int = DOM_QUIET_MS, timeout=None) -> bool:
+        """Waits until the network is idle and the DOM has not changed for `quiet_ms`. False if it never settles."""
+        return self._wait_for_quiet("dom_quiet_ms", quiet_ms, timeout)
+
+    def wait_until_any(self, *locators, timeout=None, expect_absent: bool = False):
+        """Returns the first locator whose element becomes visible, or None when none appears in time.
+
+        Meant for success-or-error outcomes: it returns as soon as either one shows. With
+        expect_absent=True it also gives up once the page settles without any of them."""
+        def _check(settled):
+            for locator in locators:
+                if self._visible_now(locator):
+                    return locator
+            return False if settled and expect_absent else None
+
+        return self._poll_until_settled(_check, self._visibility_timeout(timeout, expect_absent)) or None
+
+    def query_all(self, locator, attributes=(), root=None) -> list:
+        """Returns ElementInfo (text, visibility, rect, attributes) for every match in one round trip."""
+        return query_all(self.driver, locator, attributes, root)
+
     def get_elements_text(self, locator):
         """Returns a list of non-empty text values from a list of elements."""
-        elements = self.driver.find_elements(*locator)
-        return [el.text.strip() for el in elements if (el.text or "").strip()]
+        return [info.text for info in self.query_all(locator) if info.text]
+
+    def any_visible_text_contains(self, locator, needle: str, *, ignore_case: bool = False) -> bool:
+        """True when a visible match of the locator contains the given text (one round trip)."""
+        if ignore_case:
+            needle = needle.lower()
+        return any(
+            info.visible and needle in (info.text.lower() if ignore_case else info.text)
+            for info in self.query_all(locator)
+        )
 
     # ---------------------------
-    # Scroll / click helpers
+    # Scroll / click helpers (timed as steps too, so they show up in the command profile)
     # ---------------------------
 
+    @timed_step("BasePage._scroll_into_view")
     def _scroll_into_view(self, target):
-        """Scrolls the page to bring a locator or element into view."""
-        element = self.find_present(target) if isinstance(target, tuple) else target
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({block:'center', inline:'center'});",
-            element,
-        )
+        """Scrolls the page to bring a locator, element, or handle into view."""
+        self._handle(target).scroll_into_view()
 
+    @timed_step("BasePage._scroll_and_click")
     def _scroll_and_click(self, locator):
-        """Scrolls to an element and clicks it."""
-        self.find_present(locator)
-        self._scroll_into_view(locator)
-        self._click_when_clickable(locator)
+        """Scrolls to an element and clicks it (one lookup, one script)."""
+        self._handle(locator).click()
 
+    @timed_step("BasePage._safe_click")
     def _safe_click(self, element, timeout: int = 10) -> None:
-        """Clicks a WebElement with a small retry for stale/intercept issues."""
-        wait = WebDriverWait(
-            self.driver,
-            timeout,
-            ignored_exceptions=(StaleElementReferenceException,),
-        )
-
-        wait.until(lambda d: element.is_displayed() and element.is_enabled())
-        ActionChains(self.driver).move_to_element(element).pause(0.05).perform()
+        """Clicks a WebElement once the page is network-idle and the element is displayed and enabled.
 
+        Falls back to a JS click when another element would receive the native click."""
+        self.wait_for_network_idle(timeout=timeout)
+        self._wait_for(timeout, ignored_exceptions=(StaleElementReferenceException,)).until(
+            lambda d: element.is_displayed() and element.is_enabled()
+        )
+        handle = self._handle(element)
         try:
-            element.click()
+            handle.click(native=True)
         except ElementClickInterceptedException:
-            ActionChains(self.driver).move_to_element(element).pause(0.1).click(element).perform()
+            handle.click(scroll=False)
 
+    @timed_step("BasePage._dismiss_overlays")
     def _dismiss_overlays(self):
         """Tries to close dropdowns/overlays that can block clicks."""
         try:
@@ -89,12 +320,12 @@ class BasePage:
         except Exception:
             pass
 
+    @timed_step("BasePage._click_when_clickable")
     def _click_when_clickable(self, locator):
         """Clicks an element once present. Uses JS click to avoid intercept issues."""
-        self.find_present(locator)
-        el = self.driver.find_element(*locator)
-        self.driver.execute_script("arguments[0].click();", el)
+        self._handle(locator).click(scroll=False)
 
+    @timed_step("BasePage._select_default_options")
     def _select_default_options(self):
         """Selects the first real option in all product option dropdowns."""
         select_elements = self.driver.find_elements(By.XPATH, "//select[contains(@id, 'input-option')]")
@@ -107,25 +338,86 @@ class BasePage:
     # Form helpers
     # ---------------------------
 
+    FILL_FORM_JS = """
+var fields = arguments[0], found = [];
+function findFirst(by, value) {
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(value);
+}
+function optionFor(select, wanted) {
+    return Array.prototype.find.call(select.options, function (o) {
+        return o.value === wanted || o.text.trim() === wanted;
+    });
+}
+for (var i = 0; i < fields.length; i++) {
+    var el = findFirst(fields[i][0], fields[i][1]);
+    if (!el || (el.tagName === 'SELECT' && !optionFor(el, fields[i][2]))) { return false; }
+    found.push(el);
+}
+found.forEach(function (el, i) {
+    var value = fields[i][2];
+    if (el.type === 'checkbox' || el.type === 'radio') {
+        el.checked = !!value;
+    } else if (el.tagName === 'SELECT') {
+        el.value = optionFor(el, value).value;
+    } else {
+        var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return true;
+"""
+
+    def fill_form(self, values: dict, *, typing: bool = False, timeout=None) -> None:
+        """Fills inputs, textareas, selects (by value or visible text) and checkboxes from {locator: value}.
+
+        By default everything is set in one script call once every field (and select option) exists,
+        dispatching input/change events so the page's own handlers still run. `typing=True` types
+        each text field key by key instead, for tests that need real keystrokes."""
+        if typing:
+            for locator, value in values.items():
+                field = self.locate(locator)
+                if isinstance(value, bool):
+                    if field.is_selected() != value:
+                        field.click()
+                elif field.element.tag_name == "select":
+                    self._wait_for(timeout, ignored_exceptions=(StaleElementReferenceException,)).until(
+                        lambda d: self._select_option(self.locate(locator), value)
+                    )
+                else:
+                    self.enter_text(locator, value)
+            return
+
+        fields = [[*to_script_locator(locator), value] for locator, value in values.items()]
+        self._wait_for(timeout).until(lambda d: d.execute_script(self.FILL_FORM_JS, fields))
+
+    def _select_option(self, field: ElementHandle, wanted: str) -> bool:
+        """Selects the option whose visible text or value matches. False while it is not there yet."""
+        select = Select(field.element)
+        for option in select.options:
+            if option.text.strip() == wanted or option.get_attribute("value") == wanted:
+                select.select_by_value(option.get_attribute("value"))
+                return True
+        return False
+
     def enter_text(self, locator, text):
         """Clears the field and types the given value."""
-        element = self.find_element(locator)
-        self._scroll_into_view(element)
-        element.clear()
-        element.send_keys(text)
+        field = self.locate(locator, visible=True).scroll_into_view()
+        field.type(text, clear_first=True)
 
+    @timed_step("BasePage._type")
     def _type(self, locator, value, clear_first=False):
         """Types into a field. Can optionally clear first."""
-        element = self.find_present(locator)
-        if clear_first:
-            element.clear()
-        element.send_keys(value)
+        self._handle(locator).type(value, clear_first=clear_first)
 
+    @timed_step("BasePage._toggle")
     def _toggle(self, locator):
         """Toggles a checkbox/radio using JS click."""
-        element = self.find_present(locator)
-        self._scroll_into_view(element)
-        self.driver.execute_script("arguments[0].click();", element)
+        self._handle(locator).click()
 
     # ---------------------------
     # Simple wrappers
@@ -137,8 +429,11 @@ class BasePage:
 
     def get_text(self, locator):
         """Returns visible text from an element."""
-        return self.find_element(locator).text.strip()
+        return self.locate(locator, visible=True).text.strip()
 
     def get_attribute(self, locator, attribute):
         """Returns an element attribute value."""
-        return self.find_element(locator).get_attribute(attribute)
+        return self.locate(locator, visible=True).get_attribute(attribute)
+
+
+instrument_public_methods(BasePage)
@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+import weakref
+from dataclasses import dataclass, replace
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+
+# Hosts the store is served from; every other host is unresolvable when third-party requests are blocked.
+APP_HOSTS = ("localhost", "127.0.0.1")
+
+BASE_PREFS = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "autofill.profile_enabled": False,
+    "autofill.credit_card_enabled": False,
+}
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    """How a Chrome instance is started: rendering, window, what it downloads, and its profile dir."""
+    name: str
+    headless: bool = False
+    window_size: tuple = None  # None = maximised
+    block_images: bool = False
+    block_fonts: bool = False
+    block_third_party: bool = False
+    page_load_strategy: str = "normal"
+    disable_dev_shm: bool = False
+    user_data_template: str = None
+    disk_cache_dir: str = None
+    performance_log: bool = False
+
+    def with_headless(self) -> "LaunchProfile":
+        return replace(self, headless=True, window_size=self.window_size or (1920, 1080))
+
+    def options(self, user_data_dir: str = None) -> Options:
+        """Builds the ChromeOptions for this profile."""
+        options = Options()
+        options.page_load_strategy = self.page_load_strategy
+
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.window_size:
+            options.add_argument("--window-size={},{}".format(*self.window_size))
+        else:
+            options.add_argument("--start-maximized")
+        if self.disable_dev_shm:
+            options.add_argument("--disable-dev-shm-usage")
+        if self.block_fonts:
+            options.add_argument("--disable-remote-fonts")
+        if self.block_third_party:
+            excluded = ", ".join(f"EXCLUDE {host}" for host in APP_HOSTS)
+            options.add_argument(f"--host-resolver-rules=MAP * ~NOTFOUND, {excluded}")
+        if user_data_dir:
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+        if self.disk_cache_dir:
+            options.add_argument(f"--disk-cache-dir={self.disk_cache_dir}")
+        if self.performance_log:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        prefs = dict(BASE_PREFS)
+        if self.block_images:
+            prefs["profile.managed_default_content_settings.images"] = 2
+        options.add_experimental_option("prefs", prefs)
+        return options
+
+    def launch(self):
+        """Starts Chrome with this profile.
+
+        A user-data template is copied per browser (Chrome locks its profile dir); the copy is
+        removed once the driver object is garbage collected or the session ends."""
+        user_data_dir = None
+        if self.user_data_template and os.path.isdir(self.user_data_template):
+            user_data_dir = tempfile.mkdtemp(prefix="chrome-profile-")
+            shutil.copytree(self.user_data_template, user_data_dir, dirs_exist_ok=True)
+
+        driver = webdriver.Chrome(options=self.options(user_data_dir))
+        driver._launch_profile = self.name
+        if user_data_dir:
+            weakref.finalize(driver, shutil.rmtree, user_data_dir, True)
+        return driver
+
+
+# `full` is the original headed, maximised browser; `fast` is for tests that don't look at rendering.
+PROFILES = {
+    "full": LaunchProfile("full"),
+    "fast": LaunchProfile(
+        "fast",
+        headless=True,
+        window_size=(1920, 1080),
+        block_images=True,
+        block_fonts=True,
+        block_third_party=True,
+        page_load_strategy="eager",
+        disable_dev_shm=True,
+        user_data_template=os.getenv("CHROME_USER_DATA_TEMPLATE") or None,
+    ),
+}
+
+
+def profile_for(item, choice: str, headless: bool = False) -> LaunchProfile:
+    """Picks the profile for a test: a `browser_profile("name")` marker wins, then the
+    command-line choice, where `auto` keeps full rendering for `ui` tests only."""
+    marker = item.get_closest_marker("browser_profile")
+    if marker is not None:
+        name = marker.args[0]
+    elif choice == "auto":
+        name = "full" if item.get_closest_marker("ui") else "fast"
+    else:
+        name = choice
+
+    profile = PROFILES[name]
+    return profile.with_headless() if headless and not profile.headless else profile
@@ -0,0 +1,97 @@
+import time
+from selenium.webdriver.remote.command import Command
+
+
+READ_ONLY_COMMANDS = frozenset({
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+    Command.GET_ELEMENT_TEXT,
+    Command.GET_ELEMENT_TAG_NAME,
+    Command.GET_ELEMENT_ATTRIBUTE,
+    Command.GET_ELEMENT_PROPERTY,
+    Command.GET_ELEMENT_RECT,
+    Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.IS_ELEMENT_ENABLED,
+    Command.IS_ELEMENT_SELECTED,
+    Command.GET_CURRENT_URL,
+    Command.GET_TITLE,
+    Command.GET_PAGE_SOURCE,
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE,
+    Command.W3C_GET_WINDOW_HANDLES,
+    Command.GET_WINDOW_RECT,
+    Command.GET_ALL_COOKIES,
+    Command.GET_COOKIE,
+    Command.SCREENSHOT,
+    Command.ELEMENT_SCREENSHOT,
+    Command.GET_TIMEOUTS,
+    "isElementDisplayed",  # HttpDriver's own command (Chrome answers is_displayed through a script)
+})
+
+SCRIPT_COMMANDS = frozenset({Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC})
+
+# Selenium's own read helpers (is_displayed, get_attribute, get_property) run through execute_script.
+_READ_ONLY_SCRIPT_PREFIXES = ("/* isDisplayed */", "/* getAttribute */", "return arguments[0][arguments[1]]")
+_read_only_scripts = set()
+
+
+def register_read_only_script(script: str) -> str:
+    """Marks a script as side-effect free so it does not count as a page change. Returns the script."""
+    _read_only_scripts.add(script)
+    return script
+
+
+def is_read_only(command: str, params=None) -> bool:
+    """True when a WebDriver command only reads state (cannot change the page)."""
+    if command in READ_ONLY_COMMANDS:
+        return True
+    if command in SCRIPT_COMMANDS:
+        script = (params or {}).get("script") or ""
+        return script in _read_only_scripts or script.startswith(_READ_ONLY_SCRIPT_PREFIXES)
+    return False
+
+
+# ---------------------------
+# Listeners around driver.execute
+# ---------------------------
+
+def add_command_listener(driver, listener) -> None:
+    """Calls listener(command, params, seconds) after every WebDriver command the driver sends."""
+    listeners = driver.__dict__.get("_command_listeners")
+    if listeners is None:
+        listeners = driver._command_listeners = []
+        original = driver.execute
+
+        def _execute(command, params=None):
+            start = time.perf_counter()
+            try:
+                return original(command, params)
+            finally:
+                elapsed = time.perf_counter() - start
+                for callback in list(listeners):
+                    callback(command, params, elapsed)
+
+        driver.execute = _execute
+    listeners.append(listener)
+
+
+def remove_command_listener(driver, listener) -> None:
+    """Stops calling a listener added with add_command_listener."""
+    listeners = driver.__dict__.get("_command_listeners") or []
+    if listener in listeners:
+        listeners.remove(listener)
+
+
+def page_generation(driver) -> int:
+    """Counter that changes whenever the driver sends a command that can alter the page
+    (navigation, clicks, typing, non-read-only scripts). Useful to invalidate cached reads."""
+    if "_page_generation" not in driver.__dict__:
+        driver._page_generation = 0
+
+        def _bump(command, params, seconds):
+            if not is_read_only(command, params):
+                driver._page_generation += 1
+
+        add_command_listener(driver, _bump)
+    return driver._page_generation
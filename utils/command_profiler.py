@@ -0,0 +1,98 @@
+from selenium.webdriver.remote.command import Command
+from utils.command_hooks import SCRIPT_COMMANDS, add_command_listener
+from utils.step_timing import step_recorder
+
+
+# Latency histogram bucket upper bounds (ms). Histograms add up across xdist workers, percentiles don't.
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float("inf"))
+
+_SCRIPT_LABELS = (
+    ("/* isDisplayed */", "isDisplayed"),
+    ("/* getAttribute */", "getAttribute"),
+    ("return arguments[0][arguments[1]]", "getProperty"),
+)
+
+TEST_CODE = "(test code)"
+
+
+def command_label(command: str, params=None) -> str:
+    """Command name, with Selenium's own helper scripts split out (e.g. 'w3cExecuteScript:isDisplayed')."""
+    if command in SCRIPT_COMMANDS:
+        script = (params or {}).get("script") or ""
+        for prefix, label in _SCRIPT_LABELS:
+            if script.startswith(prefix):
+                return f"{command}:{label}"
+    return command
+
+
+def percentile(buckets: dict, fraction: float) -> float:
+    """Upper bound (ms) of the histogram bucket holding the given fraction of samples."""
+    total = sum(buckets.values())
+    if not total:
+        return 0.0
+    seen = 0
+    for bound in sorted(buckets, key=float):
+        seen += buckets[bound]
+        if seen >= fraction * total:
+            return float(bound)
+    return float("inf")
+
+
+class CommandProfiler:
+    """Counts WebDriver round trips by command type, per test and per page-object method,
+    with a latency histogram per command type."""
+
+    def __init__(self):
+        self.commands = {}
+        self.by_method = {}
+        self.by_test = {}
+        self._test = None
+
+    def watch(self, driver) -> None:
+        """Starts profiling a driver (once per driver)."""
+        if "_command_profiler" not in driver.__dict__:
+            driver._command_profiler = self
+            add_command_listener(driver, self._on_command)
+
+    def start_test(self, nodeid: str) -> None:
+        self._test = self.by_test.setdefault(nodeid, {})
+
+    def finish_test(self) -> int:
+        """Ends the current test and returns how many commands it sent."""
+        test, self._test = self._test, None
+        return sum((test or {}).values())
+
+    def _on_command(self, command, params, seconds) -> None:
+        if command == Command.SCREENSHOT:
+            return  # failure evidence, not page-object chatter
+        label = command_label(command, params)
+        ms = seconds * 1000
+
+        entry = self.commands.setdefault(label, {"count": 0, "seconds": 0.0, "buckets": {}})
+        entry["count"] += 1
+        entry["seconds"] += seconds
+        bound = next(b for b in BUCKETS_MS if ms <= b)
+        entry["buckets"][str(bound)] = entry["buckets"].get(str(bound), 0) + 1
+
+        method = self.by_method.setdefault(step_recorder.current_step() or TEST_CODE, {})
+        method[label] = method.get(label, 0) + 1
+        if self._test is not None:
+            self._test[label] = self._test.get(label, 0) + 1
+
+    def stats(self) -> dict:
+        """Returns the counters in a form that can be sent from xdist workers and summed."""
+        return {"commands": self.commands, "by_method": self.by_method, "by_test": self.by_test}
+
+
+def chattiest(by_method: dict, steps=None, limit: int = 15) -> list:
+    """Returns [(method, own, including_nested, {command: count})] ranked by commands the method sends itself.
+
+    `steps` is the step-timing summary, whose command counts include nested page-object calls."""
+    ranked = sorted(by_method.items(), key=lambda kv: sum(kv[1].values()), reverse=True)
+    return [
+        (method, sum(counts.values()), (steps or {}).get(method, {}).get("commands", sum(counts.values())), counts)
+        for method, counts in ranked[:limit]
+    ]
+
+
+command_profiler = CommandProfiler()
@@ -0,0 +1,202 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from utils.db_snapshot import SUITE_TABLES
+from utils.db_utils import Database, placeholders
+from utils.logger import get_logger
+
+
+def namespaced_email(namespace: str, label) -> str:
+    """Email inside a seeding namespace; purge() removes any customer registered with one."""
+    return f"seed+{namespace}-{label}@example.com"
+
+
+@dataclass(frozen=True)
+class SeededCustomer:
+    """A customer (with one default address) written straight into the store database."""
+    customer_id: int
+    email: str
+    password: str
+    firstname: str
+    lastname: str
+    address_id: int
+
+
+class DataSeeder:
+    """Creates customers, addresses, carts and orders directly in the OpenCart tables.
+
+    Every record belongs to a namespace (one per xdist worker), encoded in the customer email,
+    so workers never touch each other's data and purge() removes exactly what this namespace
+    created - including leftovers from an interrupted run."""
+
+    PASSWORD = "SeedPass123"
+
+    # Store defaults from a stock OpenCart install.
+    CUSTOMER_GROUP_ID = 1
+    LANGUAGE_ID = 1
+    COUNTRY_ID = 222   # United Kingdom
+    ZONE_ID = 3563     # Greater London
+    ORDER_STATUS_ID = 1  # Pending
+
+    def __init__(self, db: Database, namespace: str):
+        self.db = db
+        self.namespace = namespace
+        self.customers = []
+        self.logger = get_logger()
+
+    # ---------------------------
+    # Customers / addresses
+    # ---------------------------
+
+    def email_for(self, index: int) -> str:
+        return namespaced_email(self.namespace, index)
+
+    def seed_customers(self, count: int, password: str = PASSWORD) -> list:
+        """Bulk-inserts `count` customers and their default addresses in one transaction."""
+        start = len(self.customers)
+        emails = [self.email_for(i) for i in range(start, start + count)]
+        now = self._now()
+        # OpenCart accepts an md5 password hash and upgrades it to bcrypt on first login.
+        password_hash = hashlib.md5(password.encode()).hexdigest()
+
+        with self.db.transaction() as tx:
+            tx.insert_many(
+                "customer",
+                ("customer_group_id", "store_id", "language_id", "firstname", "lastname", "email",
+                 "telephone", "custom_field", "newsletter", "password", "safe", "token", "code", "ip",
+                 "status", "date_added"),
+                [(self.CUSTOMER_GROUP_ID, 0, self.LANGUAGE_ID, "Seed", f"Customer{start + i}", email,
+                  "0123456789", "", 0, password_hash, 0, "", "", "", 1, now)
+                 for i, email in enumerate(emails)],
+            )
+            ids = {
+                row["email"]: row["customer_id"]
+                for row in tx.query(
+                    f"SELECT customer_id, email FROM {{prefix}}customer WHERE email IN ({placeholders(emails)})",
+                    emails,
+                )
+            }
+            tx.insert_many(
+                "address",
+                ("customer_id", "firstname", "lastname", "company", "address_1", "address_2", "city",
+                 "postcode", "country_id", "zone_id", "custom_field", "default"),
+                [(ids[email], "Seed", f"Customer{start + i}", "", "1 Seed Street", "", "London",
+                  "EC1A 1BB", self.COUNTRY_ID, self.ZONE_ID, "", 1)
+                 for i, email in enumerate(emails)],
+            )
+            addresses = {
+                row["customer_id"]: row["address_id"]
+                for row in tx.query(
+                    f"SELECT address_id, customer_id FROM {{prefix}}address "
+                    f"WHERE customer_id IN ({placeholders(ids)})",
+                    list(ids.values()),
+                )
+            }
+
+        created = [
+            SeededCustomer(ids[email], email, password, "Seed", f"Customer{start + i}", addresses[ids[email]])
+            for i, email in enumerate(emails)
+        ]
+        self.customers.extend(created)
+        self.logger.info(f"Seeder[{self.namespace}]: created {count} customers.")
+        return created
+
+    def seeded_keys(self) -> dict:
+        """{table: primary keys} of the customers and addresses this seeder currently holds."""
+        return {
+            "customer": [c.customer_id for c in self.customers],
+            "address": [c.address_id for c in self.customers],
+        }
+
+    # ---------------------------
+    # Carts / orders
+    # ---------------------------
+
+    def fill_cart(self, customer: SeededCustomer, items: dict) -> None:
+        """Replaces the customer's saved cart with {product_id: quantity}; OpenCart loads it on login."""
+        now = self._now()
+        with self.db.transaction() as tx:
+            tx.execute("DELETE FROM {prefix}cart WHERE customer_id = %s", (customer.customer_id,))
+            tx.insert_many(
+                "cart",
+                ("api_id", "customer_id", "session_id", "product_id", "subscription_plan_id", "option",
+                 "quantity", "date_added"),
+                [(0, customer.customer_id, "", product_id, 0, "[]", quantity, now)
+                 for product_id, quantity in items.items()],
+            )
+
+    def clear_cart(self, customer: SeededCustomer) -> None:
+        self.db.execute("DELETE FROM {prefix}cart WHERE customer_id = %s", (customer.customer_id,))
+
+    def create_order(self, customer: SeededCustomer, items: dict) -> int:
+        """Writes a pending order for {product_id: quantity}, shipped to the customer's address."""
+        now = self._now()
+        address = ("Seed", customer.lastname, "", "1 Seed Street", "", "London", "EC1A 1BB",
+                   "United Kingdom", self.COUNTRY_ID, "Greater London", self.ZONE_ID, "", "[]")
+
+        with self.db.transaction() as tx:
+            products = tx.query(
+                "SELECT p.product_id, p.model, p.price, pd.name FROM {prefix}product p "
+                "JOIN {prefix}product_description pd ON pd.product_id = p.product_id AND pd.language_id = %s "
+                f"WHERE p.product_id IN ({placeholders(items)})",
+                [self.LANGUAGE_ID, *items],
+            )
+            total = sum(float(p["price"]) * items[p["product_id"]] for p in products)
+
+            tx.insert_many(
+                "order",
+                ("subscription_id", "invoice_no", "invoice_prefix", "transaction_id", "store_id", "store_name",
+                 "store_url", "customer_id", "customer_group_id", "firstname", "lastname", "email", "telephone",
+                 "custom_field",
+                 "payment_address_id", "payment_firstname", "payment_lastname", "payment_company",
+                 "payment_address_1", "payment_address_2", "payment_city", "payment_postcode", "payment_country",
+                 "payment_country_id", "payment_zone", "payment_zone_id", "payment_address_format",
+                 "payment_custom_field", "payment_method",
+                 "shipping_address_id", "shipping_firstname", "shipping_lastname", "shipping_company",
+                 "shipping_address_1", "shipping_address_2", "shipping_city", "shipping_postcode",
+                 "shipping_country", "shipping_country_id", "shipping_zone", "shipping_zone_id",
+                 "shipping_address_format", "shipping_custom_field", "shipping_method",
+                 "comment", "total", "order_status_id", "affiliate_id", "commission", "marketing_id", "tracking",
+                 "language_id", "language_code", "currency_id", "currency_code", "currency_value", "ip",
+                 "forwarded_ip", "user_agent", "accept_language", "date_added", "date_modified"),
+                [(0, 0, "INV-", "", 0, "Your Store", "http://localhost/opencart/upload/",
+                  customer.customer_id, self.CUSTOMER_GROUP_ID, customer.firstname, customer.lastname,
+                  customer.email, "0123456789", "[]",
+                  customer.address_id, *address,
+                  json.dumps({"name": "Cash On Delivery", "code": "cod.cod"}),
+                  customer.address_id, *address,
+                  json.dumps({"name": "Flat Shipping Rate", "code": "flat.flat"}),
+                  f"seed:{self.namespace}", total, self.ORDER_STATUS_ID, 0, 0, 0, "",
+                  self.LANGUAGE_ID, "en-gb", 1, "GBP", 1.0, "127.0.0.1",
+                  "", "data-seeder", "en-GB", now, now)],
+            )
+            order_id = tx.query(
+                "SELECT MAX(order_id) AS order_id FROM `{prefix}order` WHERE customer_id = %s",
+                (customer.customer_id,),
+            )[0]["order_id"]
+
+            tx.insert_many(
+                "order_product",
+                ("order_id", "product_id", "master_id", "name", "model", "quantity", "price", "total", "tax",
+                 "reward"),
+                [(order_id, p["product_id"], 0, p["name"], p["model"], items[p["product_id"]], p["price"],
+                  float(p["price"]) * items[p["product_id"]], 0, 0)
+                 for p in products],
+            )
+        return order_id
+
+    # ---------------------------
+    # Cleanup
+    # ---------------------------
+
+    def purge(self) -> None:
+        """Deletes every record in this namespace in a single transaction."""
+        pattern = namespaced_email(self.namespace, "%")
+        with self.db.transaction() as tx:
+            for table in SUITE_TABLES:
+                tx.execute(f"DELETE FROM `{{prefix}}{table.name}` WHERE {table.scope}", (pattern,))
+        self.customers.clear()
+
+    def _now(self) -> str:
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,199 @@
+import time
+from dataclasses import dataclass
+from utils.db_utils import Database, placeholders
+
+
+STRATEGIES = ("diff", "reload")
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """A table the suite writes to: its unique key, the rows this process owns, and whether
+    existing rows are changed in place (so their contents are compared) or only ever added."""
+    name: str
+    key: object  # column name, or a tuple of columns for a composite key (mutable tables only)
+    scope: str = ""  # WHERE fragment with one %s for the namespace email pattern; "" = the whole table
+    mutable: bool = False
+
+    def __post_init__(self):
+        if len(self.keys) > 1 and not self.mutable:
+            raise ValueError(f"{self.name}: a composite key has no high-water mark; declare the table mutable.")
+
+    @property
+    def keys(self) -> tuple:
+        return (self.key,) if isinstance(self.key, str) else tuple(self.key)
+
+    def identity(self, row: dict):
+        """The row's key value (a tuple for composite keys)."""
+        return row[self.key] if isinstance(self.key, str) else tuple(row[c] for c in self.key)
+
+
+_CUSTOMER_IDS = "customer_id IN (SELECT customer_id FROM {prefix}customer WHERE email LIKE %s)"
+_ORDER_IDS = "order_id IN (SELECT order_id FROM `{prefix}order` WHERE email LIKE %s)"
+
+# Every table holding a namespace's rows, children before parents (their scope is found through
+# the parent rows). DataSeeder.purge() deletes in this order too.
+SUITE_TABLES = (
+    TableSpec("order_product", "order_product_id", _ORDER_IDS),
+    TableSpec("order_option", "order_option_id", _ORDER_IDS),
+    TableSpec("order_total", "order_total_id", _ORDER_IDS),
+    TableSpec("order_history", "order_history_id", _ORDER_IDS),
+    TableSpec("order", "order_id", "email LIKE %s"),
+    TableSpec("cart", "cart_id", _CUSTOMER_IDS, mutable=True),
+    TableSpec("address", "address_id", _CUSTOMER_IDS, mutable=True),
+    TableSpec("customer_activity", "customer_activity_id", _CUSTOMER_IDS),
+    TableSpec("customer_ip", "customer_ip_id", _CUSTOMER_IDS),
+    TableSpec("customer_online", "ip", _CUSTOMER_IDS, mutable=True),
+    TableSpec("customer_wishlist", ("customer_id", "product_id"), _CUSTOMER_IDS, mutable=True),
+    TableSpec("customer_affiliate", "customer_id", _CUSTOMER_IDS, mutable=True),
+    TableSpec("customer_login", "customer_login_id", "email LIKE %s", mutable=True),
+    TableSpec("customer", "customer_id", "email LIKE %s", mutable=True),
+)
+
+
+class DbSnapshot:
+    """Records the suite's tables once and puts them back after a test, in one transaction.
+
+    Only rows matching `pattern` (the worker's namespaced emails) are recorded and restored, so
+    xdist workers sharing one database never undo each other's work; pattern=None covers whole
+    tables. `diff` deletes rows added since the baseline (key above the high-water mark) and
+    rewrites only the changed rows of mutable tables, skipping tables whose count and top key
+    are unchanged. `reload` deletes every owned row and inserts the baseline copy again.
+    `keep` returns {table: keys} created after the baseline that must survive (leased accounts)."""
+
+    def __init__(self, db: Database, tables=SUITE_TABLES, pattern: str = None, strategy: str = "diff",
+                 keep=None):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown restore strategy: {strategy} (expected one of {', '.join(STRATEGIES)})")
+        self.db = db
+        self.tables = tuple(tables)
+        self.pattern = pattern
+        self.strategy = strategy
+        self.keep = keep or dict
+        self._baseline = {}
+        self.restores = 0
+        self.seconds = 0.0
+        self.rows_deleted = 0
+        self.rows_restored = 0
+        self.tables_skipped = 0
+
+    # ---------------------------
+    # SQL helpers
+    # ---------------------------
+
+    def _where(self, spec: TableSpec, extra: str = "", params=()):
+        """WHERE clause and parameters for the owned rows of a table (plus an extra condition)."""
+        clauses, values = [], []
+        if spec.scope and self.pattern is not None:
+            clauses.append(spec.scope)
+            values.append(self.pattern)
+        if extra:
+            clauses.append(extra)
+            values.extend(params)
+        return (" WHERE " + " AND ".join(f"({c})" for c in clauses)) if clauses else "", values
+
+    @staticmethod
+    def _key_in(spec: TableSpec, keys) -> tuple:
+        """Condition (and parameters) matching the rows with these keys."""
+        keys = list(keys)
+        if len(spec.keys) == 1:
+            return f"`{spec.key}` IN ({placeholders(keys)})", keys
+        row = " AND ".join(f"`{column}` = %s" for column in spec.keys)
+        return " OR ".join([f"({row})"] * len(keys)), [value for key in keys for value in key]
+
+    def _rows(self, runner, spec: TableSpec) -> dict:
+        where, params = self._where(spec)
+        rows = runner.query(f"SELECT * FROM `{{prefix}}{spec.name}`{where}", params)
+        return {spec.identity(row): row for row in rows}
+
+    def _fingerprint(self, runner, spec: TableSpec) -> tuple:
+        where, params = self._where(spec)
+        row = runner.query(
+            f"SELECT COUNT(*) AS n, MAX(`{spec.key}`) AS top FROM `{{prefix}}{spec.name}`{where}", params
+        )[0]
+        return int(row["n"] or 0), row["top"] or 0
+
+    def _delete(self, tx, spec: TableSpec, extra: str, params) -> int:
+        where, values = self._where(spec, extra, params)
+        return tx.execute(f"DELETE FROM `{{prefix}}{spec.name}`{where}", values)
+
+    # ---------------------------
+    # Baseline / restore
+    # ---------------------------
+
+    def record(self) -> None:
+        """Takes the baseline: fingerprints of every table, plus row copies where restore needs them."""
+        baseline = {}
+        with self.db.transaction() as tx:
+            for spec in self.tables:
+                copy = spec.mutable or self.strategy == "reload"
+                baseline[spec.name] = (
+                    None if spec.mutable else self._fingerprint(tx, spec),
+                    self._rows(tx, spec) if copy else None,
+                )
+        self._baseline = baseline
+
+    def restore(self) -> None:
+        """Puts every table back to the baseline (rows listed by `keep` excepted)."""
+        if not self._baseline:
+            raise RuntimeError("DbSnapshot.restore() called before record().")
+        start = time.perf_counter()
+        keep = self.keep()
+        with self.db.transaction() as tx:
+            for spec in self.tables:
+                kept = set(keep.get(spec.name, ()))
+                if self.strategy == "reload":
+                    self._reload(tx, spec, kept)
+                else:
+                    self._diff(tx, spec, kept)
+        self.restores += 1
+        self.seconds += time.perf_counter() - start
+
+    def _diff(self, tx, spec: TableSpec, kept: set) -> None:
+        fingerprint, rows = self._baseline[spec.name]
+        if not spec.mutable:
+            if self._fingerprint(tx, spec) == fingerprint:
+                self.tables_skipped += 1
+                return
+            extra, params = f"`{spec.key}` > %s", [fingerprint[1]]
+            if kept:
+                extra += f" AND `{spec.key}` NOT IN ({placeholders(kept)})"
+                params += list(kept)
+            self.rows_deleted += self._delete(tx, spec, extra, params)
+            return
+
+        current = self._rows(tx, spec)
+        added = [key for key in current if key not in rows and key not in kept]
+        changed = [key for key, row in rows.items() if current.get(key) != row]
+        if not added and not changed:
+            self.tables_skipped += 1
+            return
+        stale = added + [key for key in changed if key in current]
+        if stale:
+            self.rows_deleted += self._delete(tx, spec, *self._key_in(spec, stale))
+        self._insert(tx, spec, [rows[key] for key in changed])
+
+    def _reload(self, tx, spec: TableSpec, kept: set) -> None:
+        _, rows = self._baseline[spec.name]
+        extra, params = "", []
+        if kept:
+            match, params = self._key_in(spec, kept)
+            extra = f"NOT ({match})"
+        self.rows_deleted += self._delete(tx, spec, extra, params)
+        self._insert(tx, spec, [row for key, row in rows.items() if key not in kept])
+
+    def _insert(self, tx, spec: TableSpec, rows: list) -> None:
+        if rows:
+            columns = list(rows[0])
+            tx.insert_many(spec.name, columns, [[row[c] for c in columns] for row in rows])
+            self.rows_restored += len(rows)
+
+    def stats(self) -> dict:
+        """Returns the totals in a form that can be sent from xdist workers and summed."""
+        return {
+            "restores": self.restores,
+            "seconds": self.seconds,
+            "rows_deleted": self.rows_deleted,
+            "rows_restored": self.rows_restored,
+            "tables_skipped": self.tables_skipped,
+        }
@@ -1,16 +1,254 @@
-import mysql.connector
-
-def reset_login_attempts(email):
-    connection = mysql.connector.connect(
-        host="localhost",
-        port=3306,
-        user="root",
-        password="",
-        database="opencart_db"
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class DbConfig:
+    """Connection settings for the OpenCart database, read from the environment (or a .env file)."""
+    backend: str = "mysql"
+    host: str = "localhost"
+    port: int = 3306
+    user: str = "root"
+    password: str = ""
+    database: str = "opencart_db"
+    prefix: str = "oc_"
+    pool_size: int = 2
+    sqlite_path: str = ":memory:"
+
+    @classmethod
+    def from_env(cls) -> "DbConfig":
+        """Builds the config from OPENCART_DB_* variables, falling back to the local XAMPP defaults."""
+        load_dotenv()
+        env = os.environ.get
+        return cls(
+            backend=env("OPENCART_DB_BACKEND", cls.backend),
+            host=env("OPENCART_DB_HOST", cls.host),
+            port=int(env("OPENCART_DB_PORT", cls.port)),
+            user=env("OPENCART_DB_USER", cls.user),
+            password=env("OPENCART_DB_PASSWORD", cls.password),
+            database=env("OPENCART_DB_NAME", cls.database),
+            prefix=env("OPENCART_DB_PREFIX", cls.prefix),
+            pool_size=int(env("OPENCART_DB_POOL_SIZE", cls.pool_size)),
+            sqlite_path=env("OPENCART_DB_SQLITE_PATH", cls.sqlite_path),
+        )
+
+
+class Database:
+    """Pooled access to the OpenCart database with prepared statements.
+
+    Uses a MySQL/MariaDB connection pool by default, or a single SQLite connection as a local
+    stand-in. SQL is written with %s placeholders and `{prefix}` for the table prefix."""
+
+    def __init__(self, config: DbConfig):
+        self.config = config
+        self.prefix = config.prefix
+        self._pool = None
+        self._sqlite = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        if config.backend == "sqlite":
+            self._sqlite = sqlite3.connect(config.sqlite_path, check_same_thread=False)
+        elif config.backend == "mysql":
+            from mysql.connector import pooling
+
+            self._pool = pooling.MySQLConnectionPool(
+                pool_name=f"opencart_{os.getpid()}",
+                pool_size=config.pool_size,
+                host=config.host,
+                port=config.port,
+                user=config.user,
+                password=config.password,
+                database=config.database,
+            )
+        else:
+            raise ValueError(f"Unsupported OPENCART_DB_BACKEND: {config.backend}")
+
+    # ---------------------------
+    # Connections
+    # ---------------------------
+
+    @contextmanager
+    def connection(self):
+        """Borrows a connection (returned to the pool on exit); commits on success, rolls back on error.
+
+        Nested use on the same thread (a db.query inside db.transaction()) runs on the already
+        borrowed connection, as part of the outer transaction."""
+        current = getattr(self._local, "conn", None)
+        if current is not None:
+            yield current
+            return
+
+        if self._sqlite is not None:
+            with self._lock:
+                self._local.conn = self._sqlite
+                try:
+                    yield self._sqlite
+                    self._sqlite.commit()
+                except Exception:
+                    self._sqlite.rollback()
+                    raise
+                finally:
+                    self._local.conn = None
+            return
+
+        conn = self._pool.get_connection()
+        self._local.conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            conn.close()
+
+    def cursor(self, conn):
+        """Returns a prepared-statement cursor for the backend."""
+        if self._sqlite is not None:
+            return conn.cursor()
+        return conn.cursor(prepared=True)
+
+    def sql(self, statement: str) -> str:
+        """Fills in the table prefix and adapts placeholders to the backend."""
+        statement = statement.replace("{prefix}", self.prefix)
+        if self._sqlite is not None:
+            statement = statement.replace("%s", "?")
+        return statement
+
+    # ---------------------------
+    # Statements
+    # ---------------------------
+
+    def execute(self, statement: str, params=()) -> int:
+        """Runs one statement in its own transaction and returns the affected row count."""
+        with self.connection() as conn:
+            cursor = self.cursor(conn)
+            try:
+                cursor.execute(self.sql(statement), tuple(params))
+                return cursor.rowcount
+            finally:
+                cursor.close()
+
+    def executemany(self, statement: str, rows) -> int:
+        """Runs one statement for many parameter rows in a single transaction."""
+        rows = [tuple(r) for r in rows]
+        if not rows:
+            return 0
+        with self.connection() as conn:
+            cursor = self.cursor(conn)
+            try:
+                cursor.executemany(self.sql(statement), rows)
+                return cursor.rowcount
+            finally:
+                cursor.close()
+
+    def query(self, statement: str, params=()) -> list:
+        """Runs a SELECT and returns the rows as dicts."""
+        with self.connection() as conn:
+            cursor = self.cursor(conn)
+            try:
+                cursor.execute(self.sql(statement), tuple(params))
+                columns = [c[0] for c in cursor.description or []]
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def transaction(self):
+        """Yields a Transaction whose statements commit together (or all roll back)."""
+        with self.connection() as conn:
+            cursor = self.cursor(conn)
+            try:
+                yield Transaction(self, cursor)
+            finally:
+                cursor.close()
+
+    def close(self) -> None:
+        """Closes the SQLite connection; pooled MySQL connections close with the process."""
+        if self._sqlite is not None:
+            self._sqlite.close()
+            self._sqlite = None
+
+
+class Transaction:
+    """Statements run on one borrowed connection inside Database.transaction()."""
+
+    def __init__(self, db: Database, cursor):
+        self.db = db
+        self.cursor = cursor
+
+    def execute(self, statement: str, params=()) -> int:
+        """Runs one statement and returns the affected row count."""
+        self.cursor.execute(self.db.sql(statement), tuple(params))
+        return self.cursor.rowcount
+
+    def insert_many(self, table: str, columns, rows) -> int:
+        """Inserts all rows with one multi-row INSERT (a single round trip)."""
+        rows = [tuple(r) for r in rows]
+        if not rows:
+            return 0
+        column_list = ", ".join(f"`{c}`" for c in columns)
+        values = ", ".join([f"({placeholders(columns)})"] * len(rows))
+        params = [value for row in rows for value in row]
+        return self.execute(f"INSERT INTO `{{prefix}}{table}` ({column_list}) VALUES {values}", params)
+
+    def query(self, statement: str, params=()) -> list:
+        """Runs a SELECT and returns the rows as dicts."""
+        self.cursor.execute(self.db.sql(statement), tuple(params))
+        columns = [c[0] for c in self.cursor.description or []]
+        return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
+
+
+# ---------------------------
+# Per-process (per xdist worker) database
+# ---------------------------
+
+_db = None
+
+
+def get_db() -> Database:
+    """Returns this process's Database, creating the pool on first use."""
+    global _db
+    if _db is None:
+        _db = Database(DbConfig.from_env())
+    return _db
+
+
+def set_db(db):
+    """Replaces this process's Database (e.g. with a SQLite stand-in in tests); returns the previous one."""
+    global _db
+    previous, _db = _db, db
+    return previous
+
+
+def close_db() -> None:
+    """Closes this process's Database if one was opened."""
+    global _db
+    if _db is not None:
+        _db.close()
+        _db = None
+
+
+def placeholders(values) -> str:
+    """Returns '%s, %s, ...' for an IN (...) list."""
+    return ", ".join(["%s"] * len(values))
+
+
+# ---------------------------
+# Helpers used by tests
+# ---------------------------
+
+def reset_login_attempts(*emails):
+    """Clears failed-login tracking for one or more accounts in a single round trip."""
+    if not emails:
+        return 0
+    return get_db().execute(
+        f"DELETE FROM {{prefix}}customer_login WHERE email IN ({placeholders(emails)})",
+        emails,
     )
-    cursor = connection.cursor()
-    query = "DELETE FROM oc_customer_login WHERE email = %s"
-    cursor.execute(query, (email,))
-    connection.commit()
-    cursor.close()
-    connection.close()
@@ -0,0 +1,88 @@
+from dataclasses import dataclass, field
+from selenium.webdriver.common.by import By
+from utils.command_hooks import register_read_only_script
+
+
+@dataclass(frozen=True)
+class ElementInfo:
+    """Snapshot of one element read in a batched DOM query."""
+    text: str
+    visible: bool
+    rect: dict = field(default_factory=dict)
+    attributes: dict = field(default_factory=dict)
+
+
+QUERY_ALL_JS = register_read_only_script("""
+var by = arguments[0], value = arguments[1], names = arguments[2] || [], root = arguments[3] || document;
+
+function findAll() {
+    if (by === 'xpath') {
+        var snap = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var found = [];
+        for (var i = 0; i < snap.snapshotLength; i++) { found.push(snap.snapshotItem(i)); }
+        return found;
+    }
+    if (by === 'link text' || by === 'partial link text') {
+        return Array.prototype.filter.call(root.querySelectorAll('a'), function (a) {
+            var t = (a.innerText || '').trim();
+            return by === 'link text' ? t === value : t.indexOf(value) !== -1;
+        });
+    }
+    return Array.prototype.slice.call(root.querySelectorAll(value));
+}
+
+function isVisible(el) {
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) { return false; }
+    return window.getComputedStyle(el).visibility !== 'hidden';
+}
+
+function readAttribute(el, name) {
+    var prop = el[name];
+    if (prop !== undefined && prop !== null && typeof prop !== 'object' && typeof prop !== 'function') {
+        return String(prop);
+    }
+    return el.getAttribute(name);
+}
+
+return findAll().map(function (el) {
+    var visible = isVisible(el);
+    var box = el.getBoundingClientRect();
+    var attributes = {};
+    names.forEach(function (name) { attributes[name] = readAttribute(el, name); });
+    return {
+        text: visible ? (el.innerText || '') : '',
+        visible: visible,
+        rect: {x: box.x, y: box.y, width: box.width, height: box.height},
+        attributes: attributes
+    };
+});
+""")
+
+
+def to_script_locator(locator):
+    """Maps a Selenium locator to the strategies the script understands (css, xpath, link text)."""
+    by, value = locator
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    return by, value
+
+
+def query_all(driver, locator, attributes=(), root=None) -> list:
+    """Reads text, visibility, bounding box, and attributes of every match in one execute_script call."""
+    by, value = to_script_locator(locator)
+    raw = driver.execute_script(QUERY_ALL_JS, by, value, list(attributes), root) or []
+    return [
+        ElementInfo(
+            text=(item.get("text") or "").strip(),
+            visible=bool(item.get("visible")),
+            rect=item.get("rect") or {},
+            attributes=item.get("attributes") or {},
+        )
+        for item in raw
+    ]
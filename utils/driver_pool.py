@@ -0,0 +1,90 @@
+from selenium.common.exceptions import WebDriverException
+from utils.logger import get_logger
+
+
+class DriverPool:
+    """Keeps warm browsers alive for the whole session and hands them out after a state reset.
+
+    Browsers are kept per key (the launch profile); `factory(key)` starts a new one."""
+
+    BLANK_URL = "about:blank"
+
+    CLEAR_STORAGE_JS = (
+        "try { window.localStorage.clear(); } catch (e) {}"
+        "try { window.sessionStorage.clear(); } catch (e) {}"
+    )
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._idle = {}
+        self.hits = 0
+        self.misses = 0
+        self.logger = get_logger()
+
+    # ---------------------------
+    # Hand out / take back
+    # ---------------------------
+
+    def acquire(self, key=None):
+        """Returns a warm browser for `key` when one is idle, otherwise launches a fresh one."""
+        idle = self._idle.get(key)
+        if idle:
+            self.hits += 1
+            return idle.pop()
+        self.misses += 1
+        driver = self._factory(key)
+        driver._pool_key = key
+        return driver
+
+    def release(self, driver) -> None:
+        """Resets the browser and keeps it for the next test, or quits it when the reset fails."""
+        if self._reset(driver):
+            self._idle.setdefault(driver.__dict__.get("_pool_key"), []).append(driver)
+        else:
+            self.logger.warning("Driver pool: browser could not be reset, discarding it.")
+            self._quit(driver)
+
+    def close(self) -> None:
+        """Quits every idle browser (called once at session end)."""
+        for idle in self._idle.values():
+            while idle:
+                self._quit(idle.pop())
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters for the session summary."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    # ---------------------------
+    # Reset helpers
+    # ---------------------------
+
+    def _reset(self, driver) -> bool:
+        """Clears cookies, web storage, extra tabs, and the current URL. False when the browser is broken."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            if driver.current_url.startswith("http"):
+                driver.execute_script(self.CLEAR_STORAGE_JS)
+            self._clear_cookies(driver)
+            driver.get(self.BLANK_URL)
+            return True
+        except WebDriverException:
+            return False
+
+    def _clear_cookies(self, driver) -> None:
+        """Clears cookies for every domain (CDP on Chrome, current domain elsewhere)."""
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+
+    def _quit(self, driver) -> None:
+        """Quits a browser, ignoring errors from one that already died."""
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
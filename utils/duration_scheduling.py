@@ -0,0 +1,109 @@
+from statistics import median
+from xdist.scheduler import LoadScopeScheduling
+
+
+class DurationHistory:
+    """Smoothed per-test durations (setup + call + teardown), kept in pytest's JSON cache."""
+
+    CACHE_KEY = "opencart/durations"
+    SMOOTHING = 0.5
+    DEFAULT_SECONDS = 5.0
+
+    def __init__(self, durations=None):
+        self.durations = dict(durations or {})
+        self._current = {}
+
+    @classmethod
+    def load(cls, config) -> "DurationHistory":
+        cache = getattr(config, "cache", None)  # absent with -p no:cacheprovider
+        return cls(cache.get(cls.CACHE_KEY, {}) if cache else {})
+
+    def save(self, config) -> None:
+        """Folds this run's timings into the history and writes it back to the cache."""
+        if getattr(config, "cache", None) is None:
+            return
+        for nodeid, seconds in self._current.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = seconds if previous is None else (
+                self.SMOOTHING * seconds + (1 - self.SMOOTHING) * previous
+            )
+        config.cache.set(self.CACHE_KEY, self.durations)
+
+    def record(self, nodeid: str, seconds: float) -> None:
+        """Adds the time of one test phase for this run."""
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + seconds
+
+    def pytest_runtest_logreport(self, report) -> None:
+        """Plugin hook: records every setup/call/teardown phase as it is reported."""
+        self.record(report.nodeid, report.duration)
+
+    def estimate(self, nodeid: str) -> float:
+        """Historical duration, or the median of known tests for a test never run before."""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return median(self.durations.values()) if self.durations else self.DEFAULT_SECONDS
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """xdist scheduler that hands out the longest work first.
+
+    Tests of one class share their fixtures and the worker's cached login, so they stay together
+    as one work unit - unless the class alone would exceed a worker's share of the run, in which
+    case it is cut into consecutive chunks that can spread across workers."""
+
+    def __init__(self, config, log=None, history: DurationHistory = None):
+        super().__init__(config, log)
+        self.history = history or DurationHistory.load(config)
+        self._unit_of = {}
+
+    def schedule(self) -> None:
+        if self.collection is not None:
+            super().schedule()
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        for scope, nodeids in self._work_units():
+            self.workqueue[scope] = {nodeid: False for nodeid in nodeids}
+            self._unit_of.update(dict.fromkeys(nodeids, scope))
+
+        # Same start-up as LoadScopeScheduling: one unit each, then top every node up to two.
+        for node in self.nodes:
+            if self.workqueue:
+                self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+
+    def _split_scope(self, nodeid: str) -> str:
+        """Work unit of a test: its class/module, or the chunk of it the test was put in."""
+        return self._unit_of.get(nodeid) or super()._split_scope(nodeid)
+
+    def _work_units(self) -> list:
+        """Returns (scope, nodeids) units ordered longest first."""
+        scopes = {}
+        for nodeid in self.collection:
+            scopes.setdefault(self._split_scope(nodeid), []).append(nodeid)
+
+        total = sum(self.history.estimate(nodeid) for nodeid in self.collection)
+        chunk_limit = total / (max(len(self.nodes), 1) * 2)
+
+        units = []
+        for scope, nodeids in scopes.items():
+            chunk, chunk_seconds = [], 0.0
+            for nodeid in nodeids:
+                seconds = self.history.estimate(nodeid)
+                if chunk and chunk_seconds + seconds > chunk_limit:
+                    units.append((chunk_seconds, f"{scope}#{len(units)}", chunk))
+                    chunk, chunk_seconds = [], 0.0
+                chunk.append(nodeid)
+                chunk_seconds += seconds
+            units.append((chunk_seconds, f"{scope}#{len(units)}", chunk))
+
+        units.sort(key=lambda unit: unit[0], reverse=True)
+        self.log(f"Duration scheduling: {len(units)} units, ~{total:.0f}s of tests")
+        return [(scope, nodeids) for _, scope, nodeids in units]
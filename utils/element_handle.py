@@ -0,0 +1,82 @@
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support import expected_conditions as EC
+
+
+SCROLL_INTO_VIEW_JS = "arguments[0].scrollIntoView({block:'center', inline:'center'});"
+SCROLL_AND_CLICK_JS = SCROLL_INTO_VIEW_JS + " arguments[0].click();"
+
+
+class ElementHandle:
+    """An element located once and carried through scroll, click, type and read steps.
+
+    The lookup (one explicit wait) happens on first use. If the DOM replaces the element, the
+    handle re-resolves its own locator once and repeats only the step that hit the stale reference."""
+
+    def __init__(self, page, locator=None, condition=EC.presence_of_element_located, timeout=None, element=None):
+        self.page = page
+        self.locator = locator
+        self.condition = condition
+        self.timeout = timeout
+        self._element = element
+
+    @property
+    def element(self):
+        if self._element is None:
+            self._element = self.page._wait_for(self.timeout).until(self.condition(self.locator))
+        return self._element
+
+    def resolve(self):
+        """Looks the element up again (after it went stale)."""
+        self._element = None
+        return self.element
+
+    def _run(self, action):
+        try:
+            return action(self.element)
+        except StaleElementReferenceException:
+            if self.locator is None:
+                raise
+            return action(self.resolve())
+
+    # ---------------------------
+    # Interactions
+    # ---------------------------
+
+    def scroll_into_view(self) -> "ElementHandle":
+        self._run(lambda el: self.page.driver.execute_script(SCROLL_INTO_VIEW_JS, el))
+        return self
+
+    def click(self, scroll: bool = True, native: bool = False) -> None:
+        """JS click (scrolling first in the same script) - or a real mouse click when `native`."""
+        if native:
+            if scroll:
+                self.scroll_into_view()
+            self._run(lambda el: el.click())
+            return
+        script = SCROLL_AND_CLICK_JS if scroll else "arguments[0].click();"
+        self._run(lambda el: self.page.driver.execute_script(script, el))
+
+    def type(self, text, clear_first: bool = False) -> None:
+        def _type(el):
+            if clear_first:
+                el.clear()
+            el.send_keys(text)
+
+        self._run(_type)
+
+    # ---------------------------
+    # Reads
+    # ---------------------------
+
+    @property
+    def text(self) -> str:
+        return self._run(lambda el: el.text)
+
+    def get_attribute(self, name: str):
+        return self._run(lambda el: el.get_attribute(name))
+
+    def is_selected(self) -> bool:
+        return self._run(lambda el: el.is_selected())
+
+    def is_enabled(self) -> bool:
+        return self._run(lambda el: el.is_enabled())
@@ -0,0 +1,120 @@
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from utils.store_session import StoreSession
+
+
+_OPTION_NAME = re.compile(r"^option\[(\d+)\](\[\])?$")
+
+
+@dataclass
+class CartItem:
+    """One product to add: `options` maps product_option_id to a value (None = the form's defaults)."""
+    product_id: int
+    quantity: int = 1
+    options: dict = None
+    upload_file: str = None  # used for a required file option
+
+
+class _ProductFormParser(HTMLParser):
+    """Collects a default value for every option field of a product page's #form-product."""
+
+    FILLER = "test"
+
+    def __init__(self):
+        super().__init__()
+        self.defaults = {}
+        self.file_options = []
+        self._in_form = False
+        self._select = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "form" and attrs.get("id") == "form-product":
+            self._in_form = True
+        if not self._in_form:
+            return
+
+        if tag == "option" and self._select and (attrs.get("value") or "").strip():
+            self.defaults.setdefault(self._select, attrs["value"])
+            return
+        match = _OPTION_NAME.match(attrs.get("name") or "")
+        if not match:
+            return
+        option_id, many = match.group(1), bool(match.group(2))
+        kind, value = attrs.get("type", "text"), attrs.get("value") or ""
+
+        if tag == "select":
+            self._select = option_id
+        elif tag == "textarea":
+            self.defaults.setdefault(option_id, self.FILLER)
+        elif kind in ("radio", "checkbox"):
+            self.defaults.setdefault(option_id, [value] if many else value)
+        elif kind == "hidden" and not value:
+            self.file_options.append(option_id)  # the upload button fills this in
+        else:
+            self.defaults.setdefault(option_id, value or self.FILLER)
+
+    def handle_endtag(self, tag):
+        if tag == "select":
+            self._select = None
+        elif tag == "form":
+            self._in_form = False
+
+
+class HttpCart:
+    """Fills the cart through OpenCart's checkout/cart.add route instead of the product pages.
+
+    Works on the browser's own session (see StoreSession), so a later cart or checkout page in
+    the browser shows the items. Default options are read once per product from its page."""
+
+    def __init__(self, session: StoreSession):
+        self.session = session
+        self._default_options = {}
+
+    def add(self, product_id: int, quantity: int = 1, options: dict = None, upload_file: str = None) -> None:
+        """Adds one product; fails with the store's error message when it refuses."""
+        if options is None:
+            options = self.default_options(product_id, upload_file)
+
+        data = {"product_id": product_id, "quantity": quantity}
+        for option_id, value in options.items():
+            if isinstance(value, (list, tuple)):
+                data[f"option[{option_id}][]"] = list(value)
+            else:
+                data[f"option[{option_id}]"] = value
+
+        reply = self.session.post("checkout/cart.add", data=data).json()
+        if "success" not in reply:
+            raise AssertionError(f"cart.add refused product {product_id}: {reply.get('error') or reply}")
+
+    def add_many(self, items) -> None:
+        """Adds several products (CartItems, or {product_id: quantity}) in one call."""
+        if isinstance(items, dict):
+            items = [CartItem(product_id, quantity) for product_id, quantity in items.items()]
+        for item in items:
+            self.add(item.product_id, item.quantity, item.options, item.upload_file)
+
+    def default_options(self, product_id: int, upload_file: str = None) -> dict:
+        """First real value of every option on the product page; file options are uploaded."""
+        if product_id not in self._default_options:
+            page = self.session.get("product/product", params={"product_id": product_id})
+            parser = _ProductFormParser()
+            parser.feed(page.text)
+            self._default_options[product_id] = (parser.defaults, parser.file_options)
+
+        defaults, file_options = self._default_options[product_id]
+        options = dict(defaults)
+        for option_id in file_options:
+            if upload_file is None:
+                raise AssertionError(f"Product {product_id} needs a file for option {option_id} (pass upload_file).")
+            options[option_id] = self.upload(upload_file)
+        return options
+
+    def upload(self, path: str) -> str:
+        """Uploads a file through tool/upload and returns the code the option field expects."""
+        with open(path, "rb") as handle:
+            reply = self.session.post("tool/upload", files={"file": handle}).json()
+        if "code" not in reply:
+            raise AssertionError(f"Upload refused: {reply.get('error') or reply}")
+        return reply["code"]
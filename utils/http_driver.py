@@ -0,0 +1,689 @@
+import base64
+import re
+from urllib.parse import urlencode, urljoin, urlparse
+import requests
+from lxml import html as lxml_html
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from utils.base_page import BasePage
+from utils.dom_query import QUERY_ALL_JS
+from utils.element_handle import SCROLL_AND_CLICK_JS, SCROLL_INTO_VIEW_JS
+from utils.network_idle import STATUS_JS, TRACKER_JS
+from utils.route_map import MENU_JS, PRODUCT_LINKS_JS
+from utils.store_session import jar_domain
+
+
+IS_DISPLAYED = "isElementDisplayed"  # no W3C command; the browser runs an atom through executeScript
+
+HIDDEN_TAGS = {"head", "script", "style", "template", "noscript", "title", "meta", "link"}
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset", "footer", "form",
+    "h1", "h2", "h3", "h4", "h5", "h6", "header", "legend", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "tbody", "thead", "tfoot", "tr", "ul",
+}
+# Bootstrap components that stay hidden until a class is added (by JS in the browser).
+SHOWN_BY_CLASS = {"collapse": "show", "dropdown-menu": "show", "modal": "show", "tab-pane": "active",
+                  "invalid-feedback": "d-block"}
+# "d-none d-md-inline": hidden on phones only; the suite's browsers are desktop-sized.
+_RESPONSIVE_DISPLAY = re.compile(r"^d-(sm|md|lg|xl)-(?!none$)")
+_HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden")
+_SUBMIT_KEYS = (Keys.ENTER, Keys.RETURN)
+
+ALERT_HTML = (
+    '<div class="alert alert-{kind} alert-dismissible"><i class="fa-solid fa-circle-exclamation"></i> '
+    '{message} <button type="button" class="btn-close" data-bs-dismiss="alert"></button></div>'
+)
+
+
+def _classes(node) -> set:
+    return set((node.get("class") or "").split())
+
+
+def _hidden_self(node) -> bool:
+    """True when the node itself is not rendered (ignores its ancestors)."""
+    if not isinstance(node.tag, str) or node.tag in HIDDEN_TAGS or node.get("hidden") is not None:
+        return True
+    if node.tag == "input" and (node.get("type") or "").lower() == "hidden":
+        return True
+    if _HIDDEN_STYLE.search(node.get("style") or ""):
+        return True
+    classes = _classes(node)
+    if "d-none" in classes and not any(_RESPONSIVE_DISPLAY.match(c) for c in classes):
+        return True
+    return any(name in classes and shown not in classes for name, shown in SHOWN_BY_CLASS.items())
+
+
+def _inner_text(node) -> str:
+    """Approximates innerText: visible text only, one line per block element, whitespace collapsed."""
+    parts = []
+
+    def walk(current):
+        if _hidden_self(current):
+            return
+        block = current.tag in BLOCK_TAGS
+        parts.append("\n" if block or current.tag == "br" else " " if current.tag in ("td", "th") else "")
+        if current.text and current.tag not in ("textarea", "select"):
+            parts.append(current.text)
+        for child in current:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    walk(node)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _to_xpath(by: str, value: str) -> str:
+    """XPath for the locator strategies lxml has no direct call for (css is handled by cssselect)."""
+    quoted = f'concat("", "{value}")' if '"' not in value else "concat('" + value.replace("'", "', \"'\", '") + "')"
+    if by == By.ID:
+        return f".//*[@id={quoted}]"
+    if by == By.NAME:
+        return f".//*[@name={quoted}]"
+    if by == By.CLASS_NAME:
+        return f".//*[contains(concat(' ', normalize-space(@class), ' '), concat(' ', {quoted}, ' '))]"
+    if by == By.TAG_NAME:
+        return f".//{value}"
+    raise InvalidSelectorException(f"Unsupported locator strategy: {by}")
+
+
+class HttpElement:
+    """A parsed HTML element exposing the WebElement calls BasePage and Selenium's helpers use."""
+
+    def __init__(self, driver, node, generation: int):
+        self._driver = driver
+        self._node = node
+        self._generation = generation
+
+    def __eq__(self, other):
+        return isinstance(other, HttpElement) and other._node is self._node
+
+    def __hash__(self):
+        return hash(id(self._node))
+
+    @property
+    def id(self) -> str:
+        return f"http-{id(self._node)}"
+
+    def _execute(self, command, **params):
+        return self._driver.execute(command, {"element": self, **params})
+
+    @property
+    def node(self):
+        """The lxml node; raises StaleElementReferenceException once the page has been replaced."""
+        if self._generation != self._driver._generation:
+            raise StaleElementReferenceException("The page this element belonged to has been replaced.")
+        return self._node
+
+    # ---------------------------
+    # Reads
+    # ---------------------------
+
+    @property
+    def tag_name(self) -> str:
+        return self._execute(Command.GET_ELEMENT_TAG_NAME)
+
+    @property
+    def text(self) -> str:
+        return self._execute(Command.GET_ELEMENT_TEXT)
+
+    def get_attribute(self, name: str):
+        return self._execute(Command.GET_ELEMENT_ATTRIBUTE, name=name)
+
+    def get_property(self, name: str):
+        return self._execute(Command.GET_ELEMENT_PROPERTY, name=name)
+
+    def get_dom_attribute(self, name: str):
+        return self.node.get(name)
+
+    def is_displayed(self) -> bool:
+        return self._execute(IS_DISPLAYED)
+
+    def is_enabled(self) -> bool:
+        return self._execute(Command.IS_ELEMENT_ENABLED)
+
+    def is_selected(self) -> bool:
+        return self._execute(Command.IS_ELEMENT_SELECTED)
+
+    @property
+    def rect(self) -> dict:
+        return {"x": 0, "y": 0, "width": 0, "height": 0}
+
+    @property
+    def location(self) -> dict:
+        return {"x": 0, "y": 0}
+
+    @property
+    def location_once_scrolled_into_view(self) -> dict:
+        return {"x": 0, "y": 0}
+
+    @property
+    def size(self) -> dict:
+        return {"width": 0, "height": 0}
+
+    # ---------------------------
+    # Actions
+    # ---------------------------
+
+    def click(self) -> None:
+        self._execute(Command.CLICK_ELEMENT)
+
+    def send_keys(self, *value) -> None:
+        self._execute(Command.SEND_KEYS_TO_ELEMENT, text="".join(str(v) for v in value))
+
+    def clear(self) -> None:
+        self._execute(Command.CLEAR_ELEMENT)
+
+    def submit(self) -> None:
+        self._driver._submit(self._driver._form_of(self.node))
+
+    def find_element(self, by=By.ID, value=None) -> "HttpElement":
+        return self._execute(Command.FIND_CHILD_ELEMENT, using=by, value=value)
+
+    def find_elements(self, by=By.ID, value=None) -> list:
+        return self._execute(Command.FIND_CHILD_ELEMENTS, using=by, value=value)
+
+
+class HttpDriver:
+    """Browserless driver: fetches pages with requests and parses them with lxml.
+
+    Implements the part of the WebDriver API that BasePage uses - navigation, find by any locator
+    strategy, text/attributes/visibility, typing, clicks on links and buttons, form submission and
+    cookies - plus the suite's own registered scripts. OpenCart's ajax forms (data-oc-toggle="ajax")
+    are posted and their JSON reply is applied the way OpenCart's common.js does (redirect, alerts,
+    field errors). Any other script raises JavascriptException: that test needs a real browser."""
+
+    name = "http"
+    session_id = "http"
+
+    def __init__(self, timeout: float = 15):
+        self.http = requests.Session()
+        self.timeout = timeout
+        self._url = "about:blank"
+        self._doc = lxml_html.document_fromstring("<html><body></body></html>")
+        self._history = []
+        self._generation = 0
+
+    def execute(self, driver_command: str, params=None):
+        """Runs one command; every public call goes through here, like a remote WebDriver."""
+        handler = _COMMANDS.get(driver_command)
+        if handler is None:
+            raise WebDriverException(f"'{driver_command}' is not available without a browser.")
+        return handler(self, params or {})
+
+    # ---------------------------
+    # Navigation / page
+    # ---------------------------
+
+    def get(self, url: str) -> None:
+        self.execute(Command.GET, {"url": url})
+
+    def back(self) -> None:
+        self.execute(Command.GO_BACK)
+
+    def refresh(self) -> None:
+        self.execute(Command.REFRESH)
+
+    @property
+    def current_url(self) -> str:
+        return self.execute(Command.GET_CURRENT_URL)
+
+    @property
+    def title(self) -> str:
+        return self.execute(Command.GET_TITLE)
+
+    @property
+    def page_source(self) -> str:
+        return self.execute(Command.GET_PAGE_SOURCE)
+
+    def load_html(self, markup: str, url: str = "about:blank") -> None:
+        """Shows saved HTML as if it had been fetched from `url` (used by the conformance tests)."""
+        self._show(markup, url)
+
+    # ---------------------------
+    # Elements
+    # ---------------------------
+
+    def find_element(self, by=By.ID, value=None) -> HttpElement:
+        return self.execute(Command.FIND_ELEMENT, {"using": by, "value": value})
+
+    def find_elements(self, by=By.ID, value=None) -> list:
+        return self.execute(Command.FIND_ELEMENTS, {"using": by, "value": value})
+
+    def execute_script(self, script: str, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": list(args)})
+
+    # ---------------------------
+    # Cookies / session
+    # ---------------------------
+
+    def get_cookies(self) -> list:
+        return self.execute(Command.GET_ALL_COOKIES)
+
+    def get_cookie(self, name: str):
+        return next((c for c in self.get_cookies() if c["name"] == name), None)
+
+    def add_cookie(self, cookie_dict: dict) -> None:
+        self.execute(Command.ADD_COOKIE, {"cookie": cookie_dict})
+
+    def delete_cookie(self, name: str) -> None:
+        self.execute(Command.DELETE_COOKIE, {"name": name})
+
+    def delete_all_cookies(self) -> None:
+        self.execute(Command.DELETE_ALL_COOKIES)
+
+    @property
+    def window_handles(self) -> list:
+        return [self.session_id]
+
+    def implicitly_wait(self, time_to_wait: float) -> None:
+        pass
+
+    def get_screenshot_as_base64(self) -> str:
+        return base64.b64encode(self.execute(Command.SCREENSHOT)).decode("ascii")
+
+    def quit(self) -> None:
+        self.execute(Command.QUIT)
+
+    # ---------------------------
+    # Command implementations
+    # ---------------------------
+
+    def _load(self, method: str, url: str, **kwargs) -> None:
+        response = self.http.request(method, url, timeout=self.timeout, **kwargs)
+        if self._url != "about:blank":
+            self._history.append(self._url)
+        self._show(response.text, response.url)
+
+    def _show(self, markup: str, url: str) -> None:
+        self._doc = lxml_html.document_fromstring(markup or "<html><body></body></html>", base_url=url)
+        self._url = url
+        self._generation += 1
+
+    def _wrap(self, nodes) -> list:
+        return [HttpElement(self, node, self._generation) for node in nodes if isinstance(node.tag, str)]
+
+    def _find_all(self, root, by: str, value: str) -> list:
+        try:
+            if by == By.CSS_SELECTOR:
+                nodes = root.cssselect(value)
+            elif by == By.XPATH:
+                nodes = [n for n in root.xpath(value) if hasattr(n, "tag")]
+            elif by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+                nodes = [
+                    a for a in root.iter("a")
+                    if (_inner_text(a) == value if by == By.LINK_TEXT else value in _inner_text(a))
+                ]
+            else:
+                nodes = root.xpath(_to_xpath(by, value))
+        except (lxml_html.etree.XPathError, SyntaxError) as e:
+            raise InvalidSelectorException(f"Invalid selector {by}={value!r}: {e}") from e
+        return self._wrap(nodes)
+
+    def _find_one(self, root, by: str, value: str) -> HttpElement:
+        found = self._find_all(root, by, value)
+        if not found:
+            raise NoSuchElementException(f"No element matches {by}={value!r}")
+        return found[0]
+
+    def _attribute(self, node, name: str):
+        """Property-first read, as Selenium's getAttribute does."""
+        tag, kind = node.tag, (node.get("type") or "").lower()
+        if name in ("checked", "selected"):
+            return "true" if self._selected(node) else None
+        if name == "value":
+            if tag == "textarea":
+                return node.text or ""
+            if tag == "select":
+                chosen = self._chosen_option(node)
+                return None if chosen is None else chosen.get("value", _inner_text(chosen))
+            if tag == "option":
+                return node.get("value", " ".join((node.text_content() or "").split()))
+            return node.get("value", "on" if kind in ("checkbox", "radio") else "")
+        if name in ("href", "src", "action") and node.get(name) is not None:
+            return urljoin(self._url, node.get(name))
+        if name in ("innerText", "textContent"):
+            return _inner_text(node) if name == "innerText" else node.text_content()
+        if name == "index" and tag == "option":
+            select = next(node.iterancestors("select"), None)
+            return str(list(select.iter("option")).index(node)) if select is not None else "0"
+        if name == "className":
+            name = "class"
+        if name in ("disabled", "readonly", "required", "multiple", "hidden"):
+            return "true" if node.get(name) is not None else None
+        return node.get(name)
+
+    def _displayed(self, node) -> bool:
+        if node.tag == "option":
+            node = next(node.iterancestors("select"), node)
+        return not any(_hidden_self(n) for n in (node, *node.iterancestors()))
+
+    def _selected(self, node) -> bool:
+        if node.tag == "option":
+            select = next(node.iterancestors("select"), None)
+            return select is not None and self._chosen_option(select) is node
+        return node.get("checked") is not None
+
+    def _chosen_option(self, select):
+        options = list(select.iter("option"))
+        chosen = [o for o in options if o.get("selected") is not None]
+        return chosen[-1] if chosen else (options[0] if options else None)
+
+    def _select_option(self, option) -> None:
+        select = next(option.iterancestors("select"), None)
+        if select is not None and select.get("multiple") is None:
+            for other in select.iter("option"):
+                other.attrib.pop("selected", None)
+        option.set("selected", "selected")
+
+    def _set_value(self, node, value: str) -> None:
+        if node.tag == "textarea":
+            node.text = value
+        else:
+            node.set("value", value)
+
+    def _form_of(self, node):
+        form_id = node.get("form")
+        if form_id:
+            matches = self._doc.xpath(f'//form[@id="{form_id}"]')
+            if matches:
+                return matches[0]
+        form = node if node.tag == "form" else next(node.iterancestors("form"), None)
+        if form is None:
+            raise WebDriverException("Element is not inside a form.")
+        return form
+
+    def _click(self, node) -> None:
+        tag, kind = node.tag, (node.get("type") or "").lower()
+        if node.get("disabled") is not None:
+            return
+        if tag == "label" and node.get("for"):
+            target = self._doc.get_element_by_id(node.get("for"), None)
+            if target is not None:
+                self._click(target)
+            return
+        if tag == "input" and kind == "checkbox":
+            if node.get("checked") is None:
+                node.set("checked", "checked")
+            else:
+                node.attrib.pop("checked")
+            return
+        if tag == "input" and kind == "radio":
+            for other in self._doc.xpath("//input[@type='radio'][@name=$name]", name=node.get("name") or ""):
+                other.attrib.pop("checked", None)
+            node.set("checked", "checked")
+            return
+        if tag == "option":
+            self._select_option(node)
+            return
+        if tag == "button" and kind in ("", "submit") or tag == "input" and kind in ("submit", "image"):
+            self._submit(self._form_of(node), node)
+            return
+        if node.get("data-bs-toggle") == "dropdown":
+            menu = node.getnext()
+            if menu is not None and "dropdown-menu" in _classes(menu):
+                classes = _classes(menu) ^ {"show"}
+                menu.set("class", " ".join(sorted(classes)))
+            return
+        link = node if tag == "a" else next(node.iterancestors("a"), None)
+        if link is not None:
+            href = link.get("href") or ""
+            if href and not href.startswith(("#", "javascript:")):
+                self._load("GET", urljoin(self._url, href))
+
+    def _type(self, node, text: str) -> None:
+        if node.tag == "input" and (node.get("type") or "").lower() in ("checkbox", "radio"):
+            if Keys.SPACE in text:
+                self._click(node)
+            return
+        submit = any(key in text for key in _SUBMIT_KEYS)
+        typed = "".join(ch for ch in text if not "\ue000" <= ch <= "\uf8ff")  # Keys.* are private-use chars
+        if node.tag == "select":
+            match = next((o for o in node.iter("option") if _inner_text(o).lower().startswith(typed.lower())), None)
+            if match is not None:
+                self._select_option(match)
+        elif typed:
+            self._set_value(node, (self._attribute(node, "value") or "") + typed)
+        if submit and node.tag == "input":
+            self._submit(self._form_of(node))
+
+    # ---------------------------
+    # Forms
+    # ---------------------------
+
+    def _form_data(self, form, submitter=None) -> list:
+        data = list(form.form_values())
+        form_id = form.get("id")
+        if form_id:  # controls outside the form that point at it with form="..."
+            for node in self._doc.xpath("//*[@form=$id][@name]", id=form_id):
+                if node.tag in ("input", "select", "textarea") and node.get("disabled") is None:
+                    data.append((node.get("name"), self._attribute(node, "value") or ""))
+        if submitter is not None and submitter.get("name"):
+            data.append((submitter.get("name"), submitter.get("value") or ""))
+        return data
+
+    def _submit(self, form, submitter=None) -> None:
+        action = urljoin(self._url, (submitter.get("formaction") if submitter is not None else None)
+                         or form.get("action") or self._url)
+        data = self._form_data(form, submitter)
+        if form.get("data-oc-toggle") == "ajax":
+            self._submit_ajax(form, action, data)
+        elif (form.get("method") or "get").lower() == "post":
+            self._load("POST", action, data=data)
+        else:
+            self._load("GET", f"{action.split('?')[0]}?{urlencode(data)}")
+
+    def _submit_ajax(self, form, action: str, data: list) -> None:
+        """Posts an OpenCart ajax form and applies its JSON reply like catalog/view/javascript/common.js."""
+        for node in form.iter():
+            classes = _classes(node)
+            if classes & {"is-invalid", "d-block"} and ("is-invalid" in classes or "invalid-feedback" in classes):
+                node.set("class", " ".join(sorted(classes - {"is-invalid", "d-block"})))
+
+        response = self.http.post(action, data=data, timeout=self.timeout)
+        try:
+            reply = response.json()
+        except ValueError as e:
+            raise WebDriverException(f"Ajax form at {action} did not answer with JSON.") from e
+
+        if reply.get("redirect"):
+            self._load("GET", urljoin(self._url, reply["redirect"].replace("&amp;", "&")))
+            return
+        error = reply.get("error")
+        if isinstance(error, str):
+            self._alert("danger", error)
+        elif isinstance(error, dict):
+            if error.get("warning"):
+                self._alert("danger", error["warning"])
+            for key, message in error.items():
+                key = key.replace("_", "-")
+                field = self._doc.get_element_by_id(f"input-{key}", None)
+                if field is not None:
+                    field.set("class", " ".join(sorted(_classes(field) | {"is-invalid"})))
+                target = self._doc.get_element_by_id(f"error-{key}", None)
+                if target is not None:
+                    self._set_inner_html(target, message)
+                    target.set("class", " ".join(sorted(_classes(target) | {"d-block"})))
+        if reply.get("success"):
+            self._alert("success", reply["success"])
+
+    def _alert(self, kind: str, message: str) -> None:
+        container = self._doc.get_element_by_id("alert", None)
+        if container is None:
+            container = self._doc.body
+        container.insert(0, lxml_html.fragment_fromstring(ALERT_HTML.format(kind=kind, message=message)))
+
+    def _set_inner_html(self, node, markup: str) -> None:
+        for child in list(node):
+            node.remove(child)
+        fragments = lxml_html.fragments_fromstring(markup or "")
+        node.text = fragments.pop(0) if fragments and isinstance(fragments[0], str) else None
+        for fragment in fragments:
+            node.append(fragment)
+
+
+# ---------------------------
+# Script emulation (the suite's own registered scripts only)
+# ---------------------------
+
+def _query_all(driver, by, value, names=(), root=None):
+    nodes = driver._find_all(root.node if root is not None else driver._doc, by, value)
+    result = []
+    for element in nodes:
+        node = element.node
+        visible = driver._displayed(node)
+        result.append({
+            "text": _inner_text(node) if visible else "",
+            "visible": visible,
+            "rect": {"x": 0, "y": 0, "width": 0, "height": 0},
+            "attributes": {name: driver._attribute(node, name) for name in names or ()},
+        })
+    return result
+
+
+def _fill_form(driver, fields):
+    found = []
+    for by, value, wanted in fields:
+        matches = driver._find_all(driver._doc, by, value)
+        if not matches:
+            return False
+        node = matches[0].node
+        if node.tag == "select":
+            option = next((o for o in node.iter("option")
+                           if o.get("value") == wanted or _inner_text(o) == wanted), None)
+            if option is None:
+                return False
+            found.append((node, option))
+        else:
+            found.append((node, wanted))
+    for node, value in found:
+        if node.tag == "select":
+            driver._select_option(value)
+        elif (node.get("type") or "").lower() in ("checkbox", "radio"):
+            if value:
+                node.set("checked", "checked")
+            else:
+                node.attrib.pop("checked", None)
+        else:
+            driver._set_value(node, value)
+    return True
+
+
+def _menu(driver):
+    entries = []
+    for li in driver._doc.cssselect("#menu .navbar-nav > li"):
+        links = li.cssselect("a")
+        if not links:
+            continue
+        see_all = li.cssselect("a.see-all")
+        entries.append({
+            "name": " ".join(links[0].text_content().split()),
+            "href": driver._attribute((see_all or links)[0], "href"),
+            "children": [
+                {"name": " ".join(a.text_content().split()), "href": driver._attribute(a, "href")}
+                for a in li.cssselect(".dropdown-inner a")
+            ],
+        })
+    return entries
+
+
+def _product_links(driver):
+    return [
+        {"name": " ".join(a.text_content().split()), "href": driver._attribute(a, "href")}
+        for a in driver._doc.cssselect(".product-thumb h4 a")
+    ]
+
+
+_SCRIPTS = {
+    BasePage.PAGE_STABLE_JS: lambda d, *a: True,
+    BasePage.FILL_FORM_JS: lambda d, fields: _fill_form(d, fields),
+    "return document.readyState": lambda d: "complete",
+    STATUS_JS: lambda d: {"loaded": True, "inflight": 0, "network_quiet_ms": 1e9, "dom_quiet_ms": 1e9},
+    TRACKER_JS: lambda d: None,
+    QUERY_ALL_JS: _query_all,
+    SCROLL_INTO_VIEW_JS: lambda d, el: None,
+    SCROLL_AND_CLICK_JS: lambda d, el: el.click(),
+    "arguments[0].click();": lambda d, el: el.click(),
+    MENU_JS: _menu,
+    PRODUCT_LINKS_JS: _product_links,
+}
+
+
+def _execute_script(driver, params):
+    handler = _SCRIPTS.get(params["script"])
+    if handler is None:
+        raise JavascriptException("This script needs a real browser (HttpDriver runs no JavaScript).")
+    return handler(driver, *params.get("args", ()))
+
+
+def _cookies(driver):
+    return [
+        {"name": c.name, "value": c.value, "path": c.path, "domain": c.domain, "secure": c.secure,
+         "httpOnly": c.has_nonstandard_attr("HttpOnly")}
+        for c in driver.http.cookies
+    ]
+
+
+def _add_cookie(driver, params):
+    cookie = params["cookie"]
+    domain = jar_domain(cookie.get("domain") or urlparse(driver._url).hostname or "")
+    driver.http.cookies.set(cookie["name"], cookie["value"], domain=domain, path=cookie.get("path", "/"))
+
+
+def _delete_cookie(driver, params):
+    for cookie in list(driver.http.cookies):
+        if cookie.name == params["name"]:
+            driver.http.cookies.clear(cookie.domain, cookie.path, cookie.name)
+
+
+def _go_back(driver, params):
+    if driver._history:
+        url = driver._history.pop()
+        driver._load("GET", url)
+        driver._history.pop()
+
+
+def _no_screenshot(driver, params):
+    raise WebDriverException("HttpDriver has no screen to capture.")
+
+
+_COMMANDS = {
+    Command.GET: lambda d, p: d._load("GET", p["url"]),
+    Command.GO_BACK: _go_back,
+    Command.REFRESH: lambda d, p: d._load("GET", d._url) if d._url != "about:blank" else None,
+    Command.GET_CURRENT_URL: lambda d, p: d._url,
+    Command.GET_TITLE: lambda d, p: " ".join((d._doc.findtext(".//title") or "").split()),
+    Command.GET_PAGE_SOURCE: lambda d, p: lxml_html.tostring(d._doc, encoding="unicode"),
+    Command.FIND_ELEMENT: lambda d, p: d._find_one(d._doc, p["using"], p["value"]),
+    Command.FIND_ELEMENTS: lambda d, p: d._find_all(d._doc, p["using"], p["value"]),
+    Command.FIND_CHILD_ELEMENT: lambda d, p: d._find_one(p["element"].node, p["using"], p["value"]),
+    Command.FIND_CHILD_ELEMENTS: lambda d, p: d._find_all(p["element"].node, p["using"], p["value"]),
+    Command.GET_ELEMENT_TAG_NAME: lambda d, p: p["element"].node.tag,
+    Command.GET_ELEMENT_TEXT: lambda d, p: _inner_text(p["element"].node) if d._displayed(p["element"].node) else "",
+    Command.GET_ELEMENT_ATTRIBUTE: lambda d, p: d._attribute(p["element"].node, p["name"]),
+    Command.GET_ELEMENT_PROPERTY: lambda d, p: d._attribute(p["element"].node, p["name"]),
+    IS_DISPLAYED: lambda d, p: d._displayed(p["element"].node),
+    Command.IS_ELEMENT_ENABLED: lambda d, p: p["element"].node.get("disabled") is None,
+    Command.IS_ELEMENT_SELECTED: lambda d, p: d._selected(p["element"].node),
+    Command.CLICK_ELEMENT: lambda d, p: d._click(p["element"].node),
+    Command.SEND_KEYS_TO_ELEMENT: lambda d, p: d._type(p["element"].node, p["text"]),
+    Command.CLEAR_ELEMENT: lambda d, p: d._set_value(p["element"].node, ""),
+    Command.W3C_EXECUTE_SCRIPT: _execute_script,
+    Command.GET_ALL_COOKIES: lambda d, p: _cookies(d),
+    Command.ADD_COOKIE: _add_cookie,
+    Command.DELETE_COOKIE: _delete_cookie,
+    Command.DELETE_ALL_COOKIES: lambda d, p: d.http.cookies.clear(),
+    Command.SCREENSHOT: _no_screenshot,
+    Command.QUIT: lambda d, p: d.http.close(),
+}
@@ -0,0 +1,71 @@
+from selenium.common.exceptions import WebDriverException
+from utils.command_hooks import register_read_only_script
+
+
+# Counts XHR/fetch requests in flight and remembers when the network and the DOM last changed.
+# Installed before page scripts run (CDP) where possible, otherwise injected on first use.
+TRACKER_JS = register_read_only_script("""
+(function () {
+    if (window.__netTracker) { return; }
+    var t = window.__netTracker = {inflight: 0, lastNetwork: Date.now(), lastMutation: Date.now()};
+    function started() { t.inflight++; t.lastNetwork = Date.now(); }
+    function finished() { t.inflight = Math.max(0, t.inflight - 1); t.lastNetwork = Date.now(); }
+
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener('loadend', finished);
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            started();
+            return fetch.apply(this, arguments).finally(finished);
+        };
+    }
+
+    function observe() {
+        new MutationObserver(function () { t.lastMutation = Date.now(); }).observe(
+            document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true}
+        );
+    }
+    if (document.documentElement) { observe(); } else { document.addEventListener('DOMContentLoaded', observe); }
+})();
+""")
+
+STATUS_JS = register_read_only_script("""
+var t = window.__netTracker;
+if (!t) { return null; }
+var now = Date.now();
+return {
+    loaded: document.readyState === 'complete',
+    inflight: Math.max(t.inflight, window.jQuery ? window.jQuery.active : 0),
+    network_quiet_ms: now - t.lastNetwork,
+    dom_quiet_ms: now - t.lastMutation
+};
+""")
+
+
+def install_tracker(driver) -> None:
+    """Registers the tracker for every document the driver loads from now on (once per driver, Chrome only)."""
+    if "_net_tracker" in driver.__dict__:
+        return
+    driver._net_tracker = False
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_JS})
+            driver._net_tracker = True
+        except WebDriverException:
+            pass
+
+
+def tracker_status(driver):
+    """Returns the tracker's counters for the current document, injecting the tracker if it is missing.
+
+    A freshly injected tracker reports None for this poll: requests already in flight before it
+    existed are only visible through jQuery.active, so the caller should poll again."""
+    status = driver.execute_script(STATUS_JS)
+    if status is None:
+        driver.execute_script(TRACKER_JS)
+    return status
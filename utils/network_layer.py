@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+from dataclasses import replace
+from selenium.common.exceptions import WebDriverException
+
+
+ANALYTICS_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+)
+IMAGE_PATTERNS = ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*")
+
+DEFAULT_CACHE_ROOT = os.path.join(tempfile.gettempdir(), "opencart-chrome-cache")
+
+
+class NetworkLayer:
+    """Blocks URL patterns through CDP, points Chrome at a disk cache kept for the session, and counts
+    the bytes that were served from that cache or never requested.
+
+    Chrome locks its disk cache, so two live browsers must not share a directory: each xdist worker
+    gets its own directory and each launch profile a subdirectory of it. The driver pool keeps idle
+    browsers of several profiles alive at once, but never two of the same profile, because a worker
+    runs one test at a time and returns its browser before the next one asks. Traffic is read from
+    Chrome's performance log; a blocked request counts as saved bytes when the same URL was downloaded
+    by another test of the session."""
+
+    def __init__(self, cache_dir: str, extra_blocked=()):
+        self.cache_dir = cache_dir
+        self.extra_blocked = tuple(extra_blocked)
+        self.size_by_url = {}
+        self.requests = 0
+        self.downloaded_bytes = 0
+        self.cache_hits = 0
+        self.cache_bytes = 0
+        self.blocked = 0
+        self.blocked_bytes = 0
+
+    # ---------------------------
+    # Browser setup
+    # ---------------------------
+
+    def configure(self, profile):
+        """Returns the launch profile with its own disk cache directory and the performance log turned on."""
+        cache_dir = os.path.join(self.cache_dir, profile.name)
+        os.makedirs(cache_dir, exist_ok=True)
+        return replace(profile, disk_cache_dir=cache_dir, performance_log=True)
+
+    def start(self, driver, block_images: bool = False) -> None:
+        """Applies this test's block list and drops traffic logged before the test started."""
+        patterns = ANALYTICS_PATTERNS + self.extra_blocked + (IMAGE_PATTERNS if block_images else ())
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+            driver.get_log("performance")
+        except WebDriverException:
+            pass
+
+    # ---------------------------
+    # Accounting
+    # ---------------------------
+
+    def collect(self, driver) -> None:
+        """Reads the test's network events from the performance log and adds them to the totals."""
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException:
+            return
+        self.add_events(json.loads(entry["message"])["message"] for entry in entries)
+
+    def add_events(self, events) -> None:
+        """Counts requests from CDP Network.* events (dicts with "method" and "params")."""
+        urls, cached, decoded = {}, set(), {}
+        for event in events:
+            method, params = event.get("method"), event.get("params", {})
+            request_id = params.get("requestId")
+
+            if method == "Network.requestWillBeSent":
+                urls[request_id] = params["request"]["url"]
+            elif method == "Network.responseReceived" and params["response"].get("fromDiskCache"):
+                cached.add(request_id)
+            elif method == "Network.dataReceived":
+                decoded[request_id] = decoded.get(request_id, 0) + params.get("dataLength", 0)
+            elif method == "Network.loadingFinished":
+                url = urls.get(request_id)
+                self.requests += 1
+                if request_id in cached:
+                    self.cache_hits += 1
+                    self.cache_bytes += self.size_by_url.get(url) or decoded.get(request_id, 0)
+                else:
+                    size = int(params.get("encodedDataLength", 0))
+                    self.downloaded_bytes += size
+                    if url and size:
+                        self.size_by_url[url] = size
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                self.blocked += 1
+                self.blocked_bytes += self.size_by_url.get(urls.get(request_id), 0)
+
+    def stats(self) -> dict:
+        """Returns the totals in a form that can be sent from xdist workers and summed."""
+        return {
+            "requests": self.requests,
+            "downloaded_bytes": self.downloaded_bytes,
+            "cache_hits": self.cache_hits,
+            "cache_bytes": self.cache_bytes,
+            "blocked": self.blocked,
+            "blocked_bytes": self.blocked_bytes,
+        }
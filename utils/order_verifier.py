@@ -0,0 +1,287 @@
+import re
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Mapping, Optional
+from urllib.parse import parse_qs, urlparse
+from lxml import html as lxml_html
+from pages.main_navigation_menu_page import NavigationPage
+from utils.db_utils import get_db
+from utils.step_timing import timed_step
+from utils.store_session import StoreSession
+
+
+LEVELS = ("db", "http", "ui")
+POLL_INTERVAL = 0.1
+_MONEY = re.compile(r"-?[\d,]*\.?\d+")
+
+
+def parse_money(text) -> Optional[Decimal]:
+    """'$1,234.50' -> Decimal('1234.50'); None when there is no amount."""
+    match = _MONEY.search(str(text or ""))
+    return Decimal(match.group().replace(",", "")).quantize(Decimal("0.01")) if match else None
+
+
+def _money(value, rate: Decimal) -> Decimal:
+    """A stored amount converted at the order's currency rate and rounded to cents."""
+    return (Decimal(str(value)) * rate).quantize(Decimal("0.01"))
+
+
+@dataclass(frozen=True, slots=True)
+class OrderProduct:
+    """One ordered product, with prices as the store displays them (tax included)."""
+    name: str
+    model: str
+    quantity: int
+    price: Optional[Decimal]
+    total: Optional[Decimal]
+
+
+@dataclass(frozen=True, slots=True)
+class OrderRecord:
+    """An order as the store recorded it: id, status, grand total, product lines and the totals block."""
+    order_id: int
+    status: str
+    total: Optional[Decimal]
+    products: tuple = ()
+    totals: Mapping[str, Optional[Decimal]] = field(default_factory=dict)
+
+    def __contains__(self, product_name: str) -> bool:
+        return any(p.name == product_name for p in self.products)
+
+    def product(self, name: str) -> Optional[OrderProduct]:
+        """Returns the line for a product, or None when it is not in the order."""
+        return next((p for p in self.products if p.name == name), None)
+
+
+# ---------------------------
+# Readers (one per level)
+# ---------------------------
+
+class _DbOrders:
+    """Reads oc_order / oc_order_product / oc_order_total through the worker's pooled connection."""
+
+    def __init__(self, email: str, db=None):
+        self.email = email
+        self.db = db or get_db()
+
+    def latest_id(self) -> int:
+        rows = self.db.query(
+            "SELECT MAX(order_id) AS order_id FROM `{prefix}order` WHERE email = %s AND order_status_id > 0",
+            (self.email,),
+        )
+        return int(rows[0]["order_id"] or 0) if rows else 0
+
+    def order(self, order_id: int) -> Optional[OrderRecord]:
+        rows = self.db.query(
+            "SELECT o.order_id, o.total, o.currency_value, os.name AS status FROM `{prefix}order` o "
+            "LEFT JOIN {prefix}order_status os "
+            "ON os.order_status_id = o.order_status_id AND os.language_id = o.language_id "
+            "WHERE o.order_id = %s AND o.email = %s AND o.order_status_id > 0",
+            (order_id, self.email),
+        )
+        if not rows:
+            return None
+        order = rows[0]
+        rate = Decimal(str(order["currency_value"] or 1))
+
+        products = tuple(
+            OrderProduct(
+                name=row["name"],
+                model=row["model"],
+                quantity=int(row["quantity"]),
+                price=_money(Decimal(str(row["price"])) + Decimal(str(row["tax"])), rate),
+                total=_money(Decimal(str(row["total"])) + Decimal(str(row["tax"])) * int(row["quantity"]), rate),
+            )
+            for row in self.db.query(
+                "SELECT name, model, quantity, price, total, tax FROM {prefix}order_product "
+                "WHERE order_id = %s ORDER BY order_product_id",
+                (order_id,),
+            )
+        )
+        totals = {
+            row["title"]: _money(row["value"], rate)
+            for row in self.db.query(
+                "SELECT title, value FROM {prefix}order_total WHERE order_id = %s ORDER BY sort_order",
+                (order_id,),
+            )
+        }
+        return OrderRecord(
+            int(order["order_id"]), order["status"] or "", _money(order["total"], rate), products, totals
+        )
+
+
+class _PageOrders(ABC):
+    """Reads the account order list and order info pages; subclasses say how a page is fetched."""
+
+    @abstractmethod
+    def fetch(self, route: str, **params) -> str:
+        """Markup of the store page for `route` with the given query parameters."""
+
+    def latest_id(self) -> int:
+        rows = parse_order_list(self.fetch("account/order"))
+        return max(rows, default=0)
+
+    def order(self, order_id: int) -> Optional[OrderRecord]:
+        row = parse_order_list(self.fetch("account/order")).get(order_id)
+        if row is None:
+            return None
+        products, totals = parse_order_info(self.fetch("account/order.info", order_id=order_id))
+        return OrderRecord(order_id, row["status"], row["total"], products, totals)
+
+
+class _HttpOrders(_PageOrders):
+    """Fetches the account pages with requests on the browser's session cookie."""
+
+    def __init__(self, driver):
+        self.session = StoreSession(driver)
+        self._token = None
+
+    def fetch(self, route: str, **params) -> str:
+        if self._token is None:
+            # The account area needs the customer_token; the store adds it when redirecting a logged-in customer.
+            landed = self.session.get("account/login").url
+            self._token = (parse_qs(urlparse(landed).query).get("customer_token") or [""])[0]
+        return self.session.get(route, params={**params, "customer_token": self._token}).text
+
+
+class _UiOrders(_PageOrders):
+    """Opens the account pages in the browser (order history link from the dashboard) and reads them."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.navigation = NavigationPage(driver)
+
+    def fetch(self, route: str, **params) -> str:
+        if route == "account/order":
+            self.navigation.open_account_dashboard()
+            self.navigation.open_order_history()
+        else:
+            link = lxml_html.document_fromstring(self.driver.page_source, base_url=self.driver.current_url)
+            hrefs = [a.get("href") for a in link.iter("a") if "route=account/order.info" in (a.get("href") or "")]
+            order_id = str(params["order_id"])
+            wanted = next((h for h in hrefs if parse_qs(urlparse(h).query).get("order_id") == [order_id]), None)
+            if wanted is None:
+                raise AssertionError(f"Order #{order_id} has no link in the order history (ui).")
+            self.driver.get(wanted.replace("&amp;", "&"))
+        return self.driver.page_source
+
+
+# ---------------------------
+# Page parsing
+# ---------------------------
+
+def _content_tables(markup: str):
+    doc = lxml_html.document_fromstring(markup)
+    return doc.cssselect("#content table") or doc.cssselect("table")
+
+
+def _cells(row) -> list:
+    return [" ".join(cell.text_content().split()) for cell in row.xpath("./td|./th")]
+
+
+def _header(table) -> list:
+    rows = table.xpath(".//thead/tr") or table.xpath(".//tr")
+    return [h.lower() for h in _cells(rows[0])] if rows else []
+
+
+def parse_order_list(markup: str) -> dict:
+    """{order_id: {"status", "total"}} from the account/order page."""
+    for table in _content_tables(markup):
+        header = _header(table)
+        if "order id" not in header:
+            continue
+        column = {name: header.index(name) for name in ("order id", "status", "total") if name in header}
+        orders = {}
+        for row in table.xpath(".//tbody/tr"):
+            cells = _cells(row)
+            if len(cells) <= column["order id"]:
+                continue
+            order_id = int(cells[column["order id"]].lstrip("#") or 0)
+            orders[order_id] = {
+                "status": cells[column["status"]] if "status" in column else "",
+                "total": parse_money(cells[column["total"]]) if "total" in column else None,
+            }
+        return orders
+    return {}
+
+
+def parse_order_info(markup: str):
+    """(products, totals) from the account/order.info page."""
+    for table in _content_tables(markup):
+        header = _header(table)
+        if "product name" not in header:
+            continue
+        name, model, quantity, price, total = (
+            header.index(label) for label in ("product name", "model", "quantity", "price", "total")
+        )
+        products = []
+        for row in table.xpath(".//tbody/tr"):
+            tds = row.xpath("./td")
+            if len(tds) <= total:
+                continue
+            cells = _cells(row)
+            products.append(OrderProduct(
+                name=" ".join((tds[name].text or cells[name]).split()),  # options follow after a <br>
+                model=cells[model],
+                quantity=int(cells[quantity] or 0),
+                price=parse_money(cells[price]),
+                total=parse_money(cells[total]),
+            ))
+        totals = {}
+        for row in table.xpath(".//tfoot/tr"):
+            cells = [c for c in _cells(row) if c]
+            if len(cells) >= 2:
+                totals[cells[-2].rstrip(":")] = parse_money(cells[-1])
+        return tuple(products), totals
+    return (), {}
+
+
+# ---------------------------
+# Verifier
+# ---------------------------
+
+class OrderVerifier:
+    """Confirms a customer's orders without clicking through order history.
+
+    `db` reads the order tables directly (milliseconds), `http` fetches the account order pages
+    with the browser's session cookie, and `ui` opens them in the browser. All three return the
+    same OrderRecord, so a test can switch levels without changing its assertions."""
+
+    def __init__(self, driver, email: str, level: str = "db", db=None):
+        if level not in LEVELS:
+            raise ValueError(f"Unknown order verification level: {level} (expected one of {', '.join(LEVELS)})")
+        self.driver = driver
+        self.level = level
+        if level == "db":
+            self._reader = _DbOrders(email, db)
+        elif level == "http":
+            self._reader = _HttpOrders(driver)
+        else:
+            self._reader = _UiOrders(driver)
+
+    @timed_step("OrderVerifier.last_order_id")
+    def last_order_id(self) -> int:
+        """Id of the customer's newest confirmed order (0 when there is none)."""
+        return self._reader.latest_id()
+
+    @timed_step("OrderVerifier.order")
+    def order(self, order_id: int) -> OrderRecord:
+        """The order with this id; fails when the customer has no such order."""
+        record = self._reader.order(order_id)
+        if record is None:
+            raise AssertionError(f"Order #{order_id} not found ({self.level}).")
+        return record
+
+    @timed_step("OrderVerifier.wait_for_new_order")
+    def wait_for_new_order(self, after_id: int, timeout: float = 10) -> OrderRecord:
+        """The first order newer than `after_id` (take it with last_order_id() before checkout)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            latest = self._reader.latest_id()
+            if latest > after_id:
+                return self.order(latest)
+            if time.monotonic() >= deadline:
+                raise AssertionError(f"No order newer than #{after_id} appeared within {timeout}s ({self.level}).")
+            time.sleep(POLL_INTERVAL)
@@ -0,0 +1,124 @@
+import re
+import threading
+from urllib.parse import parse_qs, urlparse
+from utils.command_hooks import register_read_only_script
+
+
+BASE_URL = "http://localhost/opencart/upload/index.php"
+LISTING_LIMIT = 100
+
+# Top-level menu entries with their dropdown children, read in one script call.
+MENU_JS = register_read_only_script("""
+return Array.prototype.map.call(document.querySelectorAll('#menu .navbar-nav > li'), function (li) {
+    var top = li.querySelector('a'), all = li.querySelector('a.see-all');
+    return {
+        name: (top.textContent || '').trim(),
+        href: (all || top).href,
+        children: Array.prototype.map.call(li.querySelectorAll('.dropdown-inner a'), function (a) {
+            return {name: (a.textContent || '').trim(), href: a.href};
+        })
+    };
+});
+""")
+
+PRODUCT_LINKS_JS = register_read_only_script("""
+return Array.prototype.map.call(document.querySelectorAll('.product-thumb h4 a'), function (a) {
+    return {name: (a.textContent || '').trim(), href: a.href};
+});
+""")
+
+_COUNT_SUFFIX = re.compile(r"\s*\(\d+\)$")
+
+
+def _clean(name: str) -> str:
+    """Menu label without the product count OpenCart may append ("Mac (1)" -> "Mac")."""
+    return _COUNT_SUFFIX.sub("", " ".join(name.split()))
+
+
+def _query_value(href: str, key: str):
+    values = parse_qs(urlparse(href).query).get(key)
+    return values[0] if values else None
+
+
+class RouteMap:
+    """Category and product URLs of the store, learnt from the live menu once per process.
+
+    Categories are keyed by their menu path ("Desktops/Mac") and, when unambiguous, by their own
+    label ("Mac"). Products are learnt from whatever listing page the browser is on, and the
+    category listings are crawled only for a product that has not been seen yet."""
+
+    def __init__(self, base_url: str = BASE_URL):
+        self.base_url = base_url
+        self.categories = {}
+        self.products = {}
+        self._crawled = set()
+        self._lock = threading.Lock()
+
+    # ---------------------------
+    # Lookups
+    # ---------------------------
+
+    def category_url(self, driver, path: str) -> str:
+        """URL of a category by menu path or label; crawls the menu on first use."""
+        with self._lock:
+            if not self.categories:
+                if not driver.current_url.startswith(self.base_url):
+                    driver.get(self.base_url)
+                self.learn_menu(driver.execute_script(MENU_JS))
+        try:
+            return self.categories[path]
+        except KeyError:
+            raise AssertionError(f"Category not found in the store menu: {path}") from None
+
+    def product_url(self, driver, name: str) -> str:
+        """Direct product page URL (route=product/product&product_id=...) for a product name."""
+        with self._lock:
+            if name not in self.products:
+                self.learn_products(driver.execute_script(PRODUCT_LINKS_JS))
+            if name not in self.products:
+                self._crawl_until_found(driver, name)
+        if name not in self.products:
+            raise AssertionError(f"Product not listed in any category: {name}")
+        return f"{self.base_url}?route=product/product&language=en-gb&product_id={self.products[name]}"
+
+    # ---------------------------
+    # Learning
+    # ---------------------------
+
+    def learn_menu(self, menu: list) -> None:
+        """Adds the categories from MENU_JS output."""
+        labels = {}
+        for entry in menu:
+            top = _clean(entry["name"])
+            if _query_value(entry["href"], "path"):
+                self.categories[top] = entry["href"]
+            for child in entry["children"]:
+                label = _clean(child["name"])
+                self.categories[f"{top}/{label}"] = child["href"]
+                labels.setdefault(label, []).append(child["href"])
+        for label, hrefs in labels.items():
+            if len(hrefs) == 1:
+                self.categories.setdefault(label, hrefs[0])
+
+    def learn_products(self, links: list) -> None:
+        """Adds product ids from PRODUCT_LINKS_JS output."""
+        for link in links:
+            product_id = _query_value(link["href"], "product_id")
+            if link["name"] and product_id:
+                self.products.setdefault(link["name"], product_id)
+
+    def _crawl_until_found(self, driver, name: str) -> None:
+        if not self.categories:
+            driver.get(self.base_url)
+            self.learn_menu(driver.execute_script(MENU_JS))
+        for href in dict.fromkeys(self.categories.values()):
+            if href in self._crawled:
+                continue
+            self._crawled.add(href)
+            driver.get(f"{href}&limit={LISTING_LIMIT}")
+            self.learn_products(driver.execute_script(PRODUCT_LINKS_JS))
+            if name in self.products:
+                return
+
+
+route_map = RouteMap()
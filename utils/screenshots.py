@@ -0,0 +1,159 @@
+import base64
+import hashlib
+import io
+import os
+import threading
+import time
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, wait
+from selenium.common.exceptions import WebDriverException
+from utils.logger import get_logger
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: without it screenshots stay full-size PNG.
+    Image = None
+
+
+FORMATS = {
+    "png": ("png", "image/png"),
+    "jpeg": ("jpg", "image/jpeg"),
+    "webp": ("webp", "image/webp"),
+}
+
+
+class ScreenshotWriter:
+    """Content-addressed screenshot store: captures on the test thread, writes on a background pool.
+
+    Files are named by the hash of the image, so identical screens (e.g. repeated soft-assert
+    failures on one page) are stored once and referenced by the same path. Only the WebDriver
+    call stays in the test's critical path; the number of pending writes is bounded and
+    capture() blocks when the queue is full."""
+
+    def __init__(self, directory: str, max_workers: int = 2, max_pending: int = 16):
+        self.directory = directory
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot-writer")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._stored = set()   # written successfully
+        self._writing = set()  # queued or being written
+        self.image_format = "png"
+        self.quality = 80
+        self.max_width = None
+        self.latency_by_test = {}
+        self.duplicates = 0
+        self.write_errors = 0
+        self.logger = get_logger()
+
+    def configure(self, image_format: str = "png", quality: int = 80, max_width=None) -> None:
+        """Sets the output format (png/jpeg/webp), lossy quality, and optional downscale width."""
+        if (image_format != "png" or max_width) and Image is None:
+            self.logger.warning("Screenshots: Pillow is not installed, keeping full-size PNG.")
+            image_format, max_width = "png", None
+        self.image_format = image_format
+        self.quality = quality
+        self.max_width = max_width
+
+    @property
+    def mime_type(self) -> str:
+        return FORMATS[self.image_format][1]
+
+    # ---------------------------
+    # Capture / write
+    # ---------------------------
+
+    def capture(self, driver, nodeid: str = ""):
+        """Grabs the screenshot now and queues the write. Returns the report-relative path (by hash),
+        or None when the driver has no screen (HttpDriver)."""
+        start = time.perf_counter()
+        try:
+            data = driver.get_screenshot_as_base64()
+        except WebDriverException:
+            return None
+        digest = hashlib.sha256(data.encode("ascii")).hexdigest()[:20]
+        filename = f"{digest}.{FORMATS[self.image_format][0]}"
+
+        with self._lock:
+            duplicate = filename in self._stored or filename in self._writing
+            if not duplicate:
+                self._writing.add(filename)
+        if duplicate:
+            self.duplicates += 1
+        else:
+            self._submit(filename, data)
+
+        entry = self.latency_by_test.setdefault(nodeid, [0, 0.0])
+        entry[0] += 1
+        entry[1] += time.perf_counter() - start
+        return f"screenshots/{filename}"
+
+    def _submit(self, filename: str, data: str) -> None:
+        """Queues one write, blocking while the queue is full."""
+        self._slots.acquire()
+        future = self._executor.submit(self._write, os.path.join(self.directory, filename), data)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(partial(self._on_done, filename))
+
+    def _write(self, path: str, data: str) -> None:
+        """Decodes, optionally downscales/converts, and writes one image (runs on a worker thread)."""
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        png = base64.b64decode(data)
+
+        if self.image_format == "png" and not self.max_width:
+            with open(tmp_path, "wb") as f:
+                f.write(png)
+        else:
+            image = Image.open(io.BytesIO(png))
+            if self.max_width and image.width > self.max_width:
+                height = round(image.height * self.max_width / image.width)
+                image = image.resize((self.max_width, height), Image.LANCZOS)
+            if self.image_format == "jpeg":
+                image = image.convert("RGB")
+            image.save(tmp_path, format=self.image_format.upper(), quality=self.quality, optimize=True)
+
+        # Other xdist workers may store the same hash; the rename keeps the file whole either way.
+        os.replace(tmp_path, path)
+
+    def _on_done(self, filename: str, future) -> None:
+        """Frees the queue slot and records the file; a failed write is forgotten so the next identical
+        capture writes it again instead of pointing the report at a missing file."""
+        with self._lock:
+            self._pending.discard(future)
+            self._writing.discard(filename)
+            if future.exception() is None:
+                self._stored.add(filename)
+        self._slots.release()
+        if future.exception() is not None:
+            self.write_errors += 1
+            self.logger.error(f"Screenshot write failed: {future.exception()}")
+
+    # ---------------------------
+    # Session end
+    # ---------------------------
+
+    def flush(self) -> None:
+        """Blocks until every queued screenshot is on disk."""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+
+    def capture_seconds(self, nodeid: str) -> float:
+        """Total time a test spent capturing screenshots."""
+        return self.latency_by_test.get(nodeid, [0, 0.0])[1]
+
+    def stats(self) -> dict:
+        """Returns capture counters for the session summary."""
+        return {
+            "captures": sum(count for count, _ in self.latency_by_test.values()),
+            "duplicates": self.duplicates,
+            "capture_seconds": sum(seconds for _, seconds in self.latency_by_test.values()),
+            "write_errors": self.write_errors,
+        }
+
+
+screenshot_writer = ScreenshotWriter(os.path.join("reports", "screenshots"))
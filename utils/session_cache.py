@@ -0,0 +1,60 @@
+from urllib.parse import parse_qs, urlparse
+from selenium.common.exceptions import WebDriverException
+from utils.logger import get_logger
+from utils.store_session import add_browser_cookies
+
+
+class AuthSessionCache:
+    """Remembers one logged-in OpenCart session per account so later tests can skip the login form."""
+
+    BASE_URL = "http://localhost/opencart/upload/index.php"
+    ACCOUNT_ROUTE = "route=account/account"
+
+    COOKIE_KEYS = ("name", "value", "path", "secure", "httpOnly", "sameSite")
+
+    def __init__(self):
+        self._sessions = {}
+        self.logger = get_logger()
+
+    # ---------------------------
+    # Store / restore
+    # ---------------------------
+
+    def store(self, driver, email: str) -> None:
+        """Saves the session cookies and customer_token of a browser that just logged in."""
+        query = parse_qs(urlparse(driver.current_url).query)
+        cookies = [
+            {key: cookie[key] for key in self.COOKIE_KEYS if key in cookie}
+            for cookie in driver.get_cookies()
+        ]
+        self._sessions[email.lower()] = {
+            "cookies": cookies,
+            "customer_token": (query.get("customer_token") or [""])[0],
+        }
+
+    def restore(self, driver, email: str) -> bool:
+        """Injects the cached session into the browser and probes the account page. False on a miss."""
+        session = self._sessions.get(email.lower())
+        if not session:
+            return False
+
+        try:
+            add_browser_cookies(driver, session["cookies"], self.BASE_URL)
+            driver.get(self.account_url(session["customer_token"]))
+            if self.ACCOUNT_ROUTE in driver.current_url:
+                return True
+        except WebDriverException as e:
+            self.logger.warning(f"Session cache: restore failed for {email}: {e.msg}")
+
+        self.logger.info(f"Session cache: cached session for {email} expired, falling back to UI login.")
+        self.invalidate(email)
+        return False
+
+    def invalidate(self, email: str) -> None:
+        """Drops the cached session for an account (e.g. after a logout test)."""
+        self._sessions.pop(email.lower(), None)
+
+    def account_url(self, customer_token: str = "") -> str:
+        """Builds the account dashboard URL used as the cheap session probe."""
+        url = f"{self.BASE_URL}?{self.ACCOUNT_ROUTE}&language=en-gb"
+        return f"{url}&customer_token={customer_token}" if customer_token else url
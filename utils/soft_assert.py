@@ -1,8 +1,7 @@
 import os
-import uuid
-from datetime import datetime
 from pytest_html import extras
 from utils.logger import get_logger
+from utils.screenshots import screenshot_writer
 import sys
 
 class SoftAssert:
@@ -12,7 +11,7 @@ class SoftAssert:
         self.driver = driver
         self.request = request
         self.logger = get_logger()
-        self.screenshot_dir = os.path.join("reports", "screenshots")
+        self.screenshot_dir = screenshot_writer.directory
         os.makedirs(self.screenshot_dir, exist_ok=True)
 
     def _capture_screenshot(self, label):
@@ -22,12 +21,12 @@ class SoftAssert:
             return None
         if not hasattr(current_node, "extra"):
             current_node.extra = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{label}_{timestamp}_{uuid.uuid4().hex[:6]}.png"
-        abs_path = os.path.join(self.screenshot_dir, filename)
-        self.driver.save_screenshot(abs_path)
-        relative_path = f"screenshots/{filename}".replace("\\", "/")
-        current_node.extra.append(extras.image(relative_path, mime_type='image/png'))
+        relative_path = screenshot_writer.capture(self.driver, current_node.nodeid)
+        if relative_path and all(e.get("content") != relative_path for e in current_node.extra):
+            current_node.extra.append(
+                extras.image(relative_path, name=label, mime_type=screenshot_writer.mime_type,
+                             extension=relative_path.rsplit(".", 1)[-1])
+            )
         return relative_path
 
     def assert_true(self, condition, message=""):
@@ -94,11 +93,13 @@ class SoftAssert:
         for msg, path in self._infos:
             print(f"{msg}\nScreenshot: {path}")
         if self._errors:
-            error_details = "\n\n".join(msg for msg, _ in self._errors)
+            error_details = "\n\n".join(
+                f"{msg}\nScreenshot: {path}" if path else msg for msg, path in self._errors
+            )
             raise AssertionError("Soft assertion errors occurred:\n" + error_details)
 
     def assert_not_in(self, unexpected, actual, message=""):
         try:
             assert unexpected not in actual, message or f"Did not expect '{unexpected}' in '{actual}'"
         except AssertionError as e:
-            self._errors.append(f"[ASSERT_NOT_IN FAIL] {message or str(e)}")
+            self._errors.append((f"[ASSERT_NOT_IN FAIL] {message or str(e)}", None))
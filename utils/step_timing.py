@@ -0,0 +1,141 @@
+import functools
+import inspect
+import threading
+import time
+from dataclasses import dataclass
+from utils.command_hooks import add_command_listener
+
+
+@dataclass
+class StepFrame:
+    """One page-object call in progress."""
+    name: str
+    start: float
+    commands: int = 0
+    wait_seconds: float = 0.0
+    child_seconds: float = 0.0
+
+
+class StepRecorder:
+    """Times page-object methods: wall time, WebDriver commands sent, and time spent in explicit waits.
+
+    Each test produces a flame-graph trace in folded-stack format ("test;Page.method;... microseconds",
+    self time per stack) and every step is added to a session summary keyed by method name."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._trace = None
+        self.summary = {}
+
+    @property
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    # ---------------------------
+    # Test boundaries
+    # ---------------------------
+
+    def start_test(self, name: str) -> None:
+        self._trace = {}
+        self._stack.clear()
+        self._stack.append(StepFrame(name, time.perf_counter()))
+
+    def finish_test(self) -> list:
+        """Closes the test's root frame and returns its trace as folded-stack lines."""
+        if self._trace is None:
+            return []
+        while self._stack:
+            self._pop()
+        trace, self._trace = self._trace, None
+        return [f"{path} {round(seconds * 1_000_000)}" for path, seconds in trace.items()]
+
+    # ---------------------------
+    # Steps
+    # ---------------------------
+
+    def step(self, name: str, driver=None):
+        """Context manager timing one step (nested steps become child frames)."""
+        return _Step(self, name, driver)
+
+    def current_step(self):
+        """Name of the innermost page-object step running on this thread (None in test code)."""
+        stack = self._stack
+        return stack[-1].name if len(stack) > 1 else None
+
+    def _push(self, name: str, driver) -> None:
+        if driver is not None and "_step_recorder" not in driver.__dict__:
+            driver._step_recorder = self
+            add_command_listener(driver, self._on_command)
+        self._stack.append(StepFrame(name, time.perf_counter()))
+
+    def _pop(self) -> None:
+        stack = self._stack
+        frame = stack.pop()
+        elapsed = time.perf_counter() - frame.start
+
+        if self._trace is not None:
+            path = ";".join([f.name for f in stack] + [frame.name])
+            self._trace[path] = self._trace.get(path, 0.0) + elapsed - frame.child_seconds
+
+        if stack:
+            stack[-1].child_seconds += elapsed
+            # Recursive calls are summarised once, by their outermost frame.
+            if any(f.name == frame.name for f in stack):
+                return
+            entry = self.summary.setdefault(
+                frame.name, {"calls": 0, "seconds": 0.0, "commands": 0, "wait_seconds": 0.0}
+            )
+            entry["calls"] += 1
+            entry["seconds"] += elapsed
+            entry["commands"] += frame.commands
+            entry["wait_seconds"] += frame.wait_seconds
+
+    def _on_command(self, command, params, seconds) -> None:
+        for frame in self._stack:
+            frame.commands += 1
+
+    def add_wait(self, seconds: float) -> None:
+        """Adds time spent in an explicit wait to every open step."""
+        for frame in self._stack:
+            frame.wait_seconds += seconds
+
+
+class _Step:
+    def __init__(self, recorder: StepRecorder, name: str, driver):
+        self.recorder = recorder
+        self.name = name
+        self.driver = driver
+
+    def __enter__(self):
+        self.recorder._push(self.name, self.driver)
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder._pop()
+        return False
+
+
+step_recorder = StepRecorder()
+
+
+def timed_step(name: str):
+    """Decorator recording a page-object method as a step named `name`."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with step_recorder.step(name, getattr(self, "driver", None)):
+                return func(self, *args, **kwargs)
+
+        wrapper.__timed_step__ = True
+        return wrapper
+    return decorate
+
+
+def instrument_public_methods(cls) -> None:
+    """Wraps every public method defined on `cls` with timed_step("Class.method")."""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value) or getattr(value, "__timed_step__", False):
+            continue
+        setattr(cls, attr, timed_step(f"{cls.__name__}.{attr}")(value))
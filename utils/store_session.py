@@ -0,0 +1,90 @@
+from urllib.parse import urlparse
+import requests
+from selenium.common.exceptions import WebDriverException
+
+
+BASE_URL = "http://localhost/opencart/upload/index.php"
+
+
+def add_browser_cookies(driver, cookies, base_url: str = BASE_URL) -> None:
+    """Sets cookies without a page load on Chrome (CDP), otherwise via the store origin."""
+    if hasattr(driver, "execute_cdp_cmd"):
+        for cookie in cookies:
+            params = {"url": base_url, "name": cookie["name"], "value": cookie["value"]}
+            if "path" in cookie:
+                params["path"] = cookie["path"]
+            driver.execute_cdp_cmd("Network.setCookie", params)
+        return
+
+    if not driver.current_url.startswith(base_url.rsplit("/", 1)[0]):
+        driver.get(base_url)
+    for cookie in cookies:
+        driver.add_cookie(cookie)
+
+
+def jar_domain(domain: str) -> str:
+    """The domain http.cookiejar files a host's own cookies under (it appends .local to dotless hosts).
+
+    Copying a cookie under any other domain gives the jar a second OCSESSID once the store sets it."""
+    return domain if "." in domain else f"{domain}.local"
+
+
+class StoreSession:
+    """A requests.Session that shares the browser's OpenCart session (OCSESSID and friends).
+
+    Cookies are copied from the browser before each request and any cookie the store sets in
+    reply is copied back, so HTTP calls and the browser act on the same cart and login."""
+
+    def __init__(self, driver, base_url: str = BASE_URL, timeout: float = 15):
+        self.driver = driver
+        self.base_url = base_url
+        self.timeout = timeout
+        self.http = requests.Session()
+
+    # ---------------------------
+    # Cookie sharing
+    # ---------------------------
+
+    def pull_cookies(self) -> None:
+        """Copies the browser's cookies into the HTTP session."""
+        try:
+            cookies = self.driver.get_cookies()
+        except WebDriverException:
+            return
+        host = urlparse(self.base_url).hostname or ""
+        for cookie in cookies:
+            self.http.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=jar_domain(cookie.get("domain") or host), path=cookie.get("path", "/"),
+            )
+
+    def push_cookies(self, names) -> None:
+        """Copies the named HTTP-session cookies into the browser."""
+        cookies = [
+            {"name": c.name, "value": c.value, "path": c.path or "/"}
+            for c in self.http.cookies if c.name in names
+        ]
+        if cookies:
+            add_browser_cookies(self.driver, cookies, self.base_url)
+
+    # ---------------------------
+    # Requests
+    # ---------------------------
+
+    def url(self, route: str) -> str:
+        return f"{self.base_url}?route={route}&language=en-gb"
+
+    def request(self, method: str, route: str, **kwargs) -> requests.Response:
+        """Sends one request as the browser's session and syncs any new cookies back to the browser."""
+        self.pull_cookies()
+        response = self.http.request(method, self.url(route), timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        set_by_store = {cookie.name for r in (*response.history, response) for cookie in r.cookies}
+        self.push_cookies(set_by_store)
+        return response
+
+    def get(self, route: str, **kwargs) -> requests.Response:
+        return self.request("GET", route, **kwargs)
+
+    def post(self, route: str, **kwargs) -> requests.Response:
+        return self.request("POST", route, **kwargs)
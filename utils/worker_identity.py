@@ -0,0 +1,57 @@
+import os
+from dataclasses import dataclass
+from uuid import uuid4
+from utils.data_seeder import DataSeeder, SeededCustomer, namespaced_email
+from utils.db_utils import reset_login_attempts
+
+
+@dataclass(frozen=True)
+class WorkerIdentity:
+    """Which pytest-xdist worker this process is ("main" when the run is not distributed)."""
+    worker_id: str
+    index: int
+    count: int
+
+    @classmethod
+    def current(cls) -> "WorkerIdentity":
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        index = int(worker_id[2:]) if worker_id.startswith("gw") else 0
+        count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+        return cls(worker_id, index, count)
+
+    @property
+    def namespace(self) -> str:
+        """Prefix for every record this worker creates, so workers never share data."""
+        return self.worker_id
+
+    def email(self, label: str = "user") -> str:
+        """A fresh email in this worker's namespace (removed with the worker's seeded data)."""
+        return namespaced_email(self.namespace, f"{label}-{uuid4().hex[:8]}")
+
+
+class AccountPool:
+    """Accounts owned by one worker: a shared primary account for ordinary logged-in tests,
+    plus disposable accounts leased to tests that lock out or otherwise dirty their account."""
+
+    def __init__(self, seeder: DataSeeder, batch_size: int = 2):
+        self.seeder = seeder
+        self.batch_size = batch_size
+        if not seeder.customers:
+            seeder.seed_customers(batch_size)
+        self._free = list(seeder.customers[1:])
+
+    @property
+    def primary(self) -> SeededCustomer:
+        return self.seeder.customers[0]
+
+    def lease(self) -> SeededCustomer:
+        """Hands out an account no other test is using, seeding a new batch when the pool is empty."""
+        if not self._free:
+            self._free.extend(self.seeder.seed_customers(self.batch_size))
+        return self._free.pop()
+
+    def release(self, customer: SeededCustomer) -> None:
+        """Clears the account's lockout counter and cart, then returns it to the pool."""
+        reset_login_attempts(customer.email)
+        self.seeder.clear_cart(customer)
+        self._free.append(customer)